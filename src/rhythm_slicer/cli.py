@@ -6,7 +6,7 @@ import argparse
 import sys
 import logging
 import threading
-from typing import Iterable, Optional, Tuple
+from typing import Callable, Iterable, Optional, Tuple
 from types import TracebackType
 
 from rhythm_slicer.player_vlc import VlcPlayer
@@ -34,13 +34,24 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _load_tui_runner() -> Callable[..., int]:
+    from rhythm_slicer.tui import run_tui as _run
+
+    return _run
+
+
+def run_tui(path: str, player: VlcPlayer, *, viz_name: Optional[str] = None) -> int:
+    """Run the Textual UI, importing it only when it is actually needed."""
+    return _load_tui_runner()(path, player, viz_name=viz_name)
+
+
 def _run_tui(path: str, player: VlcPlayer, viz_name: Optional[str]) -> int:
     try:
-        from rhythm_slicer.tui import run_tui
+        runner = _load_tui_runner()
     except (ImportError, RuntimeError) as exc:
         print(str(exc), file=sys.stderr)
         return 1
-    return run_tui(path, player, viz_name=viz_name)
+    return runner(path, player, viz_name=viz_name)
 
 
 def main(argv: Optional[Iterable[str]] = None) -> int:
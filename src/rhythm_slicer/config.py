@@ -82,6 +82,11 @@ def get_config_path() -> Path:
     return get_config_dir() / "config.json"
 
 
+def get_metadata_cache_path() -> Path:
+    """Return the persistent track metadata cache path."""
+    return get_config_dir() / "metadata_cache.json"
+
+
 def _ensure_dir(path: Path) -> Path:
     """Create the directory if needed and return the path."""
     path.mkdir(parents=True, exist_ok=True)
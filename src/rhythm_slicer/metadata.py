@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class TrackMeta:
@@ -16,6 +23,118 @@ class TrackMeta:
 _TRACK_META_CACHE: dict[Path, TrackMeta] = {}
 
 
+class MetadataStore:
+    """Persistent LRU of parsed tags keyed by path, mtime and size."""
+
+    def __init__(self, path: Path, *, max_entries: int = 20000) -> None:
+        self.path = path
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[int, int, TrackMeta]] = OrderedDict()
+        self._dirty = False
+        self._lock = threading.Lock()
+        # Held across snapshot, write and replace so overlapping flushes (the
+        # periodic worker thread and the shutdown flush) land in order and never
+        # share the temp file.
+        self._write_lock = threading.Lock()
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def load(self) -> None:
+        """Read entries from disk, ignoring a missing or corrupt file."""
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.exception("Failed to load metadata cache from %s", self.path)
+            return
+        if not isinstance(raw, list):
+            return
+        entries: OrderedDict[str, tuple[int, int, TrackMeta]] = OrderedDict()
+        for item in raw:
+            try:
+                key, mtime_ns, size, artist, title, album = item
+                entries[str(key)] = (
+                    int(mtime_ns),
+                    int(size),
+                    TrackMeta(artist=artist, title=title, album=album),
+                )
+            except (TypeError, ValueError):
+                continue
+        with self._lock:
+            self._entries = entries
+            self._dirty = False
+
+    def get(self, path: Path) -> TrackMeta | None:
+        """Return stored metadata if the file is unchanged since it was parsed."""
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        mtime_ns, size, meta = entry
+        if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+            return None
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return meta
+
+    def put(self, path: Path, meta: TrackMeta) -> None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            self._entries[str(path)] = (stat.st_mtime_ns, stat.st_size, meta)
+            self._entries.move_to_end(str(path))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def flush(self) -> bool:
+        """Write pending entries atomically; return True when a write happened."""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return False
+                data = [
+                    [key, mtime_ns, size, meta.artist, meta.title, meta.album]
+                    for key, (mtime_ns, size, meta) in self._entries.items()
+                ]
+                self._dirty = False
+            temp_path = self.path.with_suffix(".tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path.write_text(json.dumps(data), encoding="utf-8")
+                os.replace(temp_path, self.path)
+            except OSError:
+                logger.exception("Failed to save metadata cache to %s", self.path)
+                with self._lock:
+                    self._dirty = True
+                return False
+            return True
+
+
+_METADATA_STORE: MetadataStore | None = None
+
+
+def set_metadata_store(store: MetadataStore | None) -> None:
+    """Install (or remove) the persistent store consulted by get_track_meta."""
+    global _METADATA_STORE
+    _METADATA_STORE = store
+
+
+def get_metadata_store() -> MetadataStore | None:
+    return _METADATA_STORE
+
+
 def _extract_text(value: object | None) -> str | None:
     if value is None:
         return None
@@ -76,7 +195,12 @@ def get_track_meta(path: Path) -> TrackMeta:
     cached = _TRACK_META_CACHE.get(path)
     if cached is not None:
         return cached
-    meta = read_track_meta(path)
+    store = _METADATA_STORE
+    meta = store.get(path) if store is not None else None
+    if meta is None:
+        meta = read_track_meta(path)
+        if store is not None:
+            store.put(path, meta)
     _TRACK_META_CACHE[path] = meta
     return meta
 
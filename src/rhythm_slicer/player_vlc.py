@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, cast
+from typing import Any, Callable, Optional, cast
 import threading
 
 vlc: Any | None = None
@@ -38,6 +38,7 @@ class VlcPlayer:
         self._current_media: Optional[str] = None
         self._cached_rate = 1.0
         self._end_reached = threading.Event()
+        self._end_reached_callback: Optional[Callable[[], None]] = None
         self._attach_end_reached_event()
 
     def _attach_end_reached_event(self) -> None:
@@ -55,6 +56,9 @@ class VlcPlayer:
     def _handle_end_reached(self, event: object) -> None:
         del event
         self._end_reached.set()
+        callback = self._end_reached_callback
+        if callback is not None:
+            callback()
 
     @property
     def current_media(self) -> Optional[str]:
@@ -68,6 +72,10 @@ class VlcPlayer:
             return True
         return False
 
+    def set_end_reached_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        """Call ``callback`` from VLC's event thread when playback ends."""
+        self._end_reached_callback = callback
+
     def signal_end_reached(self) -> None:
         """Manually flag end reached (for tests)."""
         self._end_reached.set()
@@ -4,29 +4,32 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
 from rhythm_slicer.metadata import format_display_title, get_track_meta
 
-SUPPORTED_EXTENSIONS = {
-    ".mp3",
-    ".flac",
-    ".wav",
-    ".ogg",
-    ".m4a",
-    ".aac",
-    ".opus",
-    ".aiff",
-    ".aif",
-    ".wv",
-    ".ape",
-    ".mp2",
-    ".spx",
-    ".m4b",
-    ".wma",
-    ".amr",
-}
-M3U_EXTENSIONS = {".m3u", ".m3u8"}
+# Entries are stored lowercase; callers compare against ``suffix.lower()``.
+SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(
+    {
+        ".mp3",
+        ".flac",
+        ".wav",
+        ".ogg",
+        ".m4a",
+        ".aac",
+        ".opus",
+        ".aiff",
+        ".aif",
+        ".wv",
+        ".ape",
+        ".mp2",
+        ".spx",
+        ".m4b",
+        ".wma",
+        ".amr",
+    }
+)
+M3U_EXTENSIONS: frozenset[str] = frozenset({".m3u", ".m3u8"})
 
 
 @dataclass(frozen=True)
@@ -112,10 +115,15 @@ def _track_from_path(path: Path) -> Track:
     return Track(path=path, title=title)
 
 
-def load_from_directory(directory: Path) -> Playlist:
+def _iter_directory(directory: Path) -> Iterator[Track]:
     entries = sorted(p for p in directory.iterdir() if p.is_file())
-    tracks = [_track_from_path(path) for path in entries if _is_supported(path)]
-    return Playlist(tracks)
+    for path in entries:
+        if _is_supported(path):
+            yield _track_from_path(path)
+
+
+def load_from_directory(directory: Path) -> Playlist:
+    return Playlist(_iter_directory(directory))
 
 
 def load_from_m3u(m3u_path: Path) -> Playlist:
@@ -132,3 +140,15 @@ def load_from_input(path: Path) -> Playlist:
     if path.is_file() and _is_supported(path):
         return Playlist([_track_from_path(path)])
     return Playlist([])
+
+
+def load_from_input_iter(path: Path) -> Iterator[Track]:
+    """Yield the tracks ``load_from_input`` would load, one at a time."""
+    if path.is_dir():
+        yield from _iter_directory(path)
+    elif path.suffix.lower() in M3U_EXTENSIONS:
+        from rhythm_slicer.playlist_io import iter_m3u_any
+
+        yield from iter_m3u_any(path)
+    elif path.is_file() and _is_supported(path):
+        yield _track_from_path(path)
@@ -39,23 +39,30 @@ class FileBrowserModel:
         entries.append(
             BrowserEntry(name="..", path=parent, is_dir=True, is_parent=True)
         )
+        # (casefolded name, name, path) so the sort compares plain tuples.
+        dirs: list[tuple[str, str, str]] = []
+        files: list[tuple[str, str, str]] = []
         try:
-            children = list(self._current.iterdir())
+            # DirEntry answers is_dir/is_file from the directory listing, so
+            # only symlinks cost an extra stat.
+            with os.scandir(self._current) as scanner:
+                for child in scanner:
+                    name = child.name
+                    if child.is_dir():
+                        dirs.append((name.casefold(), name, child.path))
+                    elif child.is_file():
+                        files.append((name.casefold(), name, child.path))
         except OSError:
             return entries
-        dirs = sorted(
-            (path for path in children if path.is_dir()),
-            key=lambda path: path.name.casefold(),
-        )
-        files = sorted(
-            (path for path in children if path.is_file()),
-            key=lambda path: path.name.casefold(),
-        )
+        dirs.sort()
+        files.sort()
         entries.extend(
-            BrowserEntry(name=path.name, path=path, is_dir=True) for path in dirs
+            BrowserEntry(name=name, path=Path(path), is_dir=True)
+            for _, name, path in dirs
         )
         entries.extend(
-            BrowserEntry(name=path.name, path=path, is_dir=False) for path in files
+            BrowserEntry(name=name, path=Path(path), is_dir=False)
+            for _, name, path in files
         )
         return entries
 
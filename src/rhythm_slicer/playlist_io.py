@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from typing import Literal
+from typing import Iterator, Literal
 
 from rhythm_slicer.metadata import format_display_title, get_track_meta
 from rhythm_slicer.playlist import Playlist, Track, SUPPORTED_EXTENSIONS
@@ -40,12 +40,16 @@ def save_m3u8(
 
 def load_m3u_any(path: Path) -> Playlist:
     """Load an M3U/M3U8 playlist, skipping missing or unsupported files."""
-    tracks: list[Track] = []
+    return Playlist(iter_m3u_any(path))
+
+
+def iter_m3u_any(path: Path) -> Iterator[Track]:
+    """Yield tracks from an M3U/M3U8 playlist as each entry is resolved."""
     base = path.parent
     try:
         lines = path.read_text(encoding="utf-8").splitlines()
     except FileNotFoundError:
-        return Playlist([])
+        return
     for line in lines:
         entry = line.strip()
         if not entry or entry.startswith("#"):
@@ -59,5 +63,4 @@ def load_m3u_any(path: Path) -> Playlist:
             continue
         meta = get_track_meta(item)
         title = format_display_title(item, meta)
-        tracks.append(Track(path=item, title=title))
-    return Playlist(tracks)
+        yield Track(path=item, title=title)
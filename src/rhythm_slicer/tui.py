@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from array import array
 import importlib
+import os
 import pkgutil
 import asyncio
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from itertools import islice
 import random
 from pathlib import Path
 import time
-from typing import Any, Callable, Iterator, Optional
+from typing import Any, Callable, Iterator, Optional, Sequence
 import logging
 
 try:
@@ -17,6 +22,7 @@ try:
     from textual.containers import Container, Horizontal, Vertical
     from textual import events
     from textual.geometry import Region
+    from textual.message import Message
     from textual.screen import ModalScreen
     from textual.widgets import Button, DataTable, Header, Input, Static
     from rich.text import Text
@@ -25,26 +31,21 @@ except Exception as exc:  # pragma: no cover - depends on environment
         "Textual is required for the TUI. Install the 'textual' dependency."
     ) from exc
 
-from rhythm_slicer.config import AppConfig, load_config, save_config
+from rhythm_slicer.config import (
+    AppConfig,
+    get_metadata_cache_path,
+    load_config,
+    save_config,
+)
 from rhythm_slicer.hackscript import HackFrame, generate as generate_hackscript
 from rhythm_slicer.hangwatch import HangWatchdog, dump_threads
 from rhythm_slicer.logging_setup import set_console_level
 from rhythm_slicer.ui.frame_player import FramePlayer
-from rhythm_slicer.ui.help_modal import HelpModal
 from rhythm_slicer.ui.bindings import normalize_bindings
+from rhythm_slicer.ui.bounded_cache import BoundedCache
 from rhythm_slicer.ui.playlist_table_manager import PlaylistTableManager
 from rhythm_slicer.ui.play_order import build_play_order
-from rhythm_slicer.ui.playlist_file_picker import (
-    PlaylistFilePicker,
-    pick_start_directory,
-)
 from rhythm_slicer.ui.playlist_io import _load_recursive_directory
-from rhythm_slicer.ui.playlist_builder import PlaylistBuilderScreen
-from rhythm_slicer.ui.playlist_save_picker import (
-    PlaylistSavePicker,
-    SaveResult,
-    save_mode_from_flag,
-)
 from rhythm_slicer.ui.prompt_codec import (
     _format_open_prompt_result,
     _parse_open_prompt_result,
@@ -57,7 +58,7 @@ from rhythm_slicer.ui.status_panel import (
 )
 from rhythm_slicer.ui.textual_compat import Panel
 from rhythm_slicer.ui.tui_formatters import (
-    ellipsize,
+    ellipsize_cached,
     format_status_time,
     playback_state_label,
     ratio_from_click,
@@ -71,6 +72,7 @@ from rhythm_slicer.ui.widget_helpers import bar_widget_width
 from rhythm_slicer.ui.text_helpers import _truncate_line
 from rhythm_slicer.ui.visualizer_rendering import (
     center_visualizer_message,
+    clear_ansi_line_cache,
     clip_frame_text,
     render_ansi_frame,
     render_visualizer_hud,
@@ -84,22 +86,50 @@ from rhythm_slicer.ui.tui_widgets import (
     PlaylistTable,
     TransportControls,
     VisualizerHud,
+    VisualizerView,
 )
 from rhythm_slicer.visualizations.ansi import sanitize_ansi_sgr
 from rhythm_slicer.metadata import (
+    MetadataStore,
     TrackMeta,
     get_cached_track_meta,
+    get_metadata_store,
     get_track_meta,
+    set_metadata_store,
 )
 from rhythm_slicer.player_vlc import VlcPlayer
 from rhythm_slicer.playlist import (
     Playlist,
     Track,
     load_from_input,
+    load_from_input_iter,
 )
 
 logger = logging.getLogger(__name__)
 
+# Visualizer modes that show frames, and modes whose screen changes over time.
+_ACTIVE_VISUALIZER_MODES = frozenset({"PLAYING", "PAUSED"})
+_ANIMATED_VISUALIZER_MODES = frozenset({"PLAYING", "LOADING"})
+
+
+def _optional_method(obj: object, name: str) -> Optional[Callable[..., Any]]:
+    method = getattr(obj, name, None)
+    return method if callable(method) else None
+
+
+def _is_displayed(widget: object) -> bool:
+    """Return False once a widget has been laid out with no visible area."""
+    region = getattr(widget, "region", None)
+    return region is None or bool(region)
+
+
+def _take_tracks(tracks: Iterator[Track], count: int) -> list[Track]:
+    return list(islice(tracks, count))
+
+
+def _render_raw_ansi_frame(text: str, width: int, height: int) -> Text:
+    return render_ansi_frame(sanitize_ansi_sgr(text), width, height)
+
 
 # UI components
 class StatusBar(Static):
@@ -115,6 +145,10 @@ class StatusBar(Static):
         return self._controller.render_line(width, focused=focused)
 
 
+class TrackEndReached(Message):
+    """Posted from the player's event thread when the current track ends."""
+
+
 # Main application
 class RhythmSlicerApp(App):
     """RhythmSlicer Pro Textual application."""
@@ -128,6 +162,20 @@ class RhythmSlicerApp(App):
     HIDE_VISUALIZER_WIDTH = 60
     VISUALIZER_MAX_FPS = 12.0
     VISUALIZER_LOADING_STEP = 0.35
+    TICK_INTERVAL = 0.1
+    STATUS_REFRESH_INTERVAL = 0.25
+    UI_TICK_INTERVAL = 0.5
+    HEARTBEAT_INTERVAL = 10.0
+    META_STORE_FLUSH_INTERVAL = 5.0
+    PLAYER_STATE_TTL = 0.1
+    FORCE_REDRAW_TICKS = 30
+    REFRESH_BATCH_DELAY = 0.016
+    CONFIG_SAVE_DELAY = 0.5
+    PLAYLIST_LOAD_BATCH = 50
+    PLAYLIST_LOAD_MAX_BATCH = 800
+    META_LOAD_CONCURRENCY = 4
+    PLAYLIST_LINE_CACHE_SIZE = 2048
+    ANSI_FRAME_CACHE_SIZE = 64
 
     # --- Keybindings ---
     BINDINGS = [
@@ -173,7 +221,9 @@ class RhythmSlicerApp(App):
         self.path = path
         self._explicit_path = bool(path)
         self.playlist = playlist
-        self._filename = Path(path).name if path else "RhythmSlicer"
+        self._filename = (
+            os.path.basename(os.path.normpath(path)) if path else "RhythmSlicer"
+        )
         config = load_config()
         self._config = config
         self._volume = config.volume
@@ -187,8 +237,9 @@ class RhythmSlicerApp(App):
         self._shuffle = config.shuffle
         self._viz_name = viz_name or config.viz_name
         self._ansi_colors = config.ansi_colors
-        self._play_order: list[int] = []
+        self._play_order: Sequence[int] = array("i")
         self._play_order_pos = -1
+        self._play_order_index: dict[int, int] = {}
         self._rng = rng or random.Random()
         self._last_playlist_path: Optional[Path] = None
         self._last_open_path: Optional[Path] = (
@@ -200,9 +251,13 @@ class RhythmSlicerApp(App):
         self._visualizer: Optional[Static] = None
         self._visualizer_hud: Optional[Static] = None
         self._playlist_list: Optional[Static] = None
+        self._playlist_list_size_cache: Optional[tuple[int, int]] = None
+        self._last_view_signature: Optional[tuple[int, int, int, int, int]] = None
         self._playlist_table: Optional[PlaylistTable] = None
         self._playlist_counter: Optional[Static] = None
         self._playlist_counter_text: Optional[str] = None
+        self._counter_fmt = "{:04d}/{:04d}"
+        self._counter_fmt_total = 0
         self._playlist_title_column = "title"
         self._playlist_artist_column = "artist"
         self._playlist_table_source: Optional[Playlist] = None
@@ -211,10 +266,14 @@ class RhythmSlicerApp(App):
         self._playlist_artist_max = 0
         self._playing_key: Optional[str] = None
         self._selected_key: Optional[str] = None
-        self._missing_row_keys_logged: set[str] = set()
+        self._missing_row_keys_logged: BoundedCache[str, None] = BoundedCache(256)
+        self._line_cache: BoundedCache[tuple[int, int, str, bool], Text] = BoundedCache(
+            self.PLAYLIST_LINE_CACHE_SIZE
+        )
         self._user_navigating_until = 0.0
         self._track_panel_last_update = 0.0
         self._track_panel_last_signature: Optional[TrackSignature] = None
+        self._hud_fast_key: Optional[int] = None
         self._track_panel_last_track_key: Optional[str] = None
         self._loading = False
         self._play_request_id = 0
@@ -225,9 +284,29 @@ class RhythmSlicerApp(App):
         self._status_speed_bar: Optional[Static] = None
         self._status_speed_text: Optional[Static] = None
         self._status_state_text: Optional[Static] = None
+        self._key_playpause: Optional[Button] = None
+        self._transport_controls: Optional[TransportControls] = None
+        self._last_transport_label: Optional[str] = None
+        self._repeat_button: Optional[Button] = None
+        self._shuffle_button: Optional[Button] = None
+        self._playlist_footer_track: Optional[Static] = None
+        self._last_repeat_label: Optional[str] = None
+        self._last_shuffle_label: Optional[str] = None
+        self._last_footer_text: Optional[str] = None
+        self._cached_player_state: Optional[tuple[float, str]] = None
         self._ui_tick_count = 0
+        self._ui_dirty: set[str] = set()
+        self._end_reached_pushed = False
+        self._pending_refresh: set[str] = set()
+        self._batch_depth = 0
+        self._batch_timer: Optional[object] = None
+        self._config_dirty = False
+        self._config_save_timer: Optional[object] = None
         self._volume_scrub_active = False
         self._speed_scrub_active = False
+        self._hit_regions: Optional[
+            list[tuple[str, Region, Callable[[float], object]]]
+        ] = None
         self._status_panel_cache = StatusPanelCache(
             last_time_text=None,
             last_time_value=None,
@@ -241,6 +320,8 @@ class RhythmSlicerApp(App):
             last_state_text=None,
             last_message_level=None,
         )
+        self._last_status_signature: Optional[tuple[object, ...]] = None
+        self._last_status_bar_widths: Optional[tuple[int, int, int]] = None
         self._frame_player = FramePlayer(self)
         self._current_track_path: Optional[Path] = None
         self._viewport_width = 1
@@ -248,18 +329,47 @@ class RhythmSlicerApp(App):
         self._last_visualizer_text: Optional[str] = None
         self._last_visualizer_key: Optional[object] = None
         self._last_visualizer_update = 0.0
+        self._visualizer_render_pending = False
+        self._visualizer_refresh_force = False
+        self._ansi_render_pending = False
+        self._last_bars_render: Optional[tuple[tuple[int, int, int], str]] = None
         self._viz_prefs: dict[str, object] = {}
+        self._viz_ansi_enabled = False
+        self._visualizer_min_interval = 1.0 / self.VISUALIZER_MAX_FPS
+        self._ansi_frame_cache: BoundedCache[tuple[str, int, int], Text] = BoundedCache(
+            self.ANSI_FRAME_CACHE_SIZE
+        )
         self._viz_restart_timer: Optional[object] = None
         self._visualizer_ready = False
-        self._visualizer_init_attempts = 0
         self._last_ui_tick = self._now()
+        self._last_status_refresh = 0.0
+        self._last_heartbeat = self._last_ui_tick
+        self._last_meta_store_flush = self._last_ui_tick
         self._hang_watchdog: Optional[HangWatchdog] = None
         self._too_small_active = False
         self._suppress_table_events = False
         self._meta_loading: set[Path] = set()
+        self._meta_version: dict[Path, int] = {}
+        self._meta_loaded_paths: set[Path] = set()
+        self._meta_semaphore: Optional[asyncio.Semaphore] = None
+        # Playlist whose remaining tracks are still being streamed in, if any.
+        self._playlist_stream: Optional[Playlist] = None
         self._viz_request_id = 0
         self._playlist_table_manager = PlaylistTableManager(self)
 
+    @property
+    def player(self) -> VlcPlayer:
+        return self._player
+
+    @player.setter
+    def player(self, player: VlcPlayer) -> None:
+        # Optional backend capabilities are resolved once, not on every probe.
+        self._player = player
+        self._player_seek_ms = _optional_method(player, "seek_ms")
+        self._player_get_position_ms = _optional_method(player, "get_position_ms")
+        self._player_set_position_ratio = _optional_method(player, "set_position_ratio")
+        self._player_set_playback_rate = _optional_method(player, "set_playback_rate")
+
     # ===== Layout / sizing helpers =====
     def compose(self) -> ComposeResult:
         yield Header(show_clock=False)
@@ -306,7 +416,7 @@ class RhythmSlicerApp(App):
                             )
                 with Vertical(id="right_column"):
                     with Panel(title="Visualizer", id="visualizer_panel"):
-                        yield Static(id="visualizer")
+                        yield VisualizerView(id="visualizer")
                     with Panel(title="Current Track", id="track_panel"):
                         yield VisualizerHud(id="visualizer_hud")
             with Panel(title="Status", id="status_panel"):
@@ -349,9 +459,6 @@ class RhythmSlicerApp(App):
             return
         self._update_visualizer_viewport()
         if self._viewport_width <= 2 or self._viewport_height <= 1:
-            self._visualizer_init_attempts += 1
-            if self._visualizer_init_attempts < 10:
-                self.set_timer(0.05, self._finalize_visualizer_layout)
             return
         self._update_visualizer_hud()
         if self._current_track_path:
@@ -379,7 +486,7 @@ class RhythmSlicerApp(App):
         self._last_ui_tick = self._now()
 
     def _log_heartbeat(self) -> None:
-        state = self.player.get_state()
+        state = self._get_player_state()
         title = None
         track_index = None
         if self.playlist and not self.playlist.is_empty():
@@ -409,6 +516,7 @@ class RhythmSlicerApp(App):
         self._update_status_panel(force=True)
 
     def _save_config(self) -> None:
+        self._config_dirty = False
         self._config = AppConfig(
             last_open_path=str(self._last_open_path) if self._last_open_path else None,
             open_recursive=self._open_recursive,
@@ -420,6 +528,22 @@ class RhythmSlicerApp(App):
         )
         save_config(self._config)
 
+    def _schedule_save_config(self) -> None:
+        """Coalesce rapid preference changes into a single config write."""
+        self._config_dirty = True
+        if not self.is_running:
+            self._save_config()
+            return
+        if self._config_save_timer is None:
+            self._config_save_timer = self.set_timer(
+                self.CONFIG_SAVE_DELAY, self._flush_config_save
+            )
+
+    def _flush_config_save(self) -> None:
+        self._config_save_timer = None
+        if self._config_dirty:
+            self._save_config()
+
     # ===== Status panel =====
     def _status_state_label(self) -> str:
         return status_state_label(
@@ -430,7 +554,7 @@ class RhythmSlicerApp(App):
 
     def _playback_state_label(self) -> str:
         return playback_state_label(
-            playback_state=self.player.get_state() or "",
+            playback_state=self._get_player_state(),
             loading=self._loading,
         )
 
@@ -474,9 +598,12 @@ class RhythmSlicerApp(App):
             return Text("S:ON", style="#9cff57")
         return Text("S:OFF", style="#8a93a3")
 
+    def _transport_label(self, *, refresh: bool = False) -> str:
+        state = self._get_player_state(refresh=refresh).lower()
+        return "[ PAUSE ]" if "playing" in state else "[ PLAY ] "
+
     def _render_transport_label(self) -> Text:
-        state = (self.player.get_state() or "").lower()
-        return Text("[ PAUSE ]") if "playing" in state else Text("[ PLAY ] ")
+        return Text(self._transport_label(refresh=True))
 
     def _render_header(self) -> str:
         return "<< Rhythm Slicer Pro >>"
@@ -532,7 +659,7 @@ class RhythmSlicerApp(App):
             playing_index=self._playing_index,
             get_meta_cached=self._get_track_meta_cached,
             ensure_meta_loaded=self._ensure_track_meta_loaded,
-            ellipsize_fn=ellipsize,
+            ellipsize_fn=ellipsize_cached,
         )
 
     def _render_playlist_line_text(
@@ -543,33 +670,37 @@ class RhythmSlicerApp(App):
         title: str,
         is_active: bool,
     ) -> Text:
+        key = (width, index, title, is_active)
+        cached = self._line_cache.get(key)
+        if cached is not None:
+            return cached
         prefix = f"{'>>' if is_active else '  '} {index + 1:>3}  "
-        title_space = max(1, width - len(prefix))
-        if len(title) > title_space:
-            title = title[: max(1, title_space - 1)] + "…"
-        else:
-            title = title.ljust(title_space)
         if is_active:
+            # The base style covers the padding added below.
             line = Text(prefix + title, style="bold #5fc9d6 on #0c2024")
         else:
-            line = Text()
-            line.append(prefix[:3])
-            line.append(prefix[3:6], style="#5b6170")
-            line.append(prefix[6:])
-            line.append(title, style="#8a93a3")
+            line = Text.assemble(
+                prefix[:3],
+                (prefix[3:6], "#5b6170"),
+                (prefix[6:] + title, "#8a93a3"),
+            )
+        # Truncate by cell width so wide (CJK/emoji) titles are measured once.
         if line.cell_len > width:
             line.truncate(width, overflow="ellipsis")
         if line.cell_len < width:
-            pad_style = "bold #5fc9d6 on #0c2024" if is_active else "#8a93a3"
-            line.append(" " * (width - line.cell_len), style=pad_style)
+            line.pad_right(width - line.cell_len)
+        self._line_cache.put(key, line)
         return line
 
     def _render_track_counter(self) -> str:
         total_tracks = len(self.playlist.tracks) if self.playlist else 0
-        width = max(4, len(str(total_tracks)))
+        if total_tracks != self._counter_fmt_total:
+            width = max(4, len(str(total_tracks)))
+            self._counter_fmt = f"{{:0{width}d}}/{{:0{width}d}}"
+            self._counter_fmt_total = total_tracks
         playing_index = self._playing_index
         display_index = playing_index + 1 if playing_index is not None else 0
-        return f"{display_index:0{width}d}/{total_tracks:0{width}d}"
+        return self._counter_fmt.format(display_index, total_tracks)
 
     def _render_playlist_footer(self) -> str:
         if not self.playlist or self.playlist.is_empty():
@@ -582,7 +713,12 @@ class RhythmSlicerApp(App):
         return _truncate_line(text, self._playlist_width())
 
     def _render_ansi_frame(self, text: str, width: int, height: int) -> Text:
-        return render_ansi_frame(text, width, height)
+        key = (text, width, height)
+        rendered = self._ansi_frame_cache.get(key)
+        if rendered is None:
+            rendered = _render_raw_ansi_frame(text, width, height)
+            self._ansi_frame_cache.put(key, rendered)
+        return rendered
 
     def _update_status_panel(self, *, force: bool = False) -> None:
         if (
@@ -595,6 +731,31 @@ class RhythmSlicerApp(App):
             or not self._status_state_text
         ):
             return
+        time_info = self._format_status_time()
+        state_label = self._status_state_label()
+        message = self._status_controller._current_message()
+        # Bar strings are sized to their widgets, which can change on pane
+        # toggles that never reach on_resize.
+        bar_widths = (
+            self._bar_widget_width(self._status_time_bar),
+            self._bar_widget_width(self._status_volume_bar),
+            self._bar_widget_width(self._status_speed_bar),
+        )
+        signature = (
+            time_info,
+            state_label,
+            self._volume,
+            self._playback_rate,
+            message,
+            bar_widths,
+        )
+        if not force and signature == self._last_status_signature:
+            return
+        self._last_status_signature = signature
+        if bar_widths != self._last_status_bar_widths:
+            # The panel helper only re-renders bars when their values change.
+            force = True
+            self._last_status_bar_widths = bar_widths
         widgets = StatusPanelWidgets(
             time_bar=self._status_time_bar,
             time_text=self._status_time_text,
@@ -604,34 +765,34 @@ class RhythmSlicerApp(App):
             speed_text=self._status_speed_text,
             state_text=self._status_state_text,
         )
-        update_status_panel(
-            widgets=widgets,
-            cache=self._status_panel_cache,
-            force=force,
-            format_status_time=self._format_status_time,
-            volume=self._volume,
-            playback_rate=self._playback_rate,
-            bar_widget_width=self._bar_widget_width,
-            render_status_bar=self._render_status_bar,
-            status_state_label=self._status_state_label,
-            current_message=self._status_controller._current_message,
-        )
+        with self.batch_update():
+            update_status_panel(
+                widgets=widgets,
+                cache=self._status_panel_cache,
+                force=force,
+                format_status_time=lambda: time_info,
+                volume=self._volume,
+                playback_rate=self._playback_rate,
+                bar_widget_width=self._bar_widget_width,
+                render_status_bar=self._render_status_bar,
+                status_state_label=lambda: state_label,
+                current_message=lambda: message,
+            )
 
     # --- Playlist + transport ---
 
     def _update_transport_row(self) -> None:
-        try:
-            label = self.query_one("#key_playpause", Button)
-        except Exception:
+        if not self._key_playpause:
+            return
+        label = self._transport_label()
+        if label == self._last_transport_label:
             return
-        label.label = self._render_transport_label()
+        self._key_playpause.label = Text(label)
+        self._last_transport_label = label
 
     def _refresh_transport_controls(self) -> None:
-        try:
-            controls = self.query_one(TransportControls)
-        except Exception:
-            return
-        controls.refresh_state()
+        if self._transport_controls:
+            self._transport_controls.refresh_state()
 
     def _handle_transport_action(self, control_id: str) -> None:
         if control_id == "key_prev":
@@ -645,14 +806,108 @@ class RhythmSlicerApp(App):
 
     def _on_tick(self) -> None:
         self._ui_tick_count += 1
-        self._update_screen_title()
-        self._refresh_visualizer()
-        self._update_transport_row()
+        now = self._now()
+        if now - self._last_ui_tick >= self.UI_TICK_INTERVAL:
+            self._update_ui_tick()
+        if now - self._last_status_refresh >= self.STATUS_REFRESH_INTERVAL:
+            self._last_status_refresh = now
+            self._update_status_panel()
+        if now - self._last_heartbeat >= self.HEARTBEAT_INTERVAL:
+            self._last_heartbeat = now
+            self._log_heartbeat()
+        if now - self._last_meta_store_flush >= self.META_STORE_FLUSH_INTERVAL:
+            self._last_meta_store_flush = now
+            self._flush_metadata_store()
+        if not self._end_reached_pushed and self.player.consume_end_reached():
+            self._advance_track(auto=True)
         if self._ui_tick_count == 1:
-            self._update_playlist_view()
+            self._ui_dirty.add("playlist")
+        busy = self._loading or self._playback_state_label() == "PLAYING"
+        safety_tick = self._ui_tick_count % self.FORCE_REDRAW_TICKS == 0
+        if not busy and not self._ui_dirty and not safety_tick:
+            return
+        dirty = self._ui_dirty
+        self._ui_dirty = set()
+        self._update_screen_title()
+        if busy or safety_tick or "visualizer" in dirty:
+            self._refresh_visualizer()
+        if busy or safety_tick or "transport" in dirty:
+            self._update_transport_row()
+        if "playlist" in dirty:
+            self._queue_refresh("playlist")
+
+    def _flush_metadata_store(self) -> None:
+        store = get_metadata_store()
+        if store is None or not store.dirty:
+            return
+        self.run_worker(
+            asyncio.to_thread(store.flush), group="meta_store", exclusive=True
+        )
+
+    def _attach_end_reached_callback(self) -> None:
+        register = getattr(self.player, "set_end_reached_callback", None)
+        if not callable(register):
+            return
+        # post_message is thread-safe and does not block VLC's event thread.
+        register(lambda: self.post_message(TrackEndReached()))
+        self._end_reached_pushed = True
+
+    def on_track_end_reached(self, message: TrackEndReached) -> None:
+        del message
         if self.player.consume_end_reached():
             self._advance_track(auto=True)
 
+    def _mark_ui_dirty(self, *kinds: str) -> None:
+        self._ui_dirty.update(kinds)
+
+    def _queue_refresh(self, *kinds: str) -> None:
+        """Coalesce widget refreshes into a single flush per frame."""
+        self._pending_refresh.update(kinds)
+        if self._batch_depth:
+            return
+        if not self.is_running:
+            self._flush_refreshes()
+            return
+        if self._batch_timer is None:
+            self._batch_timer = self.set_timer(
+                self.REFRESH_BATCH_DELAY, self._flush_refreshes
+            )
+
+    @contextmanager
+    def _batch_updates(self) -> Iterator[None]:
+        """Hold queued refreshes until the outermost block exits, then flush once."""
+        self._batch_depth += 1
+        with self.batch_update():
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._flush_refreshes()
+
+    def _flush_refreshes(self) -> None:
+        self._batch_timer = None
+        pending = self._pending_refresh
+        if not pending:
+            return
+        self._pending_refresh = set()
+        if "meta" in pending:
+            loaded = self._meta_loaded_paths
+            self._meta_loaded_paths = set()
+            self._refresh_playlist_rows_for(loaded)
+        if "playlist" in pending:
+            self._update_playlist_view()
+        if "hud" in pending:
+            self._update_visualizer_hud()
+        if "visualizer" in pending:
+            force = self._visualizer_refresh_force
+            self._visualizer_refresh_force = False
+            self._refresh_visualizer_now(force=force)
+        if "transport" in pending:
+            self._refresh_transport_controls()
+        if "status" in pending:
+            self._update_status_panel()
+
     def _update_screen_title(self) -> None:
         self.title = "Rhythm Slicer Pro"
 
@@ -668,15 +923,22 @@ class RhythmSlicerApp(App):
             return
         self._meta_loading.add(path)
 
+        if self._meta_semaphore is None:
+            # Created lazily so it binds to the running event loop.
+            self._meta_semaphore = asyncio.Semaphore(self.META_LOAD_CONCURRENCY)
+        semaphore = self._meta_semaphore
+
         async def load_meta() -> None:
             try:
-                await asyncio.to_thread(get_track_meta, path)
+                async with semaphore:
+                    await asyncio.to_thread(get_track_meta, path)
             except Exception:
                 logger.exception("Metadata load failed for %s", path)
             finally:
                 self._meta_loading.discard(path)
-            self._update_playlist_view()
-            self._update_visualizer_hud()
+                self._meta_version[path] = self._meta_version.get(path, 0) + 1
+                self._meta_loaded_paths.add(path)
+            self._queue_refresh("meta", "hud")
 
         self.run_worker(load_meta(), exclusive=False)
 
@@ -714,13 +976,31 @@ class RhythmSlicerApp(App):
             height,
         )
 
+    def _hud_fast_signature(self) -> int:
+        path = None
+        if self.playlist and self._playing_index is not None:
+            if 0 <= self._playing_index < len(self.playlist.tracks):
+                path = self.playlist.tracks[self._playing_index].path
+        return hash(
+            (
+                self._playing_index,
+                path,
+                self._meta_version.get(path, 0) if path else 0,
+                self._visualizer_hud_size(),
+            )
+        )
+
     def _update_visualizer_hud(self) -> None:
         if not self._visualizer_hud:
             return
+        fast_key = self._hud_fast_signature()
+        if fast_key == self._hud_fast_key:
+            return
         signature = self._current_track_signature()
         track_key = signature[0]
         now = self._now()
         if signature == self._track_panel_last_signature:
+            self._hud_fast_key = fast_key
             return
         if (
             track_key == self._track_panel_last_track_key
@@ -731,6 +1011,7 @@ class RhythmSlicerApp(App):
         self._track_panel_last_update = now
         self._track_panel_last_signature = signature
         self._track_panel_last_track_key = track_key
+        self._hud_fast_key = fast_key
 
     # ===== Playlist table integration =====
     def _init_playlist_table(self) -> None:
@@ -739,6 +1020,14 @@ class RhythmSlicerApp(App):
     def _refresh_playlist_table_after_layout(self) -> None:
         self._playlist_table_manager._refresh_playlist_table_after_layout()
 
+    def _on_playlist_table_resize(self) -> None:
+        # Both playlist widgets live in the same panel; a table resize is the
+        # earliest sign that the list's size may have changed too.
+        self._invalidate_playlist_list_size()
+        if self._playlist_table_manager._playlist_table_content_width() > 0:
+            self._refresh_playlist_table()
+        self._playlist_table_manager._apply_pending_playing_row()
+
     def _playlist_row_key(self, index: int) -> str:
         return self._playlist_table_manager._playlist_row_key(index)
 
@@ -772,6 +1061,12 @@ class RhythmSlicerApp(App):
     def _refresh_playlist_table(self, *, rebuild: bool = False) -> None:
         self._playlist_table_manager._refresh_playlist_table(rebuild=rebuild)
 
+    def _refresh_playlist_rows_for(self, paths: set[Path]) -> None:
+        self._playlist_table_manager._refresh_rows_for_paths(paths)
+
+    def _load_visible_playlist_metadata(self) -> None:
+        self._playlist_table_manager._load_visible_metadata()
+
     def _update_playing_row_style(self) -> None:
         self._playlist_table_manager._update_playing_row_style()
 
@@ -806,61 +1101,67 @@ class RhythmSlicerApp(App):
     async def _populate_playlist(self) -> None:
         if self.playlist is None:
             return
-        self._update_playlist_view()
+        self._queue_refresh("playlist")
 
     def _sync_selection(self) -> None:
         if not self.playlist or self.playlist.is_empty():
             return
-        self._update_playlist_view()
+        self._queue_refresh("playlist")
 
     async def set_playlist(
         self, playlist: Playlist, *, preserve_path: Optional[Path]
     ) -> None:
         """Replace the current playlist and refresh UI state."""
-        self.playlist = playlist
-        self._scroll_offset = 0
-        if preserve_path and playlist.tracks:
-            for idx, track in enumerate(playlist.tracks):
-                if track.path == preserve_path:
-                    playlist.set_index(idx)
-                    break
-            else:
+        ellipsize_cached.cache_clear()
+        self._line_cache.clear()
+        with self._batch_updates():
+            self.playlist = playlist
+            self._scroll_offset = 0
+            if preserve_path and playlist.tracks:
+                for idx, track in enumerate(playlist.tracks):
+                    if track.path == preserve_path:
+                        playlist.set_index(idx)
+                        break
+                else:
+                    playlist.set_index(0)
+            elif playlist.tracks:
                 playlist.set_index(0)
-        elif playlist.tracks:
-            playlist.set_index(0)
-        self._reset_play_order()
-        await self._populate_playlist()
-        self._sync_selection()
-        self._refresh_transport_controls()
+            self._reset_play_order()
+            await self._populate_playlist()
+            self._sync_selection()
+            self._queue_refresh("transport")
 
     async def set_playlist_from_open(
         self, playlist: Playlist, source_path: Path
     ) -> None:
-        self.playlist = playlist
-        self.playlist.set_index(0)
-        self._filename = source_path.name
-        self._scroll_offset = 0
-        self._reset_play_order()
-        await self._populate_playlist()
-        self._sync_selection()
-        self._last_open_path = source_path
-        self._play_current_track(on_failure="skip")
-        self._refresh_transport_controls()
+        self._line_cache.clear()
+        with self._batch_updates():
+            self.playlist = playlist
+            self.playlist.set_index(0)
+            self._filename = source_path.name
+            self._scroll_offset = 0
+            self._reset_play_order()
+            await self._populate_playlist()
+            self._sync_selection()
+            self._last_open_path = source_path
+            self._play_current_track(on_failure="skip")
+            self._queue_refresh("transport")
 
     def _set_loading(self, active: bool, *, message: str = "Loading...") -> None:
         self._loading = active
+        self._mark_ui_dirty("transport", "visualizer")
         if active:
             self._set_message(message, timeout=0.0)
         self._refresh_visualizer(force=True)
-        self._refresh_transport_controls()
+        self._queue_refresh("transport")
         self._update_status_panel(force=True)
 
     def _load_and_play_blocking(self, track: Track) -> None:
         self.player.load(str(track.path))
         self.player.play()
-        setter = getattr(self.player, "set_playback_rate", None)
-        if callable(setter):
-            setter(self._playback_rate)
+        self._invalidate_player_state()
+        if self._player_set_playback_rate is not None:
+            self._player_set_playback_rate(self._playback_rate)
 
     async def _play_track_worker(
         self,
@@ -869,17 +1170,44 @@ class RhythmSlicerApp(App):
         request_id: int,
         on_failure: str,
     ) -> None:
+        # Read tags while the player loads; a slow tag read must not hold back
+        # the playing state, so the result is applied whenever it lands.
+        meta_task = asyncio.ensure_future(
+            asyncio.to_thread(self._prefetch_track_meta, track.path)
+        )
+        meta_task.add_done_callback(
+            lambda task: self._on_track_meta_prefetched(track.path, task)
+        )
         try:
             await asyncio.to_thread(self._load_and_play_blocking, track)
         except Exception as exc:
             self._handle_playback_error(exc, track, on_failure, request_id)
-        else:
-            self._handle_playback_started(track, request_id)
+            return
+        self._handle_playback_started(track, request_id)
+
+    def _on_track_meta_prefetched(self, path: Path, task: asyncio.Future[bool]) -> None:
+        if task.cancelled() or task.exception() is not None or not task.result():
+            return
+        self._meta_version[path] = self._meta_version.get(path, 0) + 1
+        self._meta_loaded_paths.add(path)
+        self._queue_refresh("meta", "hud")
+
+    def _prefetch_track_meta(self, path: Path) -> bool:
+        """Load metadata for ``path``; return True if it was not cached yet."""
+        if get_cached_track_meta(path) is not None:
+            return False
+        try:
+            get_track_meta(path)
+        except Exception:
+            logger.exception("Metadata load failed for %s", path)
+            return False
+        return True
 
     def _handle_playback_started(self, track: Track, request_id: Optional[int]) -> None:
         if request_id is not None and request_id != self._play_request_id:
             return
         self._loading = False
+        self._invalidate_player_state()
         playlist_index = self.playlist.index if self.playlist else None
         self._playing_index = playlist_index
         logger.info("Track change index=%s path=%s", playlist_index, track.path)
@@ -891,9 +1219,9 @@ class RhythmSlicerApp(App):
             playback_pos_ms=self._get_playback_position_ms(),
             playback_state=self._get_playback_state(),
         )
-        self._update_visualizer_hud()
+        self._queue_refresh("hud")
         self._update_playlist_controls()
-        self._refresh_transport_controls()
+        self._queue_refresh("transport")
         self._update_status_panel(force=True)
 
     def _handle_playback_error(
@@ -906,9 +1234,10 @@ class RhythmSlicerApp(App):
         if request_id is not None and request_id != self._play_request_id:
             return
         self._loading = False
+        self._invalidate_player_state()
         logger.exception("Playback failed for %s", track.path)
         self._set_message(f"Failed to play: {track.title}", level="error")
-        self._refresh_transport_controls()
+        self._queue_refresh("transport")
         if on_failure == "skip":
             self._skip_failed_track()
         self._update_status_panel(force=True)
@@ -941,21 +1270,23 @@ class RhythmSlicerApp(App):
         return True
 
     def _advance_track(self, auto: bool = False) -> None:
-        if not self.playlist or self.playlist.is_empty():
-            return
-        if auto and self._repeat_mode == "one":
+        with self._batch_updates():
+            if not self.playlist or self.playlist.is_empty():
+                return
+            if auto and self._repeat_mode == "one":
+                self._play_current_track(on_failure="skip")
+                return
+            wrap = self._repeat_mode == "all"
+            next_index = self._next_index(wrap=wrap)
+            if next_index is None:
+                if auto and self._repeat_mode == "off":
+                    self.player.stop()
+                    self._invalidate_player_state()
+                    self._stop_hackscript()
+                self._set_message("End of playlist")
+                return
+            self._set_selected(next_index, move_cursor=False, update_selected_key=False)
             self._play_current_track(on_failure="skip")
-            return
-        wrap = self._repeat_mode == "all"
-        next_index = self._next_index(wrap=wrap)
-        if next_index is None:
-            if auto and self._repeat_mode == "off":
-                self.player.stop()
-                self._stop_hackscript()
-            self._set_message("End of playlist")
-            return
-        self._set_selected(next_index, move_cursor=False, update_selected_key=False)
-        self._play_current_track(on_failure="skip")
 
     def _skip_failed_track(self) -> None:
         if not self.playlist or self.playlist.is_empty():
@@ -969,27 +1300,43 @@ class RhythmSlicerApp(App):
                 return
             attempts -= 1
         self.player.stop()
+        self._invalidate_player_state()
         self._stop_hackscript()
 
     def _try_seek(self, delta_ms: int) -> bool:
-        seek = getattr(self.player, "seek_ms", None)
-        if callable(seek):
-            if seek(delta_ms):
-                return True
+        if self._player_seek_ms is not None and self._player_seek_ms(delta_ms):
+            return True
         self._set_message("Seek unsupported", level="warn")
         return False
 
     def _get_playback_position_ms(self) -> int | None:
-        getter = getattr(self.player, "get_position_ms", None)
-        if not callable(getter):
+        getter = self._player_get_position_ms
+        if getter is None:
             return None
         try:
             return getter()
         except Exception:
             return None
 
+    def _get_player_state(self, *, refresh: bool = False) -> str:
+        now = self._now()
+        cached = self._cached_player_state
+        if (
+            not refresh
+            and cached is not None
+            and now - cached[0] < self.PLAYER_STATE_TTL
+        ):
+            return cached[1]
+        state = self.player.get_state() or ""
+        self._cached_player_state = (now, state)
+        return state
+
+    def _invalidate_player_state(self) -> None:
+        self._cached_player_state = None
+        self._mark_ui_dirty("transport", "visualizer")
+
     def _get_playback_state(self) -> str:
-        state = (self.player.get_state() or "").lower()
+        state = self._get_player_state(refresh=True).lower()
         if "paused" in state:
             return "paused"
         return "playing"
@@ -1026,35 +1373,34 @@ class RhythmSlicerApp(App):
         if not length or length <= 0:
             self._set_message("Seek unsupported", level="warn")
             return False
-        set_ratio = getattr(self.player, "set_position_ratio", None)
-        if callable(set_ratio):
-            if set_ratio(ratio):
-                self._schedule_viz_restart()
-                return True
+        set_ratio = self._player_set_position_ratio
+        if set_ratio is not None and set_ratio(ratio):
+            self._schedule_viz_restart()
+            return True
         position = self.player.get_position_ms() or 0
         target = target_ms_from_ratio(length, ratio)
         delta = target - position
-        seek = getattr(self.player, "seek_ms", None)
-        if callable(seek):
-            if seek(delta):
-                self._schedule_viz_restart()
-                return True
+        seek = self._player_seek_ms
+        if seek is not None and seek(delta):
+            self._schedule_viz_restart()
+            return True
         self._set_message("Seek unsupported", level="warn")
         return False
 
     # ===== Transport / playback actions =====
     def action_toggle_playback(self) -> None:
-        state = (self.player.get_state() or "").lower()
+        state = self._get_player_state(refresh=True).lower()
         if "playing" in state:
             self.player.pause()
+            self._invalidate_player_state()
             self._set_message("Paused")
             desired_state = "paused"
             logger.info("Playback paused")
         elif "paused" in state:
             self.player.play()
-            setter = getattr(self.player, "set_playback_rate", None)
-            if callable(setter):
-                setter(self._playback_rate)
+            self._invalidate_player_state()
+            if self._player_set_playback_rate is not None:
+                self._player_set_playback_rate(self._playback_rate)
             self._set_message("Playing")
             desired_state = "playing"
             logger.info("Playback resumed")
@@ -1064,6 +1410,7 @@ class RhythmSlicerApp(App):
                     logger.info("Playback started")
                 return
             self.player.play()
+            self._invalidate_player_state()
             self._set_message("Playing")
             desired_state = "playing"
             logger.info("Playback started")
@@ -1072,23 +1419,25 @@ class RhythmSlicerApp(App):
             playback_pos_ms=pos_ms,
             playback_state=desired_state,
         )
-        self._refresh_transport_controls()
+        self._queue_refresh("transport")
         self._update_status_panel(force=True)
 
     def action_stop(self) -> None:
-        if self._loading:
-            self._play_request_id += 1
-            self._loading = False
-        self.player.stop()
-        self._playing_index = None
-        self._stop_hackscript()
-        self._set_message("Stopped")
-        logger.info("Playback stopped")
-        self._update_visualizer_hud()
-        self._refresh_playlist_table()
-        self._update_playlist_controls()
-        self._refresh_transport_controls()
-        self._update_status_panel(force=True)
+        with self._batch_updates():
+            if self._loading:
+                self._play_request_id += 1
+                self._loading = False
+            self.player.stop()
+            self._invalidate_player_state()
+            self._playing_index = None
+            self._stop_hackscript()
+            self._set_message("Stopped")
+            logger.info("Playback stopped")
+            self._queue_refresh("hud")
+            self._refresh_playlist_table()
+            self._update_playlist_controls()
+            self._queue_refresh("transport")
+            self._update_status_panel(force=True)
 
     def action_seek_back(self) -> None:
         if self._try_seek(-5000):
@@ -1102,14 +1451,14 @@ class RhythmSlicerApp(App):
         self._volume = min(100, self._volume + 5)
         self.player.set_volume(self._volume)
         self._set_message("Volume up")
-        self._save_config()
+        self._schedule_save_config()
         self._update_status_panel(force=True)
 
     def action_volume_down(self) -> None:
         self._volume = max(0, self._volume - 5)
         self.player.set_volume(self._volume)
         self._set_message("Volume down")
-        self._save_config()
+        self._schedule_save_config()
         self._update_status_panel(force=True)
 
     def action_speed_down(self) -> None:
@@ -1124,34 +1473,35 @@ class RhythmSlicerApp(App):
     def action_next_track(self) -> None:
         if not self.playlist or self.playlist.is_empty():
             self._set_message("No tracks loaded")
-            self._refresh_transport_controls()
+            self._queue_refresh("transport")
             return
         next_index = self._next_index(wrap=self._repeat_mode == "all")
         if next_index is None:
             self._set_message("End of playlist")
-            self._refresh_transport_controls()
+            self._queue_refresh("transport")
             return
         self._set_selected(next_index)
         self._play_current_track(on_failure="skip")
-        self._refresh_transport_controls()
+        self._queue_refresh("transport")
 
     def action_previous_track(self) -> None:
         if not self.playlist or self.playlist.is_empty():
             self._set_message("No tracks loaded")
-            self._refresh_transport_controls()
+            self._queue_refresh("transport")
             return
         prev_index = self._prev_index(wrap=self._repeat_mode == "all")
         if prev_index is None:
             self._set_message("Start of playlist")
-            self._refresh_transport_controls()
+            self._queue_refresh("transport")
             return
         self._set_selected(prev_index)
         self._play_current_track(on_failure="skip")
-        self._refresh_transport_controls()
+        self._queue_refresh("transport")
 
     def action_quit_app(self) -> None:
         logger.info("TUI exit requested")
         self.player.stop()
+        self._invalidate_player_state()
         self._stop_hackscript()
         self._save_config()
         if self._hang_watchdog:
@@ -1164,9 +1514,13 @@ class RhythmSlicerApp(App):
         dump_threads("manual dump")
 
     def action_show_help(self) -> None:
-        self.push_screen(HelpModal(self._help_bindings()))
+        from rhythm_slicer.ui.help_modal import HelpModal
+
+        self.push_screen(HelpModal(self._help_bindings))
 
     def action_playlist_builder(self) -> None:
+        from rhythm_slicer.ui.playlist_builder import PlaylistBuilderScreen
+
         start_path = None
         if self._current_track_path and self._current_track_path.exists():
             start_path = self._current_track_path.parent
@@ -1184,18 +1538,19 @@ class RhythmSlicerApp(App):
         if not self.playlist or self.playlist.is_empty():
             return
         self._set_user_navigation_lockout()
-        self._set_selected(max(0, self.playlist.index - 1))
+        # _set_selected clamps to the playlist bounds.
+        self._set_selected(self.playlist.index - 1)
 
     def action_move_down(self) -> None:
         if not self.playlist or self.playlist.is_empty():
             return
         self._set_user_navigation_lockout()
-        self._set_selected(min(len(self.playlist.tracks) - 1, self.playlist.index + 1))
+        self._set_selected(self.playlist.index + 1)
 
     def action_play_selected(self) -> None:
         if not self.playlist or self.playlist.is_empty():
             self._set_message("No tracks loaded")
-            self._refresh_transport_controls()
+            self._queue_refresh("transport")
             return
         try:
             focused = self.focused
@@ -1208,14 +1563,14 @@ class RhythmSlicerApp(App):
         ):
             return
         self._play_selected()
-        self._refresh_transport_controls()
+        self._queue_refresh("transport")
 
     def action_remove_selected(self) -> None:
         if not self.playlist or self.playlist.is_empty():
             return
         if self.playlist.index < 0 or self.playlist.index >= len(self.playlist.tracks):
             self.playlist.clamp_index()
-            self._update_playlist_view()
+            self._queue_refresh("playlist")
             return
         selected_index = self.playlist.index
         removed_track = self.playlist.tracks[selected_index]
@@ -1226,39 +1581,41 @@ class RhythmSlicerApp(App):
         )
         was_playing = selected_index == playing_index
         self.playlist.remove(selected_index)
+        self._line_cache.clear()
         self._reset_play_order()
         if self.playlist.is_empty():
             if self._playlist_list:
                 self._playlist_list.update("No tracks loaded")
             if was_playing:
                 self.player.stop()
+                self._invalidate_player_state()
                 self._playing_index = None
                 self._stop_hackscript()
                 self._set_message("Playlist empty")
-                self._refresh_transport_controls()
+                self._queue_refresh("transport")
             else:
                 self._set_message(f"Removed: {removed_track.title}")
             return
-        self._update_playlist_view()
+        self._queue_refresh("playlist")
         if was_playing:
             self._play_current_track(on_failure="skip")
         self._set_message(f"Removed: {removed_track.title}")
-        self._refresh_transport_controls()
+        self._queue_refresh("transport")
 
     def action_cycle_repeat(self) -> None:
         modes = ["off", "one", "all"]
         current = modes.index(self._repeat_mode)
         self._repeat_mode = modes[(current + 1) % len(modes)]
         self._set_message(f"Repeat: {self._repeat_mode}")
-        self._update_playlist_view()
-        self._save_config()
+        self._queue_refresh("playlist")
+        self._schedule_save_config()
 
     def action_toggle_shuffle(self) -> None:
         self._shuffle = not self._shuffle
         self._reset_play_order()
         self._set_message(f"Shuffle: {'on' if self._shuffle else 'off'}")
-        self._update_playlist_view()
-        self._save_config()
+        self._queue_refresh("playlist")
+        self._schedule_save_config()
 
     async def action_select_visualization(self) -> None:
         self.run_worker(self._select_visualization_flow(), exclusive=True)
@@ -1275,8 +1632,10 @@ class RhythmSlicerApp(App):
     async def action_open(self) -> None:
         self.run_worker(self._open_flow(), exclusive=True)
 
-    def _help_bindings(self) -> list[Binding]:
-        return normalize_bindings(self.BINDINGS)
+    @cached_property
+    def _help_bindings(self) -> tuple[Binding, ...]:
+        # BINDINGS is static, so normalize it once per app instance.
+        return tuple(normalize_bindings(self.BINDINGS))
 
     # ===== Mouse / keyboard event handlers =====
     async def on_mount(self) -> None:
@@ -1284,6 +1643,7 @@ class RhythmSlicerApp(App):
         self._visualizer = self.query_one("#visualizer", Static)
         self._visualizer_hud = self.query_one("#visualizer_hud", Static)
         self._playlist_list = self.query_one("#playlist_list", Static)
+        self._invalidate_playlist_list_size()
         self._playlist_table = self.query_one("#playlist_table", PlaylistTable)
         self._playlist_counter = self.query_one("#playlist_counter", Static)
         self._playlist_list.can_focus = True
@@ -1294,19 +1654,29 @@ class RhythmSlicerApp(App):
         self._status_speed_bar = self.query_one("#status_speed_bar", Static)
         self._status_speed_text = self.query_one("#status_speed_text", Static)
         self._status_state_text = self.query_one("#status_state_text", Static)
+        self._key_playpause = self.query_one("#key_playpause", Button)
+        self._repeat_button = self.query_one("#repeat_toggle", Button)
+        self._shuffle_button = self.query_one("#shuffle_toggle", Button)
+        self._playlist_footer_track = self.query_one("#playlist_footer_track", Static)
+        self._transport_controls = self.query_one(TransportControls)
         self._init_playlist_table()
         self._update_visualizer_hud()
         self._update_visualizer_viewport()
         self._install_asyncio_exception_handler()
         self._start_hang_watchdog()
         self.player.set_volume(self._volume)
+        self._attach_end_reached_callback()
         if self.playlist is None:
             if not self._explicit_path and self._last_open_path:
-                if self._last_open_path.exists():
-                    self.playlist = load_from_input(self._last_open_path)
+                if await asyncio.to_thread(os.path.exists, self._last_open_path):
+                    self.playlist = await asyncio.to_thread(
+                        load_from_input, self._last_open_path
+                    )
                     self._filename = self._last_open_path.name
             if self.playlist is None and self._explicit_path:
-                self.playlist = load_from_input(Path(self.path))
+                self.playlist = await asyncio.to_thread(
+                    load_from_input, Path(self.path)
+                )
             if self.playlist is None:
                 self.playlist = Playlist([])
         await self.set_playlist(self.playlist, preserve_path=None)
@@ -1317,12 +1687,10 @@ class RhythmSlicerApp(App):
         if self._playlist_table:
             self.set_focus(self._playlist_table)
         self._update_transport_row()
-        self.set_interval(0.1, self._on_tick)
-        self.set_interval(0.25, self._update_status_panel)
-        self.set_interval(0.5, self._update_ui_tick)
-        self.set_interval(10.0, self._log_heartbeat)
-        self.call_later(self._finalize_visualizer_layout)
-        # Ensure the playlist table sizes itself once layout measurements are available.
+        self.set_interval(self.TICK_INTERVAL, self._on_tick)
+        self.call_after_refresh(self._finalize_visualizer_layout)
+        # PlaylistTable.on_resize sizes the columns; this is a safety net in case
+        # the first layout pass never reports a usable width.
         self.set_timer(0.05, self._refresh_playlist_table_after_layout)
         self._apply_layout_constraints()
         self._update_status_panel(force=True)
@@ -1330,6 +1698,8 @@ class RhythmSlicerApp(App):
 
     def on_shutdown(self) -> None:
         logger.info("TUI shutdown")
+        if self._config_dirty:
+            self._save_config()
         if self._hang_watchdog:
             self._hang_watchdog.stop()
 
@@ -1381,55 +1751,79 @@ class RhythmSlicerApp(App):
         del event
         self._set_user_navigation_lockout()
 
+    def _mouse_hit_regions(
+        self,
+    ) -> list[tuple[str, Region, Callable[[float], object]]]:
+        """Return the status bar regions, resolved once per layout."""
+        regions = self._hit_regions
+        if regions is None:
+            regions = []
+            for name, widget, handler in (
+                ("time", self._status_time_bar, self._seek_to_ratio),
+                ("volume", self._status_volume_bar, self._set_volume_from_ratio),
+                ("speed", self._status_speed_bar, self._set_speed_from_ratio),
+            ):
+                region = getattr(widget, "region", None) if widget else None
+                if region:
+                    regions.append((name, region, handler))
+            self._hit_regions = regions
+        return regions
+
+    def _invalidate_hit_regions(self) -> None:
+        self._hit_regions = None
+
+    def _active_scrub(self) -> Optional[str]:
+        if self._scrub_active:
+            return "time"
+        if self._volume_scrub_active:
+            return "volume"
+        if self._speed_scrub_active:
+            return "speed"
+        return None
+
+    @staticmethod
+    def _event_xy(event: events.MouseEvent) -> tuple[int, int]:
+        return (
+            getattr(event, "screen_x", event.x),
+            getattr(event, "screen_y", event.y),
+        )
+
+    def _over_playlist_table(self, sx: int, sy: int) -> bool:
+        table = self._playlist_table
+        region = getattr(table, "region", None) if table else None
+        return region is not None and bool(region) and region.contains(sx, sy)
+
     def on_mouse_down(self, event: events.MouseDown) -> None:
-        if self._status_time_bar and getattr(self._status_time_bar, "region", None):
-            time_region = self._status_time_bar.region
-            sx = getattr(event, "screen_x", event.x)
-            sy = getattr(event, "screen_y", event.y)
-            if time_region.contains(sx, sy):
-                ratio = ratio_from_click(int(sx - time_region.x), time_region.width)
-                self._seek_to_ratio(ratio)
+        sx, sy = self._event_xy(event)
+        for name, region, handler in self._mouse_hit_regions():
+            if not region.contains(sx, sy):
+                continue
+            handler(ratio_from_click(int(sx - region.x), region.width))
+            if name == "time":
                 self._scrub_active = True
-                event.stop()
-                return
-        if self._status_volume_bar and getattr(self._status_volume_bar, "region", None):
-            volume_region = self._status_volume_bar.region
-            sx = getattr(event, "screen_x", event.x)
-            sy = getattr(event, "screen_y", event.y)
-            if volume_region.contains(sx, sy):
-                ratio = ratio_from_click(int(sx - volume_region.x), volume_region.width)
-                self._set_volume_from_ratio(ratio)
+            elif name == "volume":
                 self._volume_scrub_active = True
-                event.stop()
-                return
-        if self._status_speed_bar and getattr(self._status_speed_bar, "region", None):
-            speed_region = self._status_speed_bar.region
-            sx = getattr(event, "screen_x", event.x)
-            sy = getattr(event, "screen_y", event.y)
-            if speed_region.contains(sx, sy):
-                ratio = ratio_from_click(int(sx - speed_region.x), speed_region.width)
-                self._set_speed_from_ratio(ratio)
+            else:
                 self._speed_scrub_active = True
-                event.stop()
-                return
-        if self._playlist_table and getattr(self._playlist_table, "region", None):
-            table_region = self._playlist_table.region
-            sx = getattr(event, "screen_x", event.x)
-            sy = getattr(event, "screen_y", event.y)
-            if table_region.contains(sx, sy):
-                return
-        if not self._playlist_list:
+            event.stop()
             return
-        region: Optional[Region] = getattr(self._playlist_list, "region", None)
-        sx = getattr(event, "screen_x", event.x)
-        sy = getattr(event, "screen_y", event.y)
-        if region and not region.contains(sx, sy):
+        if self._over_playlist_table(sx, sy):
+            return
+        playlist_list = self._playlist_list
+        if not playlist_list:
+            return
+        list_region: Optional[Region] = getattr(playlist_list, "region", None)
+        if list_region and not list_region.contains(sx, sy):
             return
-        row = int(sy - region.y) if region else int(getattr(event, "offset_y", event.y))
+        row = (
+            int(sy - list_region.y)
+            if list_region
+            else int(getattr(event, "offset_y", event.y))
+        )
         index = self._row_to_index(row)
         if index is None:
             return
-        self.set_focus(self._playlist_list)
+        self.set_focus(playlist_list)
         now = self._now()
         if self._last_click_index == index and now - self._last_click_time <= 0.4:
             self._set_selected(index)
@@ -1440,27 +1834,17 @@ class RhythmSlicerApp(App):
         self._last_click_time = now
 
     def on_mouse_move(self, event: events.MouseMove) -> None:
-        sx = getattr(event, "screen_x", event.x)
-        sy = getattr(event, "screen_y", event.y)
-        if self._scrub_active and self._status_time_bar:
-            region = getattr(self._status_time_bar, "region", None)
-            if region and region.contains(sx, sy):
-                ratio = ratio_from_click(int(sx - region.x), region.width)
-                self._seek_to_ratio(ratio)
-                event.stop()
+        active = self._active_scrub()
+        if active is None:
             return
-        if self._volume_scrub_active and self._status_volume_bar:
-            region = getattr(self._status_volume_bar, "region", None)
-            if region and region.contains(sx, sy):
-                ratio = ratio_from_click(int(sx - region.x), region.width)
-                self._set_volume_from_ratio(ratio)
-                event.stop()
-        if self._speed_scrub_active and self._status_speed_bar:
-            region = getattr(self._status_speed_bar, "region", None)
-            if region and region.contains(sx, sy):
-                ratio = ratio_from_click(int(sx - region.x), region.width)
-                self._set_speed_from_ratio(ratio)
+        sx, sy = self._event_xy(event)
+        for name, region, handler in self._mouse_hit_regions():
+            if name != active:
+                continue
+            if region.contains(sx, sy):
+                handler(ratio_from_click(int(sx - region.x), region.width))
                 event.stop()
+            return
 
     def on_mouse_up(self, event: events.MouseUp) -> None:
         if self._scrub_active:
@@ -1469,7 +1853,7 @@ class RhythmSlicerApp(App):
             return
         if self._volume_scrub_active:
             self._volume_scrub_active = False
-            self._save_config()
+            self._schedule_save_config()
             event.stop()
             return
         if self._speed_scrub_active:
@@ -1480,31 +1864,29 @@ class RhythmSlicerApp(App):
 
     def on_resize(self, event: events.Resize) -> None:
         del event
+        self._invalidate_hit_regions()
+        self._invalidate_playlist_list_size()
+        self._last_view_signature = None
         self._apply_layout_constraints()
         if self._too_small_active:
             return
         self._update_visualizer_viewport()
-        self._update_playlist_view()
+        self._queue_refresh("playlist")
         self._update_visualizer_hud()
         self._update_status_panel(force=True)
-        self.set_timer(0.05, self._refresh_playlist_table_after_layout)
         if self._current_track_path:
             self._schedule_viz_restart(0.1)
         elif self._visualizer and not self._frame_player.is_running:
             self._refresh_visualizer(force=True)
 
     def on_mouse_scroll_down(self, event: events.MouseScrollDown) -> None:
-        if not self._playlist_list:
+        playlist_list = self._playlist_list
+        if not playlist_list:
             return
-        if self._playlist_table and getattr(self._playlist_table, "region", None):
-            table_region = self._playlist_table.region
-            sx = getattr(event, "screen_x", event.x)
-            sy = getattr(event, "screen_y", event.y)
-            if table_region.contains(sx, sy):
-                return
-        region: Optional[Region] = getattr(self._playlist_list, "region", None)
-        sx = getattr(event, "screen_x", event.x)
-        sy = getattr(event, "screen_y", event.y)
+        sx, sy = self._event_xy(event)
+        if self._over_playlist_table(sx, sy):
+            return
+        region: Optional[Region] = getattr(playlist_list, "region", None)
         if region and not region.contains(sx, sy):
             return
         max_offset = (
@@ -1513,25 +1895,21 @@ class RhythmSlicerApp(App):
             else 0
         )
         self._scroll_offset = min(self._scroll_offset + 1, max_offset)
-        self._update_playlist_view()
+        self._queue_refresh("playlist")
         event.stop()
 
     def on_mouse_scroll_up(self, event: events.MouseScrollUp) -> None:
-        if not self._playlist_list:
+        playlist_list = self._playlist_list
+        if not playlist_list:
             return
-        if self._playlist_table and getattr(self._playlist_table, "region", None):
-            table_region = self._playlist_table.region
-            sx = getattr(event, "screen_x", event.x)
-            sy = getattr(event, "screen_y", event.y)
-            if table_region.contains(sx, sy):
-                return
-        region: Optional[Region] = getattr(self._playlist_list, "region", None)
-        sx = getattr(event, "screen_x", event.x)
-        sy = getattr(event, "screen_y", event.y)
+        sx, sy = self._event_xy(event)
+        if self._over_playlist_table(sx, sy):
+            return
+        region: Optional[Region] = getattr(playlist_list, "region", None)
         if region and not region.contains(sx, sy):
             return
         self._scroll_offset = max(0, self._scroll_offset - 1)
-        self._update_playlist_view()
+        self._queue_refresh("playlist")
         event.stop()
 
     async def _select_visualization_flow(self) -> None:
@@ -1550,48 +1928,63 @@ class RhythmSlicerApp(App):
         self._set_message(f"Visualization: {selection}")
         logger.info("Visualization set to %s", selection)
 
+    def _refresh_visible_playlist_table(self) -> None:
+        if self._playlist_table and not self._playlist_table_manager._table_visible():
+            # PlaylistTable.on_resize refreshes the rows once it is shown again.
+            return
+        self._refresh_playlist_table()
+
     def _update_playlist_view(self) -> None:
         if not self._playlist_list or not self.playlist:
-            self._refresh_playlist_table()
+            self._refresh_visible_playlist_table()
             self._update_playlist_controls()
             return
+        if not _is_displayed(self._playlist_list):
+            # A hidden list reports zero height, which would otherwise make the
+            # view fall back to rendering every track.
+            self._last_view_signature = None
+            self._update_playlist_controls()
+            self._refresh_visible_playlist_table()
+            return
         width = self._playlist_width()
         view_height = self._playlist_view_height()
         if self.playlist.is_empty():
+            self._last_view_signature = None
             message = _truncate_line("No tracks loaded", width)
             self._playlist_list.update(message)
             self._update_playlist_controls()
-            self._refresh_playlist_table()
+            self._refresh_visible_playlist_table()
             return
-        lines: list[Text] = []
-        for idx, track in enumerate(self.playlist.tracks):
-            is_active = idx == self.playlist.index
-            line = self._render_playlist_line_text(
+        tracks = self.playlist.tracks
+        active_index = self.playlist.index
+        max_offset = max(0, len(tracks) - view_height)
+        self._scroll_offset = min(self._scroll_offset, max_offset)
+        if active_index < self._scroll_offset:
+            self._scroll_offset = active_index
+        elif active_index >= self._scroll_offset + view_height:
+            self._scroll_offset = active_index - view_height + 1
+        start = max(0, min(self._scroll_offset, max_offset))
+        signature = (active_index, start, width, view_height, len(tracks))
+        if signature == self._last_view_signature:
+            self._update_playlist_controls()
+            self._refresh_visible_playlist_table()
+            return
+        self._last_view_signature = signature
+        end = min(start + view_height, len(tracks))
+        visible = [
+            self._render_playlist_line_text(
                 width,
                 index=idx,
-                title=track.title,
-                is_active=is_active,
+                title=tracks[idx].title,
+                is_active=idx == active_index,
             )
-            lines.append(line)
-        max_offset = max(0, len(lines) - view_height)
-        self._scroll_offset = min(self._scroll_offset, max_offset)
-        if self.playlist.index < self._scroll_offset:
-            self._scroll_offset = self.playlist.index
-        elif self.playlist.index >= self._scroll_offset + view_height:
-            self._scroll_offset = self.playlist.index - view_height + 1
-        start = max(0, min(self._scroll_offset, max_offset))
-        end = start + view_height
-        visible = lines[start:end]
+            for idx in range(start, end)
+        ]
         if len(visible) < view_height:
             visible.extend([Text("")] * (view_height - len(visible)))
-        output = Text()
-        for idx, line in enumerate(visible):
-            if idx:
-                output.append("\n")
-            output.append_text(line)
-        self._playlist_list.update(output)
+        self._playlist_list.update(Text("\n").join(visible))
         self._update_playlist_controls()
-        self._refresh_playlist_table()
+        self._refresh_visible_playlist_table()
 
     def _update_playlist_controls(self) -> None:
         if not self._playlist_counter:
@@ -1600,36 +1993,53 @@ class RhythmSlicerApp(App):
         if counter_text != self._playlist_counter_text:
             self._playlist_counter.update(counter_text)
             self._playlist_counter_text = counter_text
-        try:
-            repeat = self.query_one("#repeat_toggle", Button)
-            shuffle = self.query_one("#shuffle_toggle", Button)
-        except Exception:
-            return
-        repeat.label = self._render_repeat_label()
-        shuffle.label = self._render_shuffle_label()
-        if self._playlist_list:
-            try:
-                track = self.query_one("#playlist_footer_track", Static)
-            except Exception:
-                return
-            track.update(self._render_playlist_footer())
-
-    def _playlist_width(self) -> int:
-        if not self._playlist_list:
-            return 40
+        repeat = self._repeat_button
+        shuffle = self._shuffle_button
+        if not repeat or not shuffle:
+            return
+        repeat_label = self._render_repeat_label()
+        if repeat_label.plain != self._last_repeat_label:
+            repeat.label = repeat_label
+            self._last_repeat_label = repeat_label.plain
+        shuffle_label = self._render_shuffle_label()
+        if shuffle_label.plain != self._last_shuffle_label:
+            shuffle.label = shuffle_label
+            self._last_shuffle_label = shuffle_label.plain
+        track = self._playlist_footer_track
+        if self._playlist_list and track and _is_displayed(track):
+            footer_text = self._render_playlist_footer()
+            if footer_text != self._last_footer_text:
+                track.update(footer_text)
+                self._last_footer_text = footer_text
+
+    def _playlist_list_size(self) -> tuple[int, int]:
+        """Return the playlist list content size, cached until the next layout."""
+        cached = self._playlist_list_size_cache
+        if cached is not None:
+            return cached
         size = getattr(self._playlist_list, "content_size", None) or getattr(
             self._playlist_list, "size", None
         )
         width = getattr(size, "width", 0) if size else 0
+        height = getattr(size, "height", 0) if size else 0
+        if width > 0 and height > 0:
+            # Only a laid-out widget reports a usable size worth keeping.
+            self._playlist_list_size_cache = (width, height)
+        return width, height
+
+    def _invalidate_playlist_list_size(self) -> None:
+        self._playlist_list_size_cache = None
+
+    def _playlist_width(self) -> int:
+        if not self._playlist_list:
+            return 40
+        width, _ = self._playlist_list_size()
         return max(30, width)
 
     def _playlist_view_height(self) -> int:
         if not self._playlist_list:
             return 1
-        size = getattr(self._playlist_list, "content_size", None) or getattr(
-            self._playlist_list, "size", None
-        )
-        height = getattr(size, "height", 0) if size else 0
+        _, height = self._playlist_list_size()
         if height <= 0 and self.playlist:
             height = len(self.playlist.tracks)
         return max(1, height)
@@ -1649,9 +2059,11 @@ class RhythmSlicerApp(App):
         if not self.playlist or self.playlist.is_empty():
             self._set_message("No tracks loaded")
             return
-        self._sync_play_order_pos()
-        self._play_current_track(on_failure="skip")
-        self._sync_selection()
+        # Flush on exit so the newly playing row is not held behind the debounce.
+        with self._batch_updates():
+            self._sync_play_order_pos()
+            self._play_current_track(on_failure="skip")
+            self._sync_selection()
 
     def _set_volume_from_ratio(self, ratio: float) -> None:
         volume = int(max(0.0, min(1.0, ratio)) * 100)
@@ -1680,9 +2092,8 @@ class RhythmSlicerApp(App):
     def _apply_playback_rate(self, rate: float, *, message: str) -> None:
         snapped = self._clamp_snap_rate(rate)
         self._playback_rate = snapped
-        setter = getattr(self.player, "set_playback_rate", None)
-        if callable(setter):
-            setter(snapped)
+        if self._player_set_playback_rate is not None:
+            self._player_set_playback_rate(snapped)
         self._update_status_panel(force=True)
         self._set_message(f"{message} {snapped:0.2f}x")
         self._restart_hackscript_from_player()
@@ -1692,6 +2103,8 @@ class RhythmSlicerApp(App):
         height = max(0, self.size.height)
         too_small = width < self.MIN_WIDTH or height < self.MIN_HEIGHT
         self._too_small_active = too_small
+        self._invalidate_hit_regions()
+        self._invalidate_playlist_list_size()
         body = self.query_one("#body", Horizontal)
         status_panel = self.query_one("#status_panel", Panel)
         too_small_widget = self.query_one("#too_small", Static)
@@ -1700,6 +2113,8 @@ class RhythmSlicerApp(App):
         too_small_widget.styles.display = "block" if too_small else "none"
         if too_small:
             return
+        # The body may have just been shown again; restyle once it is laid out.
+        self.call_after_refresh(self._playlist_table_manager._apply_pending_playing_row)
         show_track = width >= self.HIDE_TRACK_WIDTH
         show_visualizer = width >= self.HIDE_VISUALIZER_WIDTH
         track_panel = self.query_one("#track_panel", Panel)
@@ -1710,24 +2125,58 @@ class RhythmSlicerApp(App):
         right_column.styles.display = "block" if show_visualizer else "none"
 
     def _reset_play_order(self) -> None:
+        # Every membership change resets the play order, so the rendered
+        # playlist view is stale too.
+        self._last_view_signature = None
         if not self.playlist or self.playlist.is_empty():
-            self._play_order = []
+            self._play_order = array("i")
             self._play_order_pos = -1
+            self._play_order_index = {}
             return
-        self._play_order, self._play_order_pos = build_play_order(
+        order, self._play_order_pos = build_play_order(
             len(self.playlist.tracks),
             self.playlist.index,
             self._shuffle,
             self._rng,
         )
+        # A packed int array keeps large shuffled orders compact.
+        self._play_order = array("i", order)
+        self._rebuild_play_order_index()
+
+    def _extend_play_order(self, start: int) -> None:
+        """Queue tracks appended from ``start`` without reordering the rest."""
+        if not self.playlist or not self._play_order:
+            self._reset_play_order()
+            return
+        added = list(range(start, len(self.playlist.tracks)))
+        if self._shuffle:
+            self._rng.shuffle(added)
+        order = self._play_order
+        if not isinstance(order, array):
+            order = array("i", order)
+        base = len(order)
+        order.extend(added)
+        self._play_order = order
+        self._play_order_index.update(
+            (track_index, base + offset) for offset, track_index in enumerate(added)
+        )
+
+    def _rebuild_play_order_index(self) -> None:
+        self._play_order_index = {
+            track_index: pos for pos, track_index in enumerate(self._play_order)
+        }
 
     def _sync_play_order_pos(self) -> None:
         if not self.playlist or not self._play_order:
             return
-        try:
-            self._play_order_pos = self._play_order.index(self.playlist.index)
-        except ValueError:
-            self._play_order_pos = 0
+        order = self._play_order
+        index = self.playlist.index
+        pos = self._play_order_index.get(index)
+        if pos is None or pos >= len(order) or order[pos] != index:
+            # The order was replaced without a reset; resync the lookup.
+            self._rebuild_play_order_index()
+            pos = self._play_order_index.get(index)
+        self._play_order_pos = pos if pos is not None else 0
 
     def _next_index(self, *, wrap: bool) -> Optional[int]:
         if not self._play_order:
@@ -1766,10 +2215,19 @@ class RhythmSlicerApp(App):
         return Path.cwd() / "playlist.m3u8"
 
     async def _save_playlist_flow(self) -> None:
+        from rhythm_slicer.ui.playlist_save_picker import (
+            PlaylistSavePicker,
+            SaveResult,
+            save_mode_from_flag,
+        )
+
         playlist = self.playlist
         if playlist is None:
             self._set_message("Playlist is empty", level="warn")
             return
+        if self._playlist_stream is playlist:
+            self._set_message("Playlist is still loading", level="warn")
+            return
         default_path = self._default_save_path()
         start_directory = (
             default_path.parent if default_path.parent.exists() else Path.cwd()
@@ -1787,10 +2245,18 @@ class RhythmSlicerApp(App):
         if not result:
             return
         dest = result.target_path.expanduser()
+        # Playlists are only mutated on the event loop; the writer thread gets a
+        # snapshot so a concurrent append or removal cannot change it mid-write.
+        snapshot = Playlist(list(playlist.tracks))
         try:
             from rhythm_slicer.playlist_io import save_m3u8
 
-            save_m3u8(playlist, dest, mode=save_mode_from_flag(result.save_absolute))
+            await asyncio.to_thread(
+                save_m3u8,
+                snapshot,
+                dest,
+                mode=save_mode_from_flag(result.save_absolute),
+            )
         except Exception as exc:
             logger.exception("Save playlist failed: %s", dest)
             self._set_message(f"Save failed: {exc}", level="error")
@@ -1800,27 +2266,74 @@ class RhythmSlicerApp(App):
         logger.info("Playlist saved to %s", dest)
 
     async def _load_playlist_flow(self) -> None:
+        from rhythm_slicer.ui.playlist_file_picker import (
+            PlaylistFilePicker,
+            pick_start_directory,
+        )
+
         start_directory = pick_start_directory(self._last_playlist_path, Path.cwd())
         result = await self.push_screen_wait(PlaylistFilePicker(start_directory))
         if not result:
             return
         path = result.expanduser()
+        tracks = load_from_input_iter(path)
+        batch_size = self.PLAYLIST_LOAD_BATCH
         try:
-            new_playlist = load_from_input(path)
+            first = await asyncio.to_thread(_take_tracks, tracks, batch_size)
         except Exception as exc:
             logger.exception("Load playlist failed: %s", path)
             self._set_message(f"Load failed: {exc}", level="error")
             return
-        if new_playlist.is_empty():
+        if not first:
             self._set_message("Playlist is empty", level="warn")
             return
+        new_playlist = Playlist(first)
         preserve_track = self.playlist.current() if self.playlist else None
         preserve = preserve_track.path if preserve_track else None
         await self.set_playlist(new_playlist, preserve_path=preserve)
         self._last_playlist_path = path
         if self._play_current_track(on_failure="skip"):
             self._set_message(f"Loaded playlist: {path}")
-            logger.info("Playlist loaded from %s", path)
+        # The prompt flows share the default worker group and cancel each
+        # other; the stream gets its own group so opening a prompt keeps it.
+        self._playlist_stream = new_playlist
+        self.run_worker(
+            self._append_streamed_tracks(new_playlist, tracks, path),
+            group="playlist_stream",
+            exclusive=True,
+        )
+
+    async def _append_streamed_tracks(
+        self, playlist: Playlist, tracks: Iterator[Track], source: Path
+    ) -> None:
+        """Append the rest of a playlist in growing batches while it plays."""
+        batch_size = self.PLAYLIST_LOAD_BATCH
+        try:
+            while True:
+                batch_size = min(batch_size * 2, self.PLAYLIST_LOAD_MAX_BATCH)
+                try:
+                    batch = await asyncio.to_thread(_take_tracks, tracks, batch_size)
+                except Exception as exc:
+                    logger.exception("Load playlist failed: %s", source)
+                    self._set_message(f"Load failed: {exc}", level="error")
+                    return
+                if not batch or self.playlist is not playlist:
+                    break
+                start = len(playlist.tracks)
+                playlist.tracks.extend(batch)
+                self._extend_play_order(start)
+                self._queue_refresh("playlist", "transport")
+        except asyncio.CancelledError:
+            if self.playlist is playlist:
+                self._set_message(
+                    f"Playlist load stopped after {len(playlist.tracks)} tracks",
+                    level="warn",
+                )
+            raise
+        finally:
+            if self._playlist_stream is playlist:
+                self._playlist_stream = None
+        logger.info("Playlist loaded from %s tracks=%s", source, len(playlist.tracks))
 
     async def _open_flow(self) -> None:
         default = str(self._last_open_path) if self._last_open_path else ""
@@ -1879,21 +2392,25 @@ class RhythmSlicerApp(App):
     def _show_frame(self, frame: HackFrame) -> None:
         if not self._visualizer:
             return
-        if self._visualizer_mode() not in {"PLAYING", "PAUSED"}:
+        if self._visualizer_mode() not in _ACTIVE_VISUALIZER_MODES:
             return
-        now = self._now()
-        if now - self._last_visualizer_update < (1.0 / self.VISUALIZER_MAX_FPS):
+        if self._now() - self._last_visualizer_update < self._visualizer_min_interval:
             return
         width, height = self._visualizer_viewport()
         if width <= 2 or height <= 1:
             text = self._tiny_visualizer_text(width, height)
             self._update_visualizer_content(text, ("tiny", width, height, text))
             return
-        use_ansi = bool(self._viz_prefs.get("ansi_colors", False))
-        if use_ansi:
-            sanitized = sanitize_ansi_sgr(frame.text)
-            rendered = self._render_ansi_frame(sanitized, width, height)
-            key = ("ansi", width, height, sanitized)
+        if self._viz_ansi_enabled:
+            key = ("ansi", width, height, frame.text)
+            if key == self._last_visualizer_key:
+                return
+            rendered = self._ansi_frame_cache.get((frame.text, width, height))
+            if rendered is None:
+                if self.is_running:
+                    self._schedule_ansi_frame_render(frame.text, width, height)
+                    return
+                rendered = self._render_ansi_frame(frame.text, width, height)
             self._update_visualizer_content(rendered, key)
         else:
             clipped = self._clip_frame_text(frame.text, width, height)
@@ -1914,12 +2431,24 @@ class RhythmSlicerApp(App):
         self._last_visualizer_update = self._now()
 
     def _refresh_visualizer(self, *, force: bool = False) -> None:
+        """Queue a visualizer repaint; repeated calls before a flush collapse."""
+        if not self._visualizer:
+            return
+        self._visualizer_refresh_force = self._visualizer_refresh_force or force
+        self._queue_refresh("visualizer")
+
+    def _refresh_visualizer_now(self, *, force: bool = False) -> None:
         if not self._visualizer:
             return
         width, height = self._visualizer_viewport()
         if width <= 0 or height <= 0:
             return
         mode = self._visualizer_mode()
+        if not force and mode not in _ANIMATED_VISUALIZER_MODES:
+            # Static mode screens depend only on (mode, width, height).
+            last_key = self._last_visualizer_key
+            if isinstance(last_key, tuple) and last_key[:3] == (mode, width, height):
+                return
         if width <= 2 or height <= 1:
             text = self._tiny_visualizer_text(width, height)
             self._update_visualizer_content(text, ("tiny", width, height, text))
@@ -1927,6 +2456,9 @@ class RhythmSlicerApp(App):
         if mode == "PLAYING":
             if self._frame_player.is_running:
                 return
+            if not force and self.is_running:
+                self._schedule_visualizer_render(width, height)
+                return
             text = self._render_visualizer()
             key = ("playing", width, height, text)
             if force:
@@ -1948,6 +2480,69 @@ class RhythmSlicerApp(App):
             self._last_visualizer_key = None
         self._update_visualizer_content(text, key)
 
+    def _schedule_ansi_frame_render(self, text: str, width: int, height: int) -> None:
+        """Parse an uncached ANSI frame on a worker thread.
+
+        Frames arriving while a parse is in flight are dropped, and the result
+        is discarded if the visualizer restarted or the viewport changed.
+        """
+        if self._ansi_render_pending:
+            return
+        self._ansi_render_pending = True
+        request_id = self._viz_request_id
+
+        async def render() -> None:
+            try:
+                rendered = await asyncio.to_thread(
+                    _render_raw_ansi_frame, text, width, height
+                )
+            finally:
+                self._ansi_render_pending = False
+            if request_id != self._viz_request_id:
+                return
+            self._ansi_frame_cache.put((text, width, height), rendered)
+            if self._visualizer_mode() not in _ACTIVE_VISUALIZER_MODES:
+                return
+            if self._visualizer_viewport() != (width, height):
+                return
+            self._update_visualizer_content(rendered, ("ansi", width, height, text))
+
+        self.run_worker(render(), group="viz_render", exclusive=False)
+
+    def _schedule_visualizer_render(self, width: int, height: int) -> None:
+        if self._visualizer_render_pending:
+            return
+        seed_ms = self._get_playback_position_ms() or int(self._now() * 1000)
+        render_key = (seed_ms, width, height)
+        last = self._last_bars_render
+        if last is not None and last[0] == render_key:
+            # Stalled position: the frame is already known.
+            self._update_visualizer_content(
+                last[1], ("playing", width, height, last[1])
+            )
+            return
+        self._visualizer_render_pending = True
+
+        async def render() -> None:
+            try:
+                text = await asyncio.to_thread(
+                    self._render_visualizer_bars, seed_ms, width, height
+                )
+            finally:
+                self._visualizer_render_pending = False
+            self._last_bars_render = (render_key, text)
+            if self._frame_player.is_running or self._visualizer_mode() != "PLAYING":
+                return
+            if self._visualizer_viewport() != (width, height):
+                return
+            self._update_visualizer_content(text, ("playing", width, height, text))
+
+        self.run_worker(render(), exclusive=False)
+
+    @staticmethod
+    def _render_visualizer_bars(seed_ms: int, width: int, height: int) -> str:
+        return render_visualizer(visualizer_bars(seed_ms, width, height), height)
+
     def _prepare_hackscript_frames(
         self,
         track_path: Path,
@@ -1978,14 +2573,17 @@ class RhythmSlicerApp(App):
         self._current_track_path = resolved
         if playback_pos_ms is None:
             playback_pos_ms = 0
-        prefs = {
+        # Generators read prefs lazily, so each start gets its own dict; it is
+        # shared with _viz_prefs rather than copied and never mutated afterwards.
+        prefs: dict[str, object] = {
             "show_absolute_paths": False,
             "viz": self._viz_name,
             "ansi_colors": self._ansi_colors,
             "playback_pos_ms": playback_pos_ms,
             "playback_state": playback_state,
         }
-        self._viz_prefs = dict(prefs)
+        self._viz_prefs = prefs
+        self._viz_ansi_enabled = bool(self._ansi_colors)
         self._viz_request_id += 1
         request_id = self._viz_request_id
         logger.info(
@@ -2025,7 +2623,8 @@ class RhythmSlicerApp(App):
                 return
             self._frame_player.start(frames, first_frame=first_frame)
 
-        self.run_worker(prepare_frames(), exclusive=False)
+        # A newer start supersedes any preparation still in flight.
+        self.run_worker(prepare_frames(), group="hackscript", exclusive=True)
 
     def _restart_hackscript(
         self,
@@ -2048,6 +2647,9 @@ class RhythmSlicerApp(App):
         self._last_visualizer_text = None
         self._last_visualizer_key = None
         self._viz_prefs = {}
+        self._viz_ansi_enabled = False
+        self._ansi_frame_cache.clear()
+        clear_ansi_line_cache()
         self._viz_request_id += 1
         logger.info("Visualizer stop")
         if self._viz_restart_timer is not None:
@@ -2062,25 +2664,64 @@ class RhythmSlicerApp(App):
             package = importlib.import_module("rhythm_slicer.visualizations")
         except Exception:
             return [self._viz_name or "hackscope"]
-        names: list[str] = []
-        for module_info in pkgutil.iter_modules(package.__path__):
-            name = module_info.name
-            try:
-                module = importlib.import_module(f"rhythm_slicer.visualizations.{name}")
-            except Exception:
-                continue
-            viz_name = getattr(module, "VIZ_NAME", None)
-            if isinstance(viz_name, str) and callable(
-                getattr(module, "generate_frames", None)
-            ):
-                names.append(viz_name)
+        search_path = tuple(package.__path__)
+        names = _discover_visualizations(search_path, _path_mtimes(search_path))
         if not names:
             return [self._viz_name or "hackscope"]
-        return sorted(set(names))
+        return list(names)
+
+
+def _path_mtimes(paths: tuple[str, ...]) -> tuple[float, ...]:
+    mtimes: list[float] = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime)
+        except OSError:
+            mtimes.append(0.0)
+    return tuple(mtimes)
+
+
+@lru_cache(maxsize=8)
+def _discover_visualizations(
+    search_path: tuple[str, ...], mtimes: tuple[float, ...] = ()
+) -> tuple[str, ...]:
+    """Import visualization modules once per package directory state.
+
+    ``mtimes`` only participates in the cache key so adding or removing a
+    module re-runs discovery.
+    """
+    names: set[str] = set()
+    for module_info in pkgutil.iter_modules(list(search_path)):
+        name = module_info.name
+        try:
+            module = importlib.import_module(f"rhythm_slicer.visualizations.{name}")
+        except Exception:
+            continue
+        viz_name = getattr(module, "VIZ_NAME", None)
+        if isinstance(viz_name, str) and callable(
+            getattr(module, "generate_frames", None)
+        ):
+            names.add(viz_name)
+    return tuple(sorted(names))
 
 
 # UI components
-class PlaylistPrompt(ModalScreen[Optional[str]]):
+class _InputPrompt(ModalScreen[Optional[str]]):
+    """Shared base for modal prompts built around a single text input."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._input: Optional[Input] = None
+
+    def on_mount(self) -> None:
+        self._input = self.query_one("#prompt_input", Input)
+        self._input.focus()
+
+    def _read_input(self) -> str:
+        return self._input.value.strip() if self._input else ""
+
+
+class PlaylistPrompt(_InputPrompt):
     """Modal prompt for playlist paths."""
 
     def __init__(
@@ -2113,8 +2754,18 @@ class PlaylistPrompt(ModalScreen[Optional[str]]):
                 yield Button("OK", id="prompt_ok")
                 yield Button("Cancel", id="prompt_cancel")
 
-    def on_mount(self) -> None:
-        self.query_one("#prompt_input", Input).focus()
+    def _confirm(self) -> None:
+        value = self._read_input()
+        absolute = False
+        toggle = self.query("#prompt_absolute")
+        if toggle:
+            button = toggle.first()
+            if button and isinstance(button, Button):
+                absolute = "On" in str(button.label)
+        if value:
+            self.dismiss(f"{value}::abs={int(absolute)}")
+        else:
+            self.dismiss(None)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "prompt_absolute":
@@ -2127,17 +2778,7 @@ class PlaylistPrompt(ModalScreen[Optional[str]]):
             )
             return
         if event.button.id == "prompt_ok":
-            value = self.query_one("#prompt_input", Input).value.strip()
-            absolute = False
-            toggle = self.query("#prompt_absolute")
-            if toggle:
-                button = toggle.first()
-                if button and isinstance(button, Button):
-                    absolute = "On" in str(button.label)
-            if value:
-                self.dismiss(f"{value}::abs={int(absolute)}")
-            else:
-                self.dismiss(None)
+            self._confirm()
         else:
             self.dismiss(None)
 
@@ -2145,20 +2786,10 @@ class PlaylistPrompt(ModalScreen[Optional[str]]):
         if event.key == "escape":
             self.dismiss(None)
         if event.key == "enter":
-            value = self.query_one("#prompt_input", Input).value.strip()
-            absolute = False
-            toggle = self.query("#prompt_absolute")
-            if toggle:
-                button = toggle.first()
-                if button and isinstance(button, Button):
-                    absolute = "On" in str(button.label)
-            if value:
-                self.dismiss(f"{value}::abs={int(absolute)}")
-            else:
-                self.dismiss(None)
+            self._confirm()
 
 
-class VizPrompt(ModalScreen[Optional[str]]):
+class VizPrompt(_InputPrompt):
     """Modal prompt for selecting a visualization."""
 
     def __init__(self, current: str, choices: list[str]) -> None:
@@ -2176,11 +2807,8 @@ class VizPrompt(ModalScreen[Optional[str]]):
                 yield Button("OK", id="prompt_ok")
                 yield Button("Cancel", id="prompt_cancel")
 
-    def on_mount(self) -> None:
-        self.query_one("#prompt_input", Input).focus()
-
     def _confirm(self) -> None:
-        value = self.query_one("#prompt_input", Input).value.strip()
+        value = self._read_input()
         if value:
             self.dismiss(value)
         else:
@@ -2201,7 +2829,7 @@ class VizPrompt(ModalScreen[Optional[str]]):
                 self._confirm()
 
 
-class OpenPrompt(ModalScreen[Optional[str]]):
+class OpenPrompt(_InputPrompt):
     """Modal prompt for opening a path."""
 
     def __init__(self, default_path: str, recursive_default: bool) -> None:
@@ -2227,9 +2855,6 @@ class OpenPrompt(ModalScreen[Optional[str]]):
                 yield Button("Open", id="prompt_open")
                 yield Button("Cancel", id="prompt_cancel")
 
-    def on_mount(self) -> None:
-        self.query_one("#prompt_input", Input).focus()
-
     def _toggle_recursive(self) -> None:
         self._recursive = not self._recursive
         label = (
@@ -2240,7 +2865,7 @@ class OpenPrompt(ModalScreen[Optional[str]]):
         self.query_one("#prompt_recursive", Button).label = label
 
     def _confirm(self) -> None:
-        value = self.query_one("#prompt_input", Input).value.strip()
+        value = self._read_input()
         if value:
             self.dismiss(_format_open_prompt_result(value, self._recursive))
         else:
@@ -2275,7 +2900,14 @@ def run_tui(path: str, player: VlcPlayer, *, viz_name: Optional[str] = None) ->
         set_console_level(logging.WARNING)
     except Exception:
         logger.exception("Failed to set console log level for TUI")
+    meta_store = MetadataStore(get_metadata_cache_path())
+    meta_store.load()
+    set_metadata_store(meta_store)
     app = RhythmSlicerApp(player=player, path=path, viz_name=viz_name)
-    app.run()
+    try:
+        app.run()
+    finally:
+        meta_store.flush()
+        set_metadata_store(None)
     logger.info("TUI exit")
     return 0
@@ -531,6 +531,9 @@ class PlaylistBuilderScreen(Screen):
             self.app._reset_play_order()
         if hasattr(self.app, "_sync_play_order_pos"):
             self.app._sync_play_order_pos()
+        if hasattr(self.app, "_queue_refresh"):
+            self.app._queue_refresh("playlist", "transport")
+            return
         if hasattr(self.app, "_update_playlist_view"):
             self.app._update_playlist_view()
         if hasattr(self.app, "_refresh_transport_controls"):
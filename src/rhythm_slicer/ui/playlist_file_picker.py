@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Iterable, Optional, cast
 
@@ -20,7 +22,7 @@ from textual.widgets import (
 
 from rhythm_slicer.playlist import M3U_EXTENSIONS
 
-PLAYLIST_EXTENSIONS = frozenset(M3U_EXTENSIONS)
+PLAYLIST_EXTENSIONS = M3U_EXTENSIONS
 
 
 def filter_playlist_filenames(
@@ -35,17 +37,28 @@ def playlist_files_in_directory(
     directory: Path, *, extensions: Iterable[str] | None = None
 ) -> list[Path]:
     """Return playlist files in a directory sorted by name."""
+    return [
+        Path(path) for path in _playlist_file_paths(directory, extensions=extensions)
+    ]
+
+
+def _playlist_file_paths(
+    directory: Path, *, extensions: Iterable[str] | None = None
+) -> list[str]:
+    """Like playlist_files_in_directory, but keep the DirEntry path strings."""
     ext_set = {ext.lower() for ext in (extensions or PLAYLIST_EXTENSIONS)}
+    keyed: list[tuple[str, str]] = []
     try:
-        entries = [
-            entry
-            for entry in directory.iterdir()
-            if entry.is_file() and entry.suffix.lower() in ext_set
-        ]
+        with os.scandir(directory) as scanner:
+            for entry in scanner:
+                name = entry.name
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:].lower() in ext_set and entry.is_file():
+                    keyed.append((name.casefold(), entry.path))
     except FileNotFoundError:
-        entries = []
-    entries.sort(key=lambda entry: entry.name.lower())
-    return entries
+        return []
+    keyed.sort(key=itemgetter(0))
+    return [path for _, path in keyed]
 
 
 def pick_start_directory(last_playlist_path: Optional[Path], cwd: Path) -> Path:
@@ -64,21 +77,39 @@ def pick_start_directory(last_playlist_path: Optional[Path], cwd: Path) -> Path:
 
 
 class PlaylistFileItem(ListItem):
-    """List item that tracks the playlist file path."""
+    """List item that tracks the playlist file path.
+
+    The path is kept as the string from the directory scan and only turned
+    into a ``Path`` when something reads ``path``.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        path_str = os.fspath(path)
+        super().__init__(Label(os.path.basename(path_str)))
+        self._path_str = path_str
+        self._path: Optional[Path] = path if isinstance(path, Path) else None
 
-    def __init__(self, path: Path) -> None:
-        super().__init__(Label(path.name))
-        self.path = path
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = Path(self._path_str)
+        return self._path
 
 
 class PlaylistFilePicker(ModalScreen[Optional[Path]]):
     """Modal screen that lets users pick a playlist file."""
 
+    # Items are mounted a page at a time as the user nears the end of the list.
+    PAGE_SIZE = 200
+    PAGE_MARGIN = 20
+
     def __init__(self, start_directory: Path) -> None:
         super().__init__()
         self._start_directory = start_directory
         self._current_directory = start_directory
         self._selected_path: Optional[Path] = None
+        self._entries: list[str] = []
+        self._mounted_count = 0
 
     def compose(self) -> ComposeResult:
         with Container(id="playlist_file_picker"):
@@ -94,6 +125,9 @@ class PlaylistFilePicker(ModalScreen[Optional[Path]]):
     def on_mount(self) -> None:
         self._refresh_file_list(self._start_directory)
         list_view = self.query_one("#playlist_file_list", ListView)
+        # End/PageDown, the wheel and scrollbar drags scroll without moving the
+        # highlight, so page loading follows the scroll position as well.
+        self.watch(list_view, "scroll_y", self._on_file_list_scrolled, init=False)
         if list_view.children:
             list_view.focus()
         else:
@@ -103,10 +137,32 @@ class PlaylistFilePicker(ModalScreen[Optional[Path]]):
         self._current_directory = directory
         list_view = self.query_one("#playlist_file_list", ListView)
         list_view.clear()
-        for entry in playlist_files_in_directory(directory):
-            list_view.append(PlaylistFileItem(entry))
+        self._entries = _playlist_file_paths(directory)
+        self._mounted_count = 0
+        self._mount_next_page(list_view)
         self.set_selected_path(None)
 
+    def _mount_next_page(self, list_view: ListView) -> None:
+        start = self._mounted_count
+        page = self._entries[start : start + self.PAGE_SIZE]
+        if not page:
+            return
+        self._mounted_count = start + len(page)
+        list_view.extend([PlaylistFileItem(entry) for entry in page])
+
+    def _maybe_mount_more(self, list_view: ListView) -> None:
+        if self._mounted_count >= len(self._entries):
+            return
+        index = list_view.index or 0
+        near_end = index >= self._mounted_count - self.PAGE_MARGIN
+        near_bottom = list_view.max_scroll_y - list_view.scroll_y <= self.PAGE_MARGIN
+        if near_end or near_bottom:
+            self._mount_next_page(list_view)
+
+    def _on_file_list_scrolled(self, scroll_y: float) -> None:
+        del scroll_y
+        self._maybe_mount_more(self.query_one("#playlist_file_list", ListView))
+
     def set_selected_path(self, path: Optional[Path]) -> None:
         self._selected_path = path
         label = self.query_one("#playlist_file_selected", Static)
@@ -128,6 +184,7 @@ class PlaylistFilePicker(ModalScreen[Optional[Path]]):
         self._refresh_file_list(event.path)
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        self._maybe_mount_more(event.list_view)
         item = event.item
         if isinstance(item, PlaylistFileItem):
             self.set_selected_path(item.path)
@@ -2,22 +2,62 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
+from typing import Iterator
 
 from rhythm_slicer.metadata import format_display_title, get_track_meta
 from rhythm_slicer.playlist import Playlist, SUPPORTED_EXTENSIONS, Track
 
+# Tag reads are I/O bound, so oversubscribe the CPU count like the stdlib default.
+META_READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def _iter_audio_files(root: Path) -> Iterator[Path]:
+    """Walk ``root`` with ``os.scandir`` and yield supported audio files.
+
+    Like ``Path.rglob`` this does not descend into symlinked directories and
+    skips subdirectories that cannot be read.
+    """
+    extensions = SUPPORTED_EXTENSIONS
+    root_dir = os.fspath(root)
+    stack = [root_dir]
+    while stack:
+        directory = stack.pop()
+        try:
+            scanner = os.scandir(directory)
+        except OSError:
+            if directory == root_dir:
+                raise
+            continue
+        with scanner:
+            for entry in scanner:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                name = entry.name
+                dot = name.rfind(".")
+                if dot > 0 and name[dot:].lower() in extensions and entry.is_file():
+                    yield Path(entry.path)
+
 
 def _load_recursive_directory(path: Path) -> Playlist:
-    files = [
-        entry
-        for entry in path.rglob("*")
-        if entry.is_file() and entry.suffix.lower() in SUPPORTED_EXTENSIONS
-    ]
-    files.sort(key=lambda entry: entry.relative_to(path).as_posix().lower())
-    tracks = []
-    for entry in files:
-        meta = get_track_meta(entry)
-        title = format_display_title(entry, meta)
-        tracks.append(Track(path=entry, title=title))
-    return Playlist(tracks)
+    files = list(_iter_audio_files(path))
+    keyed = [(entry.relative_to(path).as_posix().casefold(), entry) for entry in files]
+    keyed.sort(key=itemgetter(0))
+    files = [entry for _, entry in keyed]
+    if len(files) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(META_READ_WORKERS, len(files))
+        ) as executor:
+            metas = list(executor.map(get_track_meta, files))
+    else:
+        metas = [get_track_meta(entry) for entry in files]
+    return Playlist(
+        [
+            Track(path=entry, title=format_display_title(entry, meta))
+            for entry, meta in zip(files, metas)
+        ]
+    )
@@ -1,23 +1,69 @@
 from __future__ import annotations
 
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 import logging
 
+from rich.style import Style
 from rich.text import Text
 from textual.widgets.data_table import RowDoesNotExist
 
 from rhythm_slicer.playlist import Track
-from rhythm_slicer.ui.tui_formatters import ellipsize
+from rhythm_slicer.ui.bounded_cache import BoundedCache
+from rhythm_slicer.ui.tui_formatters import ellipsize_cached
 
 if TYPE_CHECKING:
     from rhythm_slicer.tui import RhythmSlicerApp
 
 logger = logging.getLogger("rhythm_slicer.tui")
 
+ROW_CELL_CACHE_SIZE = 4096
+META_OVERSCAN = 8
+DEFAULT_VISIBLE_ROWS = 40
+AFTER_LAYOUT_RETRY_DELAYS = (0.05, 0.2, 0.8)
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    return low if value < low else high if value > high else value
+
+
+@lru_cache(maxsize=16)
+def _compute_limits(width: int, gutter: int = 6) -> tuple[int, int]:
+    """Split a table width into title/artist column widths.
+
+    ``gutter`` is the padding/scrollbar cushion that avoids a horizontal scrollbar.
+    """
+    usable_width = width - gutter if width > gutter else width
+    if usable_width <= 0:
+        return 0, 0
+    min_title = 1 if usable_width > 0 else 0
+    min_artist = 1 if usable_width > 1 else 0
+    title_max = max(min_title, int(usable_width * 0.6))
+    artist_max = max(min_artist, usable_width - title_max)
+    total = title_max + artist_max
+    if total < usable_width:
+        artist_max += usable_width - total
+    elif total > usable_width:
+        overflow = total - usable_width
+        trim_title = min(overflow, max(0, title_max - min_title))
+        title_max -= trim_title
+        overflow -= trim_title
+        if overflow > 0:
+            artist_max = max(min_artist, artist_max - overflow)
+    return title_max, artist_max
+
 
 class PlaylistTableManager:
+    _PLAYING_STYLE = Style.parse("bold #5fc9d6")
+
     def __init__(self, app: "RhythmSlicerApp") -> None:
         self._app = app
+        self._row_cells: BoundedCache[
+            tuple[Path, int, bool, int, int, bool], tuple[Text, Text]
+        ] = BoundedCache(ROW_CELL_CACHE_SIZE)
+        self._row_keys: list[str] = []
+        self._playing_row_pending = False
 
     def _init_playlist_table(self) -> None:
         if not self._app._playlist_table:
@@ -38,14 +84,31 @@ class PlaylistTableManager:
         self._app._playing_key = None
         self._app._selected_key = None
 
-    def _refresh_playlist_table_after_layout(self) -> None:
+    def _refresh_playlist_table_after_layout(self, attempt: int = 0) -> None:
         if self._playlist_table_content_width() <= 0:
-            self._app.set_timer(0.05, self._refresh_playlist_table_after_layout)
+            if attempt < len(AFTER_LAYOUT_RETRY_DELAYS):
+                self._app.set_timer(
+                    AFTER_LAYOUT_RETRY_DELAYS[attempt],
+                    partial(self._refresh_playlist_table_after_layout, attempt + 1),
+                )
             return
-        self._refresh_playlist_table(rebuild=True)
+        self._refresh_playlist_table()
 
     def _playlist_row_key(self, index: int) -> str:
-        return str(index)
+        if not isinstance(index, int) or index < 0:
+            return str(index)
+        # Keys only depend on the index, so one growing list serves every playlist.
+        keys = self._row_keys
+        if index >= len(keys):
+            self._reserve_row_keys(index + 1)
+        return keys[index]
+
+    def _reserve_row_keys(self, count: int) -> list[str]:
+        """Grow the shared row key pool to ``count`` entries in one step."""
+        keys = self._row_keys
+        if count > len(keys):
+            keys.extend(map(str, range(len(keys), count)))
+        return keys
 
     def _playlist_table_content_width(self) -> int:
         if not self._app._playlist_table:
@@ -62,24 +125,7 @@ class PlaylistTableManager:
             width = self._app._playlist_table_width or 40
         if not self._app._playlist_table:
             return width, 0, 0
-        gutter = 6  # padding/scrollbar cushion to avoid a horizontal scrollbar
-        usable_width = width - gutter if width > gutter else width
-        if usable_width <= 0:
-            return width, 0, 0
-        min_title = 1 if usable_width > 0 else 0
-        min_artist = 1 if usable_width > 1 else 0
-        title_max = max(min_title, int(usable_width * 0.6))
-        artist_max = max(min_artist, usable_width - title_max)
-        total = title_max + artist_max
-        if total < usable_width:
-            artist_max += usable_width - total
-        elif total > usable_width:
-            overflow = total - usable_width
-            trim_title = min(overflow, max(0, title_max - min_title))
-            title_max -= trim_title
-            overflow -= trim_title
-            if overflow > 0:
-                artist_max = max(min_artist, artist_max - overflow)
+        title_max, artist_max = _compute_limits(width)
         return width, title_max, artist_max
 
     def _playlist_row_cells(
@@ -89,18 +135,33 @@ class PlaylistTableManager:
         is_playing: bool,
         title_max: int,
         artist_max: int,
+        load_meta: bool = True,
     ) -> tuple[Text, Text]:
         meta = self._app._get_track_meta_cached(track.path)
-        if meta is None:
+        key = (
+            track.path,
+            self._app._meta_version.get(track.path, 0),
+            meta is not None,
+            title_max,
+            artist_max,
+            is_playing,
+        )
+        cached = self._row_cells.get(key)
+        if cached is not None:
+            return cached
+        if meta is None and load_meta:
             self._app._ensure_track_meta_loaded(track.path)
         title = (meta.title if meta else None) or track.title or track.path.name
         artist = (meta.artist if meta else None) or "Unknown"
-        title = ellipsize(title, title_max)
-        artist = ellipsize(artist, artist_max)
+        title = ellipsize_cached(title, title_max)
+        artist = ellipsize_cached(artist, artist_max)
         if is_playing:
-            style = "bold #5fc9d6"
-            return Text(title, style=style), Text(artist, style=style)
-        return Text(title), Text(artist)
+            style = self._PLAYING_STYLE
+            cells = Text(title, style=style), Text(artist, style=style)
+        else:
+            cells = Text(title), Text(artist)
+        self._row_cells.put(key, cells)
+        return cells
 
     def _move_table_cursor(self, row_index: int) -> None:
         if not self._app._playlist_table:
@@ -121,9 +182,7 @@ class PlaylistTableManager:
         try:
             row_index = self._app._playlist_table.get_row_index(self._app._selected_key)
         except RowDoesNotExist:
-            if self._app._selected_key not in self._app._missing_row_keys_logged:
-                self._app._missing_row_keys_logged.add(self._app._selected_key)
-                logger.warning("Playlist row key missing: %s", self._app._selected_key)
+            self._log_missing_row_key(self._app._selected_key)
             return
         self._move_table_cursor(row_index)
 
@@ -140,12 +199,20 @@ class PlaylistTableManager:
         width, title_max, artist_max = self._playlist_table_limits()
         width_changed = width != self._app._playlist_table_width
         tracks = self._app.playlist.tracks
-        if (
+        row_count = self._app._playlist_table.row_count
+        # Tracks streamed onto the end of the same playlist only need new rows.
+        needs_rebuild = (
             rebuild
             or self._app._playlist_table_source is not self._app.playlist
-            or self._app._playlist_table.row_count != len(tracks)
-            or width_changed
+            or row_count > len(tracks)
+        )
+        if (
+            not needs_rebuild
+            and width_changed
+            and not self._resize_columns(title_max, artist_max)
         ):
+            needs_rebuild = True
+        if needs_rebuild:
             self._app._playlist_table.clear(columns=True)
             self._app._playlist_table.add_column(
                 "Title",
@@ -157,18 +224,7 @@ class PlaylistTableManager:
                 key=self._app._playlist_artist_column,
                 width=artist_max,
             )
-            for idx, track in enumerate(tracks):
-                title_cell, artist_cell = self._playlist_row_cells(
-                    track,
-                    is_playing=(idx == self._app._playing_index),
-                    title_max=title_max,
-                    artist_max=artist_max,
-                )
-                self._app._playlist_table.add_row(
-                    title_cell,
-                    artist_cell,
-                    key=self._playlist_row_key(idx),
-                )
+            self._add_rows(0, title_max, artist_max)
             self._app._playlist_table_source = self._app.playlist
             self._app._playlist_table_width = width
             self._app._playlist_title_max = title_max
@@ -179,15 +235,20 @@ class PlaylistTableManager:
                 else None
             )
             self._restore_table_cursor_from_selected()
+            self._load_visible_metadata()
         else:
+            appended = row_count < len(tracks)
+            if appended:
+                self._add_rows(row_count, title_max, artist_max)
             if width_changed:
-                for idx, track in enumerate(tracks):
+                for idx, track in zip(range(row_count), tracks):
                     row_key = self._playlist_row_key(idx)
                     title_cell, artist_cell = self._playlist_row_cells(
                         track,
                         is_playing=(idx == self._app._playing_index),
                         title_max=title_max,
                         artist_max=artist_max,
+                        load_meta=False,
                     )
                     self._app._playlist_table.update_cell(
                         row_key,
@@ -208,8 +269,95 @@ class PlaylistTableManager:
                     else None
                 )
                 self._restore_table_cursor_from_selected()
+                self._load_visible_metadata()
             else:
                 self._update_playing_row_style()
+                if appended:
+                    self._load_visible_metadata()
+
+    def _add_rows(self, start: int, title_max: int, artist_max: int) -> None:
+        """Append table rows for playlist tracks from ``start`` onwards."""
+        if not self._app._playlist_table or not self._app.playlist:
+            return
+        tracks = self._app.playlist.tracks
+        row_keys = self._reserve_row_keys(len(tracks))
+        for idx in range(start, len(tracks)):
+            title_cell, artist_cell = self._playlist_row_cells(
+                tracks[idx],
+                is_playing=(idx == self._app._playing_index),
+                title_max=title_max,
+                artist_max=artist_max,
+                load_meta=False,
+            )
+            self._app._playlist_table.add_row(
+                title_cell,
+                artist_cell,
+                key=row_keys[idx],
+            )
+
+    def _refresh_rows_for_paths(self, paths: set[Path]) -> None:
+        """Re-render rows whose track metadata has just been loaded."""
+        if not paths or not self._app._playlist_table or not self._app.playlist:
+            return
+        if self._app._playlist_table_source is not self._app.playlist:
+            return
+        title_max = self._app._playlist_title_max
+        artist_max = self._app._playlist_artist_max
+        for idx, track in enumerate(self._app.playlist.tracks):
+            if track.path not in paths:
+                continue
+            title_cell, artist_cell = self._playlist_row_cells(
+                track,
+                is_playing=(idx == self._app._playing_index),
+                title_max=title_max,
+                artist_max=artist_max,
+                load_meta=False,
+            )
+            self._update_row_cells(self._playlist_row_key(idx), title_cell, artist_cell)
+
+    def _resize_columns(self, title_max: int, artist_max: int) -> bool:
+        """Resize columns in place so a width change can skip the rebuild."""
+        resize = getattr(self._app._playlist_table, "set_column_widths", None)
+        if not callable(resize):
+            return False
+        return bool(
+            resize(
+                {
+                    self._app._playlist_title_column: title_max,
+                    self._app._playlist_artist_column: artist_max,
+                }
+            )
+        )
+
+    def _visible_row_range(self) -> tuple[int, int]:
+        table = self._app._playlist_table
+        if not table:
+            return 0, 0
+        offset = getattr(table, "scroll_offset", None)
+        top = max(0, int(getattr(offset, "y", 0))) if offset else 0
+        size = getattr(table, "content_size", None) or getattr(table, "size", None)
+        height = getattr(size, "height", 0) if size else 0
+        if height <= 0:
+            height = DEFAULT_VISIBLE_ROWS
+        return top, top + height
+
+    def _load_visible_metadata(self) -> None:
+        """Start metadata loads for rows in (or just past) the viewport."""
+        if not self._app._playlist_table or not self._app.playlist:
+            return
+        tracks = self._app.playlist.tracks
+        lo, hi = self._visible_row_range()
+        # Filter in one pass: rows already loading are skipped before the cache
+        # lookup, which keeps repeated scroll events cheap.
+        loading = self._app._meta_loading
+        get_cached = self._app._get_track_meta_cached
+        missing = [
+            track.path
+            for track in tracks[lo : min(len(tracks), hi + META_OVERSCAN)]
+            if track.path not in loading and get_cached(track.path) is None
+        ]
+        for path in missing:
+            self._app._ensure_track_meta_loaded(path)
 
     def _update_playing_row_style(self) -> None:
         if not self._app._playlist_table or not self._app.playlist:
@@ -220,7 +368,14 @@ class PlaylistTableManager:
             else None
         )
         if new_key == self._app._playing_key:
+            self._playing_row_pending = False
             return
+        if not self._table_visible():
+            # Restyle once the table is laid out again rather than painting
+            # rows nobody can see; see _apply_pending_playing_row.
+            self._playing_row_pending = True
+            return
+        self._playing_row_pending = False
         width, title_max, artist_max = self._playlist_table_limits()
         self._app._playlist_table_width = width
         self._app._playlist_title_max = title_max
@@ -264,6 +419,18 @@ class PlaylistTableManager:
                 self._update_row_cells(new_key, title_cell, artist_cell)
         self._app._playing_key = new_key
 
+    def _apply_pending_playing_row(self) -> None:
+        """Apply a restyle deferred while the table was hidden."""
+        if self._playing_row_pending and self._table_visible():
+            self._update_playing_row_style()
+
+    def _table_visible(self) -> bool:
+        table = self._app._playlist_table
+        if not table or not getattr(table, "display", True):
+            return False
+        region = getattr(table, "region", None)
+        return region is None or region.height > 0
+
     def _update_row_cells(
         self,
         row_key: str,
@@ -285,11 +452,15 @@ class PlaylistTableManager:
             )
             return True
         except RowDoesNotExist:
-            if row_key not in self._app._missing_row_keys_logged:
-                self._app._missing_row_keys_logged.add(row_key)
-                logger.warning("Playlist row key missing: %s", row_key)
+            self._log_missing_row_key(row_key)
             return False
 
+    def _log_missing_row_key(self, row_key: str) -> None:
+        if row_key in self._app._missing_row_keys_logged:
+            return
+        self._app._missing_row_keys_logged.put(row_key, None)
+        logger.warning("Playlist row key missing: %s", row_key)
+
     def _set_selected(
         self,
         index: int,
@@ -299,11 +470,11 @@ class PlaylistTableManager:
     ) -> None:
         if not self._app.playlist or self._app.playlist.is_empty():
             return
-        index = max(0, min(index, len(self._app.playlist.tracks) - 1))
+        index = _clamp(index, 0, len(self._app.playlist.tracks) - 1)
         self._app.playlist.set_index(index)
         self._app._sync_play_order_pos()
         if update_selected_key:
             self._app._selected_key = self._playlist_row_key(index)
         if move_cursor:
             self._move_table_cursor(index)
-        self._app._update_playlist_view()
+        self._app._queue_refresh("playlist")
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+_ABS_MARKER = "::abs="
+_RECURSIVE_MARKER = "::recursive="
 
-def _parse_prompt_result(value: str) -> tuple[str, bool]:
-    if "::abs=" not in value:
+
+def _split_flag(value: str, marker: str) -> tuple[str, bool]:
+    idx = value.rfind(marker)
+    if idx < 0:
         return value, False
-    path, raw = value.rsplit("::abs=", 1)
-    return path, raw.strip() == "1"
+    return value[:idx], value[idx + len(marker) :].strip() == "1"
+
+
+def _parse_prompt_result(value: str) -> tuple[str, bool]:
+    return _split_flag(value, _ABS_MARKER)
 
 
 def _format_open_prompt_result(path: str, recursive: bool) -> str:
-    return f"{path}::recursive={int(recursive)}"
+    return f"{path}{_RECURSIVE_MARKER}{int(recursive)}"
 
 
 def _parse_open_prompt_result(value: str) -> tuple[str, bool]:
-    if "::recursive=" not in value:
-        return value, False
-    path, raw = value.rsplit("::recursive=", 1)
-    return path, raw.strip() == "1"
+    return _split_flag(value, _RECURSIVE_MARKER)
@@ -4,11 +4,30 @@ from __future__ import annotations
 
 from typing import Callable, Optional
 
+from rich.style import Style
 from rich.text import Text
 
 from rhythm_slicer.ui.text_helpers import _truncate_line
 from rhythm_slicer.ui.tui_types import StatusMessage
 
+MESSAGE_STYLES = {
+    "warn": Style(color="#ffcc66"),
+    "error": Style(color="#ff5f52"),
+}
+_HINTS = {
+    "playlist": "Enter: play  Del: remove  ↑↓: navigate  ?: help",
+    "visualizer": "V: change viz  R: restart viz  ?: help",
+    "transport": "Space: play/pause  ←/→: seek  ?: help",
+    "general": "Space: play/pause  Enter: play  ?: help",
+}
+_PLAYLIST_IDS = frozenset({"playlist_list", "playlist_table", "playlist_panel"})
+_VISUALIZER_IDS = frozenset(
+    {"visualizer", "visualizer_hud", "visualizer_panel", "track_panel", "right_column"}
+)
+_TRANSPORT_IDS = frozenset(
+    {"transport_row", "key_prev", "key_playpause", "key_stop", "key_next"}
+)
+
 
 class StatusController:
     """Status bar state and rendering."""
@@ -45,85 +64,44 @@ class StatusController:
         message = self._current_message()
         if message:
             line = _truncate_line(message.text, width)
-            style = None
-            if message.level == "warn":
-                style = "#ffcc66"
-            elif message.level == "error":
-                style = "#ff5f52"
+            style = MESSAGE_STYLES.get(message.level)
             return Text(line, style=style) if style else Text(line)
         hint = self._render_hint(focused)
         return Text(_truncate_line(hint, width))
 
     def _current_message(self) -> Optional[StatusMessage]:
-        if not self._message:
+        message = self._message
+        if not message:
             return None
-        if self._message.until is None:
-            return self._message
-        if self._message.until > self._now():
-            return self._message
+        until = message.until
+        if until is None or until > self._now():
+            return message
         self._message = None
         return None
 
     def _render_hint(self, focused: object | None) -> str:
         context = self._context or self._context_from_focus(focused)
-        if context == "playlist":
-            return "Enter: play  Del: remove  ↑↓: navigate  ?: help"
-        if context == "visualizer":
-            return "V: change viz  R: restart viz  ?: help"
-        if context == "transport":
-            return "Space: play/pause  ←/→: seek  ?: help"
-        return "Space: play/pause  Enter: play  ?: help"
+        return _HINTS.get(context, _HINTS["general"])
 
     def _context_from_focus(self, focused: object | None) -> str:
         if focused is None:
             return "general"
         if isinstance(focused, str):
-            focus_id = focused
-            if focus_id in {"playlist_list", "playlist_table", "playlist_panel"}:
-                return "playlist"
-            if focus_id in {
-                "visualizer",
-                "visualizer_hud",
-                "visualizer_panel",
-                "track_panel",
-                "right_column",
-            }:
-                return "visualizer"
-            if focus_id in {
-                "transport_row",
-                "key_prev",
-                "key_playpause",
-                "key_stop",
-                "key_next",
-            }:
-                return "transport"
-            return "general"
-        if self._focus_has_id(
-            focused, {"playlist_list", "playlist_table", "playlist_panel"}
-        ):
+            focus_ids: frozenset[object] = frozenset((focused,))
+        else:
+            focus_ids = self._collect_focus_ids(focused)
+        if focus_ids & _PLAYLIST_IDS:
             return "playlist"
-        if self._focus_has_id(
-            focused,
-            {
-                "visualizer",
-                "visualizer_hud",
-                "visualizer_panel",
-                "track_panel",
-                "right_column",
-            },
-        ):
+        if focus_ids & _VISUALIZER_IDS:
             return "visualizer"
-        if self._focus_has_id(
-            focused,
-            {"transport_row", "key_prev", "key_playpause", "key_stop", "key_next"},
-        ):
+        if focus_ids & _TRANSPORT_IDS:
             return "transport"
         return "general"
 
-    def _focus_has_id(self, widget: object, ids: set[str]) -> bool:
+    def _collect_focus_ids(self, widget: object) -> frozenset[object]:
+        ids: set[object] = set()
         current = widget
         while current is not None:
-            if getattr(current, "id", None) in ids:
-                return True
+            ids.add(getattr(current, "id", None))
             current = getattr(current, "parent", None)
-        return False
+        return frozenset(ids)
@@ -7,6 +7,8 @@ from typing import Any, Callable, Protocol
 
 from rich.text import Text
 
+from rhythm_slicer.ui.status_controller import MESSAGE_STYLES
+
 
 class Updatable(Protocol):
     def update(self, content: Any) -> None: ...
@@ -106,11 +108,7 @@ def update_status_panel(
         or display_text != cache.last_state_text
         or message_level != cache.last_message_level
     ):
-        style = None
-        if message_level == "warn":
-            style = "#ffcc66"
-        elif message_level == "error":
-            style = "#ff5f52"
+        style = MESSAGE_STYLES.get(message_level) if message_level else None
         if message_text and style:
             text = Text(state_text)
             text.append(" ")
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Callable, Optional
 
+_BAR_TEMPLATE_WIDTH = 256
+_BAR_EQ = "=" * _BAR_TEMPLATE_WIDTH
+_BAR_DASH = "-" * _BAR_TEMPLATE_WIDTH
+
 
 def visualizer_bars(seed_ms: int, width: int, height: int) -> list[int]:
     """Return deterministic bar heights for the visualizer."""
     if width <= 0 or height <= 0:
         return []
     t = seed_ms / 1000.0
+    fast, slow = t * 2.0, t * 0.7
+    sin = math.sin
     bars: list[int] = []
-    for col in range(width):
-        base = math.sin(t * 2.0 + col * 0.7)
-        mod = math.sin(t * 0.7 + col * 1.3 + (col % 3) * 0.5)
+    for col_fast, col_slow, col_offset in _bar_phases(width):
+        base = sin(fast + col_fast)
+        mod = sin(slow + col_slow + col_offset)
         value = (base + mod) / 2.0
         normalized = (value + 1.0) / 2.0
         level = int(normalized * height)
@@ -20,6 +27,12 @@ def visualizer_bars(seed_ms: int, width: int, height: int) -> list[int]:
     return bars
 
 
+@lru_cache(maxsize=8)
+def _bar_phases(width: int) -> tuple[tuple[float, float, float], ...]:
+    """Per-column phase terms; kept separate so float sums match the inline form."""
+    return tuple((col * 0.7, col * 1.3, (col % 3) * 0.5) for col in range(width))
+
+
 def render_visualizer(bars: list[int], height: int) -> str:
     """Render bar heights into a multi-line ASCII visualizer."""
     if height <= 0 or not bars:
@@ -81,6 +94,12 @@ def ellipsize(text: str, max_len: int) -> str:
     return text[: max_len - 3] + "..."
 
 
+@lru_cache(maxsize=4096)
+def ellipsize_cached(text: str, max_len: int) -> str:
+    """Memoized ellipsize for labels redrawn with the same width every frame."""
+    return ellipsize(text, max_len)
+
+
 def format_status_time(
     *,
     loading: bool,
@@ -97,9 +116,14 @@ def format_status_time(
     length_ms = max(0, length_ms)
     ratio = min(1.0, position_ms / float(length_ms)) if length_ms else 0.0
     progress = int(ratio * 100)
-    position_text = _format_time_ms(position_ms) or "--:--"
-    length_text = _format_time_ms(length_ms) or "--:--"
-    return f"{position_text} / {length_text}", progress
+    return _status_time_text(position_ms // 1000, length_ms // 1000), progress
+
+
+@lru_cache(maxsize=64)
+def _status_time_text(position_sec: int, length_sec: int) -> str:
+    position_text = _format_time_ms(position_sec * 1000) or "--:--"
+    length_text = _format_time_ms(length_sec * 1000) or "--:--"
+    return f"{position_text} / {length_text}"
 
 
 def ratio_from_click(x: int, width: int) -> float:
@@ -113,11 +137,20 @@ def ratio_from_click(x: int, width: int) -> float:
 def render_status_bar(width: int, ratio: float) -> str:
     if width <= 1:
         return "█"[:width]
-    width = max(1, width)
     inner = max(1, width - 2)
     filled = int(max(0.0, min(1.0, ratio)) * inner)
-    bar = "=" * filled + "-" * max(0, inner - filled)
-    return f"[{bar}]" if width >= 2 else bar
+    return _status_bar_string(width, filled)
+
+
+@lru_cache(maxsize=512)
+def _status_bar_string(width: int, filled: int) -> str:
+    inner = max(1, width - 2)
+    empty = max(0, inner - filled)
+    if inner <= _BAR_TEMPLATE_WIDTH:
+        bar = _BAR_EQ[:filled] + _BAR_DASH[:empty]
+    else:
+        bar = "=" * filled + "-" * empty
+    return "[" + bar + "]" if width >= 2 else bar
 
 
 def target_ms_from_ratio(length_ms: int, ratio: float) -> int:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 from textual import events
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widgets import Button, DataTable, Static
+from textual.widgets.data_table import Column, ColumnKey
 
 if TYPE_CHECKING:
     from rhythm_slicer.tui import RhythmSlicerApp
@@ -13,10 +14,31 @@ else:
     RhythmSlicerApp = Any
 
 
+def _can_request_dimension_update(table: DataTable) -> bool:
+    # DataTable has no public way to re-measure after Column.width changes; it
+    # sets this private flag itself in add_column/update_cell (checked against
+    # Textual 8.2). Probe for it so a release without it falls back to a
+    # column rebuild instead of silently skipping the re-measure.
+    return isinstance(getattr(table, "_require_update_dimensions", None), bool)
+
+
+def _request_dimension_update(table: DataTable) -> None:
+    table._require_update_dimensions = True
+
+
 class VisualizerHud(Static):
     """Compact HUD for the visualizer pane."""
 
 
+class VisualizerView(Static):
+    """Visualizer pane that reports when its geometry is known."""
+
+    def on_resize(self, event: events.Resize) -> None:
+        del event
+        if hasattr(self.app, "_finalize_visualizer_layout"):
+            self.app._finalize_visualizer_layout()
+
+
 class PlaylistTable(DataTable):
     """Playlist table with double-click play behavior."""
 
@@ -35,10 +57,44 @@ class PlaylistTable(DataTable):
             self.app._set_user_navigation_lockout()
         super()._on_mouse_scroll_up(event)
 
+    def on_resize(self, event: events.Resize) -> None:
+        del event
+        if hasattr(self.app, "_on_playlist_table_resize"):
+            self.app._on_playlist_table_resize()
+
+    def set_column_widths(self, widths: dict[str, int]) -> bool:
+        """Resize existing columns in place.
+
+        Returns False, leaving the table untouched, when a column is missing
+        or the table cannot be re-measured; callers then rebuild the columns.
+        """
+        if not _can_request_dimension_update(self):
+            return False
+        resized: list[tuple[Column, int]] = []
+        for key, width in widths.items():
+            column = self.columns.get(ColumnKey(key))
+            if column is None:
+                return False
+            resized.append((column, width))
+        for column, width in resized:
+            column.width = width
+        _request_dimension_update(self)
+        self.refresh()
+        return True
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if int(old_value) != int(new_value) and hasattr(
+            self.app, "_load_visible_playlist_metadata"
+        ):
+            self.app._load_visible_playlist_metadata()
+
 
 class TransportControls(Static):
     """Transport controls for the playlist pane."""
 
+    _buttons: Optional[tuple[Button, Button, Button, Button]] = None
+
     def _app(self) -> "RhythmSlicerApp":
         return cast(RhythmSlicerApp, self.app)
 
@@ -50,6 +106,12 @@ class TransportControls(Static):
             yield Button("Next", id="transport_next", classes="transport_button")
 
     def on_mount(self) -> None:
+        self._buttons = (
+            self.query_one("#transport_playpause", Button),
+            self.query_one("#transport_prev", Button),
+            self.query_one("#transport_stop", Button),
+            self.query_one("#transport_next", Button),
+        )
         self.set_interval(0.25, self._refresh_label)
         self.refresh_state()
 
@@ -70,15 +132,11 @@ class TransportControls(Static):
         self.refresh_state()
 
     def refresh_state(self) -> None:
-        try:
-            label = self.query_one("#transport_playpause", Button)
-            prev_button = self.query_one("#transport_prev", Button)
-            stop_button = self.query_one("#transport_stop", Button)
-            next_button = self.query_one("#transport_next", Button)
-        except Exception:
+        if self._buttons is None:
             return
+        label, prev_button, stop_button, next_button = self._buttons
         app = self._app()
-        state = (app.player.get_state() or "").lower()
+        state = app._get_player_state().lower()
         label.label = "Pause " if "playing" in state else "Play  "
         playlist = getattr(app, "playlist", None)
         is_loading = bool(getattr(app, "_loading", False))
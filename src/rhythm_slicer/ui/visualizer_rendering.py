@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Callable
 from pathlib import Path
 
+from rich.cells import cell_len
 from rich.text import Text
 
 from rhythm_slicer.metadata import TrackMeta
@@ -12,37 +14,76 @@ from rhythm_slicer.playlist import Playlist, Track
 from rhythm_slicer.ui.text_helpers import _truncate_line
 
 
+_HUD_LABEL_STYLE = "dim"
+_HUD_VALUE_STYLE = "#c6d0f2"
+_HUD_TITLE_STYLE = "bold #5fc9d6"
+_HUD_LABELS = {label: Text(f"{label}: ") for label in ("TITLE", "ARTIST", "ALBUM")}
+ANSI_LINE_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=8)
+def _blank_line(width: int) -> str:
+    """Return a cached run of ``width`` spaces for the current viewport."""
+    return " " * width
+
+
+def _hud_column_text(
+    label: str,
+    value: str,
+    col_width: int,
+    style: str,
+    ellipsize_fn: Callable[[str, int], str],
+) -> Text:
+    label_text = _HUD_LABELS[label]
+    label_len = len(label_text.plain)
+    value_text = ellipsize_fn(value, max(1, col_width - label_len))
+    value_len = len(value_text) if value_text.isascii() else cell_len(value_text)
+    pad = col_width - label_len - value_len
+    if pad > 0:
+        return Text.assemble(
+            label_text, (value_text, style), " " * pad, style=_HUD_LABEL_STYLE
+        )
+    return Text.assemble(label_text, (value_text, style), style=_HUD_LABEL_STYLE)
+
+
 def tiny_visualizer_text(width: int, height: int) -> str:
     message = "Visualizer too small"
     line = _truncate_line(message, width).ljust(width)
-    lines = [line] + [" " * width for _ in range(max(0, height - 1))]
+    lines = [line] + [_blank_line(width)] * max(0, height - 1)
     return "\n".join(lines)
 
 
 def clip_frame_text(text: str, width: int, height: int) -> str:
     if width <= 0 or height <= 0:
         return ""
-    lines = text.splitlines()
-    if not lines:
-        lines = [""]
-    clipped: list[str] = []
-    for idx in range(height):
-        line = lines[idx] if idx < len(lines) else ""
-        if len(line) > width:
-            line = line[:width]
-        clipped.append(line.ljust(width))
+    # Scan for newlines instead of splitting the whole frame; only the first
+    # ``height`` lines are ever shown.
+    clipped = [_blank_line(width)] * height
+    start = 0
+    end_of_text = len(text)
+    idx = 0
+    while idx < height and start < end_of_text:
+        newline = text.find("\n", start)
+        end = end_of_text if newline == -1 else newline
+        if end > start and text[end - 1] == "\r":
+            line = text[start : end - 1]
+        else:
+            line = text[start:end]
+        clipped[idx] = line[:width] if len(line) > width else line.ljust(width)
+        idx += 1
+        start = end + 1
     return "\n".join(clipped)
 
 
 def center_visualizer_message(message: str, width: int, height: int) -> str:
+    if height <= 0:
+        return ""
     line = _truncate_line(message, width)
     pad = max(0, (width - len(line)) // 2)
     centered = (" " * pad + line).ljust(width)
-    top_pad = max(0, (height - 1) // 2)
-    lines = [" " * width for _ in range(top_pad)]
-    lines.append(centered)
-    lines.extend([" " * width for _ in range(max(0, height - len(lines)))])
-    return "\n".join(lines[:height])
+    blank = _blank_line(width)
+    top_pad = (height - 1) // 2
+    return "\n".join([blank] * top_pad + [centered] + [blank] * (height - top_pad - 1))
 
 
 def visualizer_hud_size(visualizer_hud: object | None) -> tuple[int, int]:
@@ -56,22 +97,40 @@ def visualizer_hud_size(visualizer_hud: object | None) -> tuple[int, int]:
     return (width, height)
 
 
+@lru_cache(maxsize=ANSI_LINE_CACHE_SIZE)
+def _parse_ansi_line(line: str) -> Text:
+    """Parse one ANSI line. The result is shared; copy it before mutating."""
+    return Text.from_ansi(line)
+
+
+def clear_ansi_line_cache() -> None:
+    _parse_ansi_line.cache_clear()
+
+
 def render_ansi_frame(text: str, width: int, height: int) -> Text:
-    lines = text.splitlines()
-    if not lines:
-        lines = [""]
-    rendered = Text()
+    # Frames are "\n" separated; anything past ``height`` lines stays unsplit.
+    lines = text.split("\n", height)
+    line_count = min(len(lines), height)
+    parts: list[Text] = []
     for idx in range(height):
-        if idx > 0:
-            rendered.append("\n")
-        line = lines[idx] if idx < len(lines) else ""
-        line_text = Text.from_ansi(line)
-        if line_text.cell_len > width:
-            line_text.truncate(width)
-        if line_text.cell_len < width:
-            line_text.append(" " * (width - line_text.cell_len))
-        rendered.append_text(line_text)
-    return rendered
+        line = lines[idx] if idx < line_count else ""
+        if line.endswith("\r"):
+            line = line[:-1]
+        if line.isascii() and line.isprintable():
+            # Plain ASCII art: one cell per character and no escapes to parse.
+            parts.append(
+                Text(line[:width] if len(line) >= width else line.ljust(width))
+            )
+            continue
+        line_text = _parse_ansi_line(line)
+        if line_text.cell_len != width:
+            line_text = line_text.copy()
+            if line_text.cell_len > width:
+                line_text.truncate(width)
+            if line_text.cell_len < width:
+                line_text.append(_blank_line(width)[: width - line_text.cell_len])
+        parts.append(line_text)
+    return Text("\n").join(parts)
 
 
 def render_visualizer_view(
@@ -142,30 +201,14 @@ def render_visualizer_hud(
     artist = meta.artist if meta and meta.artist else "Unknown"
     album = meta.album if meta and meta.album else "Unknown"
 
-    label_style = "dim"
-    value_style = "#c6d0f2"
-    title_style = "bold #5fc9d6"
-
-    def column_text(
-        label: str, value: str, col_width: int, *, is_title: bool = False
-    ) -> Text:
-        label_text = f"{label}: "
-        value_width = max(1, col_width - len(label_text))
-        value_text = ellipsize_fn(value, value_width)
-        text = Text(label_text, style=label_style)
-        style = title_style if is_title else value_style
-        text.append(value_text, style=style)
-        if text.cell_len < col_width:
-            text.append(" " * (col_width - text.cell_len))
-        return text
-
-    lines: list[Text] = []
-    lines.append(column_text("TITLE", title, width, is_title=True))
-    lines.append(column_text("ARTIST", artist, width))
-    lines.append(column_text("ALBUM", album, width))
+    lines = [
+        _hud_column_text("TITLE", title, width, _HUD_TITLE_STYLE, ellipsize_fn),
+        _hud_column_text("ARTIST", artist, width, _HUD_VALUE_STYLE, ellipsize_fn),
+        _hud_column_text("ALBUM", album, width, _HUD_VALUE_STYLE, ellipsize_fn),
+    ]
 
     if len(lines) < height:
-        lines.extend([Text(" " * width)] * (height - len(lines)))
+        lines.extend([Text(_blank_line(width))] * (height - len(lines)))
     if len(lines) > height:
         lines = lines[:height]
     output = Text()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from rhythm_slicer.ui.bounded_cache import BoundedCache
+
+
+def test_bounded_cache_get_and_put() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert "a" in cache
+    assert cache.get("a") == 1
+    assert len(cache) == 1
+
+
+def test_bounded_cache_evicts_least_recently_used() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_bounded_cache_clear() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(4)
+    cache.put("a", 1)
+    cache.clear()
+    assert len(cache) == 0
+    assert "a" not in cache
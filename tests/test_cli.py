@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 import builtins
+import subprocess
+import sys
 
 from rhythm_slicer import cli
 
@@ -137,3 +139,31 @@ def test_thread_exceptions_dump_threads(monkeypatch) -> None:
         threading.excepthook = original_excepthook
 
     assert calls == ["thread exception in worker"]
+
+
+def test_import_cli_does_not_import_tui() -> None:
+    code = (
+        "import sys\n"
+        "import rhythm_slicer.cli\n"
+        "assert 'rhythm_slicer.tui' not in sys.modules\n"
+        "assert 'textual.app' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=False
+    )
+    assert result.returncode == 0, result.stderr.decode()
+
+
+def test_run_tui_facade_delegates(monkeypatch) -> None:
+    from rhythm_slicer import tui
+
+    calls: list[tuple[str, str | None]] = []
+
+    def fake_run_tui(path: str, player: object, *, viz_name=None) -> int:
+        calls.append((path, viz_name))
+        return 7
+
+    monkeypatch.setattr(tui, "run_tui", fake_run_tui)
+    assert cli.run_tui("song.mp3", DummyPlayer(), viz_name="matrix") == 7
+    assert cli._run_tui("song.mp3", DummyPlayer(), None) == 7
+    assert calls == [("song.mp3", "matrix"), ("song.mp3", None)]
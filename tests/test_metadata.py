@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 import sys
+import threading
 from types import SimpleNamespace
 
 from rhythm_slicer import metadata
@@ -79,3 +80,91 @@ def test_extract_text_and_read_tag_helpers() -> None:
     assert metadata._extract_text(_TextValue(" ok ")) == "ok"
     tags = _Tags({"artist": ["Artist"]})
     assert metadata._read_tag(tags, ("missing", "artist")) == "Artist"
+
+
+def test_metadata_store_round_trip_and_invalidation(tmp_path: Path) -> None:
+    track = tmp_path / "song.mp3"
+    track.write_bytes(b"audio")
+    store_path = tmp_path / "cache" / "metadata_cache.json"
+    store = metadata.MetadataStore(store_path)
+    store.put(track, TrackMeta(artist="Artist", title="Title", album="Album"))
+    assert store.dirty
+    assert store.flush() is True
+    assert store.flush() is False
+
+    reloaded = metadata.MetadataStore(store_path)
+    reloaded.load()
+    assert reloaded.get(track) == TrackMeta("Artist", "Title", "Album")
+    track.write_bytes(b"longer audio")
+    assert reloaded.get(track) is None
+
+
+def test_metadata_store_serializes_overlapping_flushes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    first, second = tmp_path / "a.mp3", tmp_path / "b.mp3"
+    first.write_bytes(b"a")
+    second.write_bytes(b"b")
+    store_path = tmp_path / "cache.json"
+    store = metadata.MetadataStore(store_path)
+    store.put(first, TrackMeta(artist=None, title="a"))
+    entered = threading.Event()
+    release = threading.Event()
+    original_write_text = Path.write_text
+
+    def _slow_write_text(self: Path, *args, **kwargs) -> int:
+        if not entered.is_set():
+            entered.set()
+            release.wait(timeout=5)
+        return original_write_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", _slow_write_text)
+    older = threading.Thread(target=store.flush)
+    older.start()
+    assert entered.wait(timeout=5)
+    store.put(second, TrackMeta(artist=None, title="b"))
+    newer = threading.Thread(target=store.flush)
+    newer.start()
+    newer.join(timeout=0.1)
+    assert newer.is_alive()
+    release.set()
+    older.join(timeout=5)
+    newer.join(timeout=5)
+
+    reloaded = metadata.MetadataStore(store_path)
+    reloaded.load()
+    assert reloaded.get(second) == TrackMeta(artist=None, title="b")
+
+
+def test_metadata_store_evicts_least_recently_used(tmp_path: Path) -> None:
+    paths = [tmp_path / f"{idx}.mp3" for idx in range(3)]
+    for path in paths:
+        path.write_bytes(b"x")
+    store = metadata.MetadataStore(tmp_path / "cache.json", max_entries=2)
+    for path in paths:
+        store.put(path, TrackMeta(artist=None, title=path.name))
+    assert store.get(paths[0]) is None
+    assert store.get(paths[2]) == TrackMeta(artist=None, title="2.mp3")
+
+
+def test_metadata_store_load_ignores_corrupt_file(tmp_path: Path) -> None:
+    store_path = tmp_path / "cache.json"
+    store_path.write_text("{not json", encoding="utf-8")
+    store = metadata.MetadataStore(store_path)
+    store.load()
+    assert store.get(tmp_path / "song.mp3") is None
+
+
+def test_get_track_meta_uses_persistent_store(tmp_path: Path, monkeypatch) -> None:
+    track = tmp_path / "song.mp3"
+    track.write_bytes(b"audio")
+    store = metadata.MetadataStore(tmp_path / "cache.json")
+    store.put(track, TrackMeta(artist="Stored", title="Title"))
+    monkeypatch.setattr(metadata, "_TRACK_META_CACHE", {})
+    monkeypatch.setattr(metadata, "_METADATA_STORE", store)
+
+    def _fail(path: Path) -> TrackMeta:
+        raise AssertionError("tags should not be parsed")
+
+    monkeypatch.setattr(metadata, "read_track_meta", _fail)
+    assert metadata.get_track_meta(track).artist == "Stored"
@@ -198,6 +198,20 @@ def test_player_controls_and_end_reached(monkeypatch: pytest.MonkeyPatch) -> Non
     assert player.consume_end_reached() is False
 
 
+def test_end_reached_event_invokes_callback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(player_vlc, "vlc", FakeVlc)
+    monkeypatch.setattr(player_vlc, "_VLC_IMPORT_ERROR", None)
+    player = player_vlc.VlcPlayer()
+    calls: list[bool] = []
+    player.set_end_reached_callback(lambda: calls.append(True))
+    player._handle_end_reached(object())
+    assert calls == [True]
+    assert player.consume_end_reached() is True
+    player.set_end_reached_callback(None)
+    player._handle_end_reached(object())
+    assert calls == [True]
+
+
 def test_player_playback_rate_round_trip(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(player_vlc, "vlc", FakeVlc)
     monkeypatch.setattr(player_vlc, "_VLC_IMPORT_ERROR", None)
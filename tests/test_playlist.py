@@ -5,10 +5,13 @@ from __future__ import annotations
 from pathlib import Path
 
 from rhythm_slicer.playlist import (
+    M3U_EXTENSIONS,
+    SUPPORTED_EXTENSIONS,
     Playlist,
     Track,
     load_from_directory,
     load_from_input,
+    load_from_input_iter,
     load_from_m3u,
 )
 
@@ -107,6 +110,17 @@ def test_load_from_input_file_and_unsupported(tmp_path: Path) -> None:
     assert empty.is_empty()
 
 
+def test_load_from_input_iter_matches_load_from_input(tmp_path: Path) -> None:
+    (tmp_path / "b.mp3").write_text("b", encoding="utf-8")
+    (tmp_path / "a.flac").write_text("a", encoding="utf-8")
+    (tmp_path / "c.txt").write_text("c", encoding="utf-8")
+    m3u = tmp_path / "list.m3u"
+    m3u.write_text("b.mp3\nmissing.mp3\na.flac\n", encoding="utf-8")
+    for source in (tmp_path, m3u, tmp_path / "b.mp3", tmp_path / "c.txt"):
+        tracks = load_from_input_iter(source)
+        assert list(tracks) == load_from_input(source).tracks
+
+
 def test_playlist_next_prev_no_wrap() -> None:
     tracks = [
         Track(path=Path("one.mp3"), title="one.mp3"),
@@ -117,3 +131,9 @@ def test_playlist_next_prev_no_wrap() -> None:
     assert playlist.next() is None
     assert playlist.prev() == tracks[0]
     assert playlist.prev() is None
+
+
+def test_extension_sets_are_frozen_and_lowercase() -> None:
+    for extensions in (SUPPORTED_EXTENSIONS, M3U_EXTENSIONS):
+        assert isinstance(extensions, frozenset)
+        assert all(ext == ext.lower() and ext.startswith(".") for ext in extensions)
@@ -59,16 +59,16 @@ def test_reorder_items_up_down() -> None:
     assert selected_down == [2, 3]
 
 
-def test_list_entries_handles_iterdir_errors(tmp_path: Path, monkeypatch) -> None:
+def test_list_entries_handles_scandir_errors(tmp_path: Path, monkeypatch) -> None:
     model = FileBrowserModel(tmp_path)
-    original_iterdir = Path.iterdir
+    original_scandir = playlist_builder.os.scandir
 
-    def fake_iterdir(self):  # type: ignore[override]
-        if self == tmp_path:
+    def fake_scandir(path):
+        if Path(path) == tmp_path:
             raise OSError("boom")
-        return original_iterdir(self)
+        return original_scandir(path)
 
-    monkeypatch.setattr(Path, "iterdir", fake_iterdir)
+    monkeypatch.setattr(playlist_builder.os, "scandir", fake_scandir)
     entries = model.list_entries()
     assert [entry.name for entry in entries] == [".."]
 
@@ -5,8 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 
 from rhythm_slicer.ui.playlist_file_picker import (
+    PlaylistFileItem,
+    PlaylistFilePicker,
     filter_playlist_filenames,
     pick_start_directory,
+    playlist_files_in_directory,
 )
 
 
@@ -38,3 +41,74 @@ def test_pick_start_directory_falls_back_to_cwd(tmp_path: Path) -> None:
     cwd.mkdir()
     missing = tmp_path / "missing" / "list.m3u"
     assert pick_start_directory(missing, cwd) == cwd
+
+
+def test_playlist_files_in_directory_filters_and_sorts(tmp_path: Path) -> None:
+    for name in ("b.m3u8", "A.M3U", ".m3u", "track.mp3"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    (tmp_path / "dir.m3u").mkdir()
+    assert playlist_files_in_directory(tmp_path) == [
+        tmp_path / "A.M3U",
+        tmp_path / "b.m3u8",
+    ]
+    assert playlist_files_in_directory(tmp_path / "missing") == []
+
+
+def test_playlist_file_item_builds_path_lazily(tmp_path: Path) -> None:
+    item = PlaylistFileItem(str(tmp_path / "mix.m3u"))
+    assert item._path is None
+    assert item.path == tmp_path / "mix.m3u"
+    assert item.path is item.path
+
+
+class _FakeListView:
+    def __init__(self) -> None:
+        self.items: list[PlaylistFileItem] = []
+        self.index: int | None = None
+        self.scroll_y = 0.0
+        self.max_scroll_y = 0.0
+
+    def extend(self, items: list[PlaylistFileItem]) -> None:
+        self.items.extend(items)
+        self.max_scroll_y = max(0.0, len(self.items) - 10.0)
+
+
+def test_file_picker_mounts_pages_as_list_scrolls(tmp_path: Path) -> None:
+    picker = PlaylistFilePicker(tmp_path)
+    picker.PAGE_SIZE = 30
+    picker.PAGE_MARGIN = 5
+    picker._entries = [str(tmp_path / f"{idx:03d}.m3u") for idx in range(70)]
+    list_view = _FakeListView()
+
+    picker._mount_next_page(list_view)  # type: ignore[arg-type]
+    assert len(list_view.items) == 30
+    picker._maybe_mount_more(list_view)  # type: ignore[arg-type]
+    assert len(list_view.items) == 30
+
+    # Scrolling to the bottom (End, PageDown, scrollbar) leaves the highlight
+    # alone but still loads the next page.
+    list_view.scroll_y = list_view.max_scroll_y
+    picker._maybe_mount_more(list_view)  # type: ignore[arg-type]
+    assert len(list_view.items) == 60
+    assert list_view.items[30].path == tmp_path / "030.m3u"
+
+    list_view.scroll_y = 0.0
+    list_view.index = 56
+    picker._maybe_mount_more(list_view)  # type: ignore[arg-type]
+    assert len(list_view.items) == 70
+    picker._maybe_mount_more(list_view)  # type: ignore[arg-type]
+    assert len(list_view.items) == 70
+
+
+def test_file_picker_scroll_watcher_loads_more(tmp_path: Path, monkeypatch) -> None:
+    picker = PlaylistFilePicker(tmp_path)
+    picker.PAGE_SIZE = 30
+    picker._entries = [str(tmp_path / f"{idx:03d}.m3u") for idx in range(40)]
+    list_view = _FakeListView()
+    picker._mount_next_page(list_view)  # type: ignore[arg-type]
+    monkeypatch.setattr(picker, "query_one", lambda *args: list_view)
+    list_view.scroll_y = list_view.max_scroll_y
+
+    picker._on_file_list_scrolled(list_view.scroll_y)
+
+    assert len(list_view.items) == 40
@@ -6,6 +6,7 @@ from pathlib import Path
 
 from rhythm_slicer.playlist import Playlist, Track
 from rhythm_slicer.playlist_io import load_m3u_any, save_m3u8
+from rhythm_slicer.ui.playlist_io import _load_recursive_directory
 
 
 def test_round_trip_save_load_preserves_order(tmp_path: Path) -> None:
@@ -77,3 +78,44 @@ def test_round_trip_preserves_paths(tmp_path: Path) -> None:
     save_m3u8(playlist, dest, mode="absolute")
     loaded = load_m3u_any(dest)
     assert [track.path for track in loaded.tracks] == [track]
+
+
+def test_load_recursive_directory_sorts_by_relative_path(tmp_path: Path) -> None:
+    (tmp_path / "b").mkdir()
+    for name in ("b/a.mp3", "B.mp3", "a.mp3", "notes.txt"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    playlist = _load_recursive_directory(tmp_path)
+    assert [
+        track.path.relative_to(tmp_path).as_posix() for track in playlist.tracks
+    ] == [
+        "a.mp3",
+        "B.mp3",
+        "b/a.mp3",
+    ]
+
+
+def test_load_recursive_directory_keeps_order_with_threaded_metadata(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import rhythm_slicer.ui.playlist_io as ui_playlist_io
+    from rhythm_slicer.metadata import TrackMeta
+
+    names = [f"{idx:02d}.mp3" for idx in range(12)]
+    for name in names:
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    monkeypatch.setattr(
+        ui_playlist_io,
+        "get_track_meta",
+        lambda path: TrackMeta(artist=None, title=path.stem, album=None),
+    )
+    playlist = _load_recursive_directory(tmp_path)
+    assert [track.title for track in playlist.tracks] == [name[:2] for name in names]
+
+
+def test_load_recursive_directory_skips_hidden_and_unsupported(tmp_path: Path) -> None:
+    nested = tmp_path / "x" / "y"
+    nested.mkdir(parents=True)
+    for name in ("x/y/c.WAV", "x/.mp3", "x/notes.txt", "x/y/odd."):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    playlist = _load_recursive_directory(tmp_path)
+    assert [track.path for track in playlist.tracks] == [nested / "c.WAV"]
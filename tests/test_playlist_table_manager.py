@@ -2,13 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
+from rich.style import Style
 from rich.text import Text
 from textual.widgets.data_table import RowDoesNotExist
 
 from rhythm_slicer.metadata import TrackMeta
 from rhythm_slicer.playlist import Playlist, Track
-from rhythm_slicer.ui.playlist_table_manager import PlaylistTableManager
+from rhythm_slicer.ui.bounded_cache import BoundedCache
+from rhythm_slicer.ui.playlist_table_manager import (
+    PlaylistTableManager,
+    _clamp,
+    _compute_limits,
+)
 
 
 @dataclass
@@ -45,6 +53,13 @@ class _Table:
         self.rows[key] = {"title": title, "artist": artist}
         self.row_keys.append(key)
 
+    def set_column_widths(self, widths: dict[str, int]) -> bool:
+        if any(key not in self.columns for key in widths):
+            return False
+        for key, width in widths.items():
+            self.columns[key]["width"] = width
+        return True
+
     def update_cell(self, row_key: str, column_key: str, value: Text) -> None:
         if row_key not in self.rows:
             raise RowDoesNotExist(row_key)
@@ -71,8 +86,9 @@ class _App:
         self._playlist_table_source = None
         self._playing_key = None
         self._selected_key = None
-        self._missing_row_keys_logged: set[str] = set()
+        self._missing_row_keys_logged: BoundedCache[str, None] = BoundedCache(8)
         self._playing_index: int | None = 0
+        self._meta_version: dict[Path, int] = {}
         self._suppress_table_events = False
         self.playlist: Playlist | None = None
         self._update_calls = 0
@@ -80,6 +96,8 @@ class _App:
         self._timer_calls: list[tuple[float, object]] = []
         self._meta_map: dict[Path, TrackMeta] = {}
         self._ensure_calls: list[Path] = []
+        self._meta_loading: set[Path] = set()
+        self._dirty: set[str] = set()
 
     def _get_track_meta_cached(self, path: Path) -> TrackMeta | None:
         return self._meta_map.get(path)
@@ -90,6 +108,13 @@ class _App:
     def _update_playlist_view(self) -> None:
         self._update_calls += 1
 
+    def _mark_ui_dirty(self, *kinds: str) -> None:
+        self._dirty.update(kinds)
+
+    def _queue_refresh(self, *kinds: str) -> None:
+        if "playlist" in kinds:
+            self._update_playlist_view()
+
     def _sync_play_order_pos(self) -> None:
         self._sync_calls += 1
 
@@ -127,6 +152,25 @@ def test_init_playlist_table_skips_without_table() -> None:
     assert app._playlist_table is None
 
 
+def test_playlist_row_key_reuses_cached_strings() -> None:
+    manager = PlaylistTableManager(_App(_Table()))
+
+    key = manager._playlist_row_key(3)
+
+    assert key == "3"
+    assert manager._playlist_row_key(3) is key
+    assert manager._row_keys == ["0", "1", "2", "3"]
+    assert manager._playlist_row_key(-1) == "-1"
+
+
+def test_reserve_row_keys_grows_pool_once() -> None:
+    manager = PlaylistTableManager(_App(_Table()))
+    keys = manager._reserve_row_keys(5)
+    assert keys == ["0", "1", "2", "3", "4"]
+    assert manager._reserve_row_keys(2) is keys
+    assert len(keys) == 5
+
+
 def test_playlist_table_content_width() -> None:
     app = _App(None)
     manager = PlaylistTableManager(app)
@@ -148,6 +192,15 @@ def test_playlist_table_limits_basic() -> None:
     assert artist_max == 18
 
 
+def test_compute_limits_is_cached_per_width() -> None:
+    _compute_limits.cache_clear()
+    assert _compute_limits(50) == (26, 18)
+    assert _compute_limits(50) == (26, 18)
+    assert _compute_limits(3) == (1, 2)
+    info = _compute_limits.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
 def test_playlist_table_limits_with_fallback_width() -> None:
     table = _Table(width=0)
     app = _App(table)
@@ -172,6 +225,22 @@ def test_refresh_after_layout_schedules_when_width_zero() -> None:
     assert app._timer_calls[0][0] == 0.05
 
 
+def test_refresh_after_layout_backs_off_then_gives_up() -> None:
+    table = _Table(width=0)
+    app = _App(table)
+    manager = PlaylistTableManager(app)
+
+    manager._refresh_playlist_table_after_layout()
+    while len(app._timer_calls) < 5:
+        _delay, callback = app._timer_calls[-1]
+        count = len(app._timer_calls)
+        callback()  # type: ignore[operator]
+        if len(app._timer_calls) == count:
+            break
+
+    assert [delay for delay, _callback in app._timer_calls] == [0.05, 0.2, 0.8]
+
+
 def test_playlist_row_cells_with_meta_and_style() -> None:
     table = _Table(width=40)
     app = _App(table)
@@ -185,7 +254,7 @@ def test_playlist_row_cells_with_meta_and_style() -> None:
 
     assert title_cell.plain == "Lo..."
     assert artist_cell.plain == "Artist"
-    assert title_cell.style == "bold #5fc9d6"
+    assert title_cell.style == Style.parse("bold #5fc9d6")
 
 
 def test_playlist_row_cells_triggers_meta_load() -> None:
@@ -199,6 +268,29 @@ def test_playlist_row_cells_triggers_meta_load() -> None:
     assert app._ensure_calls == [track.path]
 
 
+def test_playlist_row_cells_reuses_cached_cells_until_meta_changes() -> None:
+    table = _Table(width=40)
+    app = _App(table)
+    manager = PlaylistTableManager(app)
+    track = Track(path=Path("song.mp3"), title="Fallback")
+
+    first = manager._playlist_row_cells(
+        track, is_playing=False, title_max=10, artist_max=10
+    )
+    again = manager._playlist_row_cells(
+        track, is_playing=False, title_max=10, artist_max=10
+    )
+    assert again is first
+    assert app._ensure_calls == [track.path]
+
+    app._meta_map[track.path] = TrackMeta(artist="Artist", title="Title")
+    app._meta_version[track.path] = 1
+    title_cell, artist_cell = manager._playlist_row_cells(
+        track, is_playing=False, title_max=10, artist_max=10
+    )
+    assert (title_cell.plain, artist_cell.plain) == ("Title", "Artist")
+
+
 def test_refresh_playlist_table_rebuilds_rows() -> None:
     table = _Table(width=40)
     app = _App(table)
@@ -214,6 +306,55 @@ def test_refresh_playlist_table_rebuilds_rows() -> None:
     assert table.cursor_row == 0
 
 
+def test_refresh_playlist_table_loads_meta_for_visible_rows_only() -> None:
+    table = _Table(width=40)
+    table.content_size = SimpleNamespace(width=40, height=5)  # type: ignore[assignment]
+    table.scroll_offset = SimpleNamespace(y=10)  # type: ignore[attr-defined]
+    app = _App(table)
+    app.playlist = Playlist(
+        [Track(path=Path(f"{idx}.mp3"), title=str(idx)) for idx in range(60)]
+    )
+    manager = PlaylistTableManager(app)
+
+    manager._refresh_playlist_table(rebuild=True)
+
+    assert table.row_count == 60
+    assert app._ensure_calls == [Path(f"{idx}.mp3") for idx in range(10, 23)]
+
+
+def test_load_visible_metadata_skips_rows_already_loading() -> None:
+    table = _Table(width=40)
+    table.content_size = SimpleNamespace(width=40, height=3)  # type: ignore[assignment]
+    app = _App(table)
+    app.playlist = Playlist(
+        [Track(path=Path(f"{idx}.mp3"), title=str(idx)) for idx in range(4)]
+    )
+    app._meta_loading = {Path("1.mp3")}
+    app._meta_map[Path("2.mp3")] = TrackMeta(artist=None, title="two", album=None)
+    manager = PlaylistTableManager(app)
+
+    manager._load_visible_metadata()
+
+    assert app._ensure_calls == [Path("0.mp3"), Path("3.mp3")]
+
+
+def test_refresh_playlist_table_appends_streamed_rows() -> None:
+    table = _Table(width=40)
+    app = _App(table)
+    app.playlist = _make_playlist()
+    manager = PlaylistTableManager(app)
+    manager._refresh_playlist_table(rebuild=True)
+    first_rows = dict(table.rows)
+    app.playlist.tracks.append(Track(path=Path("three.mp3"), title="three"))
+    table.clear = lambda *, columns=False: pytest.fail("should not rebuild")  # type: ignore[method-assign]
+
+    manager._refresh_playlist_table()
+
+    assert table.row_keys == ["0", "1", "2"]
+    assert table.rows["2"]["title"].plain == "three"
+    assert all(table.rows[key] is first_rows[key] for key in first_rows)
+
+
 def test_refresh_playlist_table_width_changed_updates_cells() -> None:
     table = _Table(width=40)
     app = _App(table)
@@ -230,6 +371,39 @@ def test_refresh_playlist_table_width_changed_updates_cells() -> None:
     assert app._playlist_table_width == 50
     assert table.columns["title"]["width"] != old_title_width
     assert table.columns["artist"]["width"] != old_artist_width
+    assert len(table.update_calls) == 4
+
+
+def test_refresh_playlist_table_width_change_rebuilds_without_resize() -> None:
+    table = _Table(width=40)
+    table.set_column_widths = lambda widths: False  # type: ignore[method-assign]
+    app = _App(table)
+    app.playlist = _make_playlist()
+    manager = PlaylistTableManager(app)
+    manager._refresh_playlist_table(rebuild=True)
+    table.content_size = _Size(50)
+
+    manager._refresh_playlist_table()
+
+    assert table.update_calls == []
+    assert table.columns["title"]["width"] == 26
+
+
+def test_refresh_rows_for_paths_updates_loaded_rows() -> None:
+    table = _Table(width=40)
+    app = _App(table)
+    app.playlist = _make_playlist()
+    manager = PlaylistTableManager(app)
+    manager._refresh_playlist_table(rebuild=True)
+    table.update_calls.clear()
+    app._meta_map[Path("two.mp3")] = TrackMeta(artist="Artist", title="Second")
+    app._meta_version[Path("two.mp3")] = 1
+
+    manager._refresh_rows_for_paths({Path("two.mp3")})
+
+    assert [call[0] for call in table.update_calls] == ["1", "1"]
+    assert table.rows["1"]["title"].plain == "Second"
+    assert table.rows["1"]["artist"].plain == "Artist"
 
 
 def test_update_playing_row_style_updates_cells() -> None:
@@ -247,6 +421,31 @@ def test_update_playing_row_style_updates_cells() -> None:
     assert app._playing_key == "1"
 
 
+def test_update_playing_row_style_defers_while_table_hidden() -> None:
+    table = _Table(width=40)
+    app = _App(table)
+    app.playlist = _make_playlist()
+    manager = PlaylistTableManager(app)
+    manager._refresh_playlist_table(rebuild=True)
+    table.update_calls.clear()
+    table.region = SimpleNamespace(height=0)  # type: ignore[attr-defined]
+    app._playing_index = 1
+
+    manager._update_playing_row_style()
+
+    assert table.update_calls == []
+    assert app._playing_key == "0"
+    assert app._dirty == set()
+    manager._apply_pending_playing_row()
+    assert table.update_calls == []
+    table.region = SimpleNamespace(height=10)  # type: ignore[attr-defined]
+    manager._apply_pending_playing_row()
+    assert app._playing_key == "1"
+    assert len(table.update_calls) == 4
+    manager._apply_pending_playing_row()
+    assert len(table.update_calls) == 4
+
+
 def test_update_playing_row_style_no_playlist() -> None:
     table = _Table(width=40)
     app = _App(table)
@@ -333,6 +532,12 @@ def test_set_selected_clamps_and_moves_cursor() -> None:
     assert app._update_calls == 1
 
 
+def test_clamp_bounds() -> None:
+    assert _clamp(-3, 0, 4) == 0
+    assert _clamp(2, 0, 4) == 2
+    assert _clamp(9, 0, 4) == 4
+
+
 def test_set_selected_noop_when_empty() -> None:
     table = _Table(width=40)
     app = _App(table)
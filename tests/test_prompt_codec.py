@@ -28,3 +28,10 @@ def test_format_open_prompt_result_round_trip() -> None:
 
 def test_parse_open_prompt_result_without_marker() -> None:
     assert _parse_open_prompt_result("/tmp/music") == ("/tmp/music", False)
+
+
+def test_parse_open_prompt_result_uses_last_marker() -> None:
+    assert _parse_open_prompt_result("/a::recursive=1/b::recursive=0") == (
+        "/a::recursive=1/b",
+        False,
+    )
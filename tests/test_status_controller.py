@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from rich.style import Style
 from rich.text import Text
 
 from rhythm_slicer.ui.status_controller import StatusController
@@ -38,10 +39,10 @@ def test_render_line_applies_styles() -> None:
     line = controller.render_line(40)
     assert isinstance(line, Text)
     assert line.plain == "Warn"
-    assert line.style == "#ffcc66"
+    assert line.style == Style(color="#ffcc66")
     controller.show_message("Error", level="error", timeout=5.0)
     line = controller.render_line(40)
-    assert line.style == "#ff5f52"
+    assert line.style == Style(color="#ff5f52")
 
 
 def test_message_expiration_falls_back_to_hint() -> None:
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -258,6 +262,16 @@ def test_playlist_line_text_no_markup_artifact() -> None:
         assert "[/]" not in line.plain
 
 
+def test_playlist_line_text_reuses_cached_line() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    first = app._render_playlist_line_text(30, index=2, title="Song", is_active=False)
+    again = app._render_playlist_line_text(30, index=2, title="Song", is_active=False)
+    active = app._render_playlist_line_text(30, index=2, title="Song", is_active=True)
+    assert again is first
+    assert active is not first
+    assert active.plain.startswith(">>")
+
+
 def test_next_index_respects_wrap_and_shuffle() -> None:
     app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
     app.playlist = Playlist(
@@ -288,6 +302,75 @@ def test_end_reached_advances_track() -> None:
     assert app.playlist.index == 1
 
 
+def test_on_tick_dispatches_phases_by_elapsed_time(monkeypatch) -> None:
+    current = [100.0]
+    app = tui.RhythmSlicerApp(
+        player=DummyPlayer(), path="song.mp3", now=lambda: current[0]
+    )
+    calls: list[str] = []
+    monkeypatch.setattr(app, "_update_status_panel", lambda: calls.append("status"))
+    monkeypatch.setattr(app, "_log_heartbeat", lambda: calls.append("heartbeat"))
+    monkeypatch.setattr(app, "_refresh_visualizer", lambda: None)
+
+    app._on_tick()
+    assert calls == ["status"]
+    current[0] += 0.1
+    app._on_tick()
+    assert calls == ["status"]
+    current[0] += 0.2
+    app._on_tick()
+    assert calls == ["status", "status"]
+    assert app._last_ui_tick == 100.0
+    current[0] += 10.0
+    app._on_tick()
+    assert calls == ["status", "status", "status", "heartbeat"]
+    assert app._last_ui_tick == current[0]
+
+
+def test_on_tick_skips_rendering_when_idle(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(state="stopped"), path="song.mp3")
+    calls: list[str] = []
+    monkeypatch.setattr(app, "_refresh_visualizer", lambda: calls.append("viz"))
+    monkeypatch.setattr(app, "_update_playlist_view", lambda: calls.append("list"))
+
+    app._on_tick()
+    assert calls == ["list"]
+    app._on_tick()
+    assert calls == ["list"]
+    app._mark_ui_dirty("visualizer")
+    app._on_tick()
+    assert calls == ["list", "viz"]
+    app.player.state = "playing"
+    app._invalidate_player_state()
+    app._on_tick()
+    app._on_tick()
+    assert calls == ["list", "viz", "viz", "viz"]
+
+
+def test_queue_refresh_coalesces_until_flush(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    calls: list[str] = []
+    timers: list[object] = []
+    monkeypatch.setattr(tui.RhythmSlicerApp, "is_running", property(lambda self: True))
+    monkeypatch.setattr(
+        app, "set_timer", lambda delay, callback: timers.append(callback) or object()
+    )
+    monkeypatch.setattr(
+        app, "_refresh_transport_controls", lambda: calls.append("transport")
+    )
+    monkeypatch.setattr(app, "_update_visualizer_hud", lambda: calls.append("hud"))
+
+    app._queue_refresh("transport")
+    app._queue_refresh("hud", "transport")
+    app._queue_refresh("transport")
+    assert calls == []
+    assert len(timers) == 1
+    app._flush_refreshes()
+    assert calls == ["hud", "transport"]
+    app._queue_refresh("hud")
+    assert len(timers) == 2
+
+
 def test_end_reached_repeats_one() -> None:
     player = DummyPlayer()
     app = tui.RhythmSlicerApp(player=player, path="song.mp3")
@@ -306,6 +389,34 @@ def test_end_reached_repeats_one() -> None:
     assert player.play_calls == 1
 
 
+def test_end_reached_callback_replaces_tick_polling() -> None:
+    class _PushPlayer(DummyPlayer):
+        def __init__(self) -> None:
+            super().__init__()
+            self.callback = None
+
+        def set_end_reached_callback(self, callback) -> None:
+            self.callback = callback
+
+    player = _PushPlayer()
+    app = tui.RhythmSlicerApp(player=player, path="song.mp3")
+    app.playlist = Playlist(
+        [
+            Track(path=Path("one.mp3"), title="one.mp3"),
+            Track(path=Path("two.mp3"), title="two.mp3"),
+        ]
+    )
+    app._reset_play_order()
+    app._attach_end_reached_callback()
+    assert player.callback is not None
+    player.signal_end_reached()
+    app._on_tick()
+    assert app.playlist.index == 0
+    app.on_track_end_reached(tui.TrackEndReached())
+    assert app.playlist.index == 1
+    assert player.play_calls == 1
+
+
 def test_end_reached_wraps_when_repeat_all() -> None:
     app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
     app.playlist = Playlist(
@@ -393,6 +504,22 @@ def test_render_transport_label_play_pause() -> None:
     assert app._render_transport_label().plain == "[ PLAY ] "
 
 
+def test_update_transport_row_skips_unchanged_label() -> None:
+    player = DummyPlayer(state="playing")
+    app = tui.RhythmSlicerApp(player=player, path="song.mp3")
+    button = SimpleNamespace(label=None)
+    app._key_playpause = button  # type: ignore[assignment]
+    app._update_transport_row()
+    assert button.label.plain == "[ PAUSE ]"
+    button.label = "untouched"
+    app._update_transport_row()
+    assert button.label == "untouched"
+    player.state = "paused"
+    app._invalidate_player_state()
+    app._update_transport_row()
+    assert button.label.plain == "[ PLAY ] "
+
+
 def test_transport_play_pause_clicks() -> None:
     player = DummyPlayer(state="paused")
     app = tui.RhythmSlicerApp(player=player, path="song.mp3")
@@ -565,3 +692,827 @@ def test_remove_current_track_stops_when_empty() -> None:
     assert playlist.is_empty()
     assert player.stop_calls == 1
     assert "Playlist empty" in _status_line(app._status_controller)
+
+
+def test_list_visualizations_sorted_and_cached() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+
+    names = app._list_visualizations()
+    assert names == sorted(set(names))
+    assert "hackscope" in names
+    assert app._list_visualizations() == names
+    assert app._list_visualizations() is not names
+
+
+def test_player_state_is_cached_briefly() -> None:
+    current = [0.0]
+    player = DummyPlayer(state="playing")
+    app = tui.RhythmSlicerApp(player=player, path="song.mp3", now=lambda: current[0])
+    assert app._playback_state_label() == "PLAYING"
+    player.state = "paused"
+    assert app._playback_state_label() == "PLAYING"
+    current[0] += 0.2
+    assert app._playback_state_label() == "PAUSED"
+
+
+def test_toggle_playback_invalidates_cached_state() -> None:
+    player = DummyPlayer(state="playing")
+    app = tui.RhythmSlicerApp(player=player, path="song.mp3", now=lambda: 0.0)
+    assert app._playback_state_label() == "PLAYING"
+    app.action_toggle_playback()
+    assert app._playback_state_label() == "PAUSED"
+
+
+def test_filename_from_path_argument() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="music/album/")
+    assert app._filename == "album"
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="")
+    assert app._filename == "RhythmSlicer"
+
+
+class _RecordingWidget:
+    def __init__(self) -> None:
+        self.content_size = SimpleNamespace(width=12)
+        self.updates: list[object] = []
+
+    def update(self, content: object) -> None:
+        self.updates.append(content)
+
+
+def test_status_panel_skips_when_inputs_unchanged() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    widgets = {name: _RecordingWidget() for name in ("time_bar", "time_text", "state")}
+    app._status_time_bar = widgets["time_bar"]  # type: ignore[assignment]
+    app._status_time_text = widgets["time_text"]  # type: ignore[assignment]
+    app._status_volume_bar = _RecordingWidget()  # type: ignore[assignment]
+    app._status_volume_text = _RecordingWidget()  # type: ignore[assignment]
+    app._status_speed_bar = _RecordingWidget()  # type: ignore[assignment]
+    app._status_speed_text = _RecordingWidget()  # type: ignore[assignment]
+    app._status_state_text = widgets["state"]  # type: ignore[assignment]
+    app._status_controller.show_message("Careful", level="warn")
+
+    app._update_status_panel()
+    assert widgets["time_text"].updates == ["00:01 / 00:05"]
+    assert len(widgets["state"].updates) == 1
+    app._update_status_panel()
+    assert len(widgets["state"].updates) == 1
+    app._update_status_panel(force=True)
+    assert len(widgets["state"].updates) == 2
+
+
+def test_status_panel_redraws_bars_when_widths_change() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    time_bar = _RecordingWidget()
+    app._status_time_bar = time_bar  # type: ignore[assignment]
+    app._status_time_text = _RecordingWidget()  # type: ignore[assignment]
+    app._status_volume_bar = _RecordingWidget()  # type: ignore[assignment]
+    app._status_volume_text = _RecordingWidget()  # type: ignore[assignment]
+    app._status_speed_bar = _RecordingWidget()  # type: ignore[assignment]
+    app._status_speed_text = _RecordingWidget()  # type: ignore[assignment]
+    app._status_state_text = _RecordingWidget()  # type: ignore[assignment]
+
+    app._update_status_panel()
+    assert len(time_bar.updates) == 1
+    time_bar.content_size = SimpleNamespace(width=20)
+    app._update_status_panel()
+    assert len(time_bar.updates) == 2
+
+
+def test_visualizer_hud_fast_signature_skips_rebuild(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    hud = _RecordingWidget()
+    app._visualizer_hud = hud  # type: ignore[assignment]
+    app.playlist = Playlist([Track(path=Path("one.mp3"), title="one")])
+    app._playing_index = 0
+    monkeypatch.setattr(app, "_ensure_track_meta_loaded", lambda path: None)
+    signatures: list[object] = []
+    original = app._current_track_signature
+
+    def _signature():
+        signatures.append(None)
+        return original()
+
+    monkeypatch.setattr(app, "_current_track_signature", _signature)
+
+    app._update_visualizer_hud()
+    app._update_visualizer_hud()
+    assert len(hud.updates) == 1
+    assert len(signatures) == 1
+    app._meta_version[Path("one.mp3")] = 1
+    app._update_visualizer_hud()
+    assert len(signatures) == 2
+
+
+def test_metadata_loads_are_limited_by_semaphore(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    app.META_LOAD_CONCURRENCY = 2
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def _slow_meta(path: Path) -> None:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+
+    workers: list[object] = []
+    monkeypatch.setattr(tui, "get_track_meta", _slow_meta)
+    monkeypatch.setattr(app, "run_worker", lambda work, **kwargs: workers.append(work))
+    refreshes: list[tuple[str, ...]] = []
+    monkeypatch.setattr(app, "_queue_refresh", lambda *kinds: refreshes.append(kinds))
+
+    async def _run() -> None:
+        for idx in range(6):
+            app._ensure_track_meta_loaded(Path(f"track{idx}.mp3"))
+        await asyncio.gather(*workers)  # type: ignore[arg-type]
+
+    asyncio.run(_run())
+    assert len(workers) == 6
+    assert peak[0] <= 2
+    assert app._meta_loading == set()
+    assert refreshes == [("meta", "hud")] * 6
+    assert app._meta_loaded_paths == {Path(f"track{idx}.mp3") for idx in range(6)}
+
+
+def test_play_track_worker_prefetches_metadata(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    track = Track(path=Path("fresh-track.mp3"), title="fresh")
+    fetched: list[Path] = []
+    started: list[Track] = []
+    refreshes: list[tuple[str, ...]] = []
+    release = threading.Event()
+
+    def slow_get_track_meta(path: Path) -> None:
+        release.wait(timeout=5)
+        fetched.append(path)
+
+    monkeypatch.setattr(tui, "get_cached_track_meta", lambda path: None)
+    monkeypatch.setattr(tui, "get_track_meta", slow_get_track_meta)
+    monkeypatch.setattr(app, "_load_and_play_blocking", lambda track: None)
+    monkeypatch.setattr(
+        app, "_handle_playback_started", lambda track, request_id: started.append(track)
+    )
+    monkeypatch.setattr(app, "_queue_refresh", lambda *kinds: refreshes.append(kinds))
+
+    async def scenario() -> None:
+        await app._play_track_worker(track, request_id=0, on_failure="stop")
+        # Playback is reported started while the tag read is still blocked.
+        assert started == [track]
+        assert app._meta_loaded_paths == set()
+        release.set()
+        for _ in range(200):
+            if app._meta_loaded_paths:
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+
+    assert fetched == [track.path]
+    assert app._meta_loaded_paths == {track.path}
+    assert refreshes == [("meta", "hud")]
+
+
+def test_player_setter_resolves_optional_methods() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayerNoSeek(), path="song.mp3")
+    assert app._player_seek_ms is None
+    assert app._try_seek(1000) is False
+
+    player = DummyPlayer()
+    app.player = player  # type: ignore[assignment]
+    assert app._player_seek_ms == player.seek_ms
+    assert app._try_seek(1000) is True
+    assert player.seeks == [1000]
+
+
+def test_batch_updates_flushes_once_at_outermost_exit(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    calls: list[str] = []
+    monkeypatch.setattr(
+        app, "_refresh_transport_controls", lambda: calls.append("transport")
+    )
+    monkeypatch.setattr(app, "_update_playlist_view", lambda: calls.append("list"))
+
+    with app._batch_updates():
+        app._queue_refresh("transport")
+        with app._batch_updates():
+            app._queue_refresh("playlist", "transport")
+        assert calls == []
+    assert calls == ["list", "transport"]
+    app._queue_refresh("transport")
+    assert calls == ["list", "transport", "transport"]
+
+
+def test_visualizer_render_reuses_frame_for_same_position(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    updates: list[str] = []
+    monkeypatch.setattr(
+        app, "_update_visualizer_content", lambda text, key: updates.append(text)
+    )
+    monkeypatch.setattr(
+        app, "run_worker", lambda *args, **kwargs: pytest.fail("should not render")
+    )
+    app._last_bars_render = ((1000, 8, 4), "frame")
+
+    app._schedule_visualizer_render(8, 4)
+
+    assert updates == ["frame"]
+    assert app._visualizer_render_pending is False
+
+
+def test_start_hackscript_uses_exclusive_worker_group(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    calls: list[dict[str, object]] = []
+
+    def _run_worker(work, **kwargs):
+        work.close()
+        calls.append(kwargs)
+
+    monkeypatch.setattr(app, "run_worker", _run_worker)
+
+    async def _start() -> None:
+        app._start_hackscript(Path("one.mp3"))
+        app._start_hackscript(Path("two.mp3"))
+
+    asyncio.run(_start())
+    assert calls == [{"group": "hackscript", "exclusive": True}] * 2
+    assert app._current_track_path == Path("two.mp3")
+
+
+def test_playlist_view_renders_only_visible_rows(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    widget = _RecordingWidget()
+    widget.content_size = SimpleNamespace(width=40, height=5)
+    app._playlist_list = widget  # type: ignore[assignment]
+    app.playlist = Playlist(
+        [Track(path=Path(f"{idx}.mp3"), title=f"track {idx}") for idx in range(200)]
+    )
+    app.playlist.set_index(120)
+    rendered: list[int] = []
+    original = app._render_playlist_line_text
+
+    def _render(width: int, *, index: int, title: str, is_active: bool):
+        rendered.append(index)
+        return original(width, index=index, title=title, is_active=is_active)
+
+    monkeypatch.setattr(app, "_render_playlist_line_text", _render)
+    monkeypatch.setattr(app, "_refresh_playlist_table", lambda: None)
+    monkeypatch.setattr(app, "_update_playlist_controls", lambda: None)
+
+    app._update_playlist_view()
+    assert rendered == [116, 117, 118, 119, 120]
+    lines = widget.updates[-1].plain.split("\n")
+    assert len(lines) == 5
+    assert lines[-1].startswith(">>")
+
+
+def test_playlist_refresh_burst_coalesces_until_play(monkeypatch) -> None:
+    tracks = [
+        Track(path=Path("one.mp3"), title="one.mp3"),
+        Track(path=Path("two.mp3"), title="two.mp3"),
+    ]
+    app = tui.RhythmSlicerApp(
+        player=DummyPlayer(), path="song.mp3", playlist=Playlist(tracks)
+    )
+    monkeypatch.setattr(tui.RhythmSlicerApp, "is_running", property(lambda self: True))
+    timers: list[object] = []
+    monkeypatch.setattr(
+        app, "set_timer", lambda delay, callback: timers.append(callback) or object()
+    )
+    calls: list[str] = []
+    monkeypatch.setattr(app, "_update_playlist_view", lambda: calls.append("list"))
+
+    for _ in range(5):
+        app._queue_refresh("playlist")
+    assert len(timers) == 1
+    assert calls == []
+    app._play_selected()
+    assert calls == ["list"]
+
+
+def test_mouse_scrub_uses_cached_hit_regions(monkeypatch) -> None:
+    from textual.geometry import Region
+
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    app._status_time_bar = SimpleNamespace(region=Region(0, 20, 10, 1))  # type: ignore[assignment]
+    app._status_volume_bar = SimpleNamespace(region=Region(20, 20, 10, 1))  # type: ignore[assignment]
+    ratios: list[tuple[str, float]] = []
+    monkeypatch.setattr(app, "_seek_to_ratio", lambda r: ratios.append(("seek", r)))
+    monkeypatch.setattr(
+        app, "_set_volume_from_ratio", lambda r: ratios.append(("volume", r))
+    )
+    event = SimpleNamespace(screen_x=25, screen_y=20, x=25, y=20, stop=lambda: None)
+
+    app.on_mouse_down(event)  # type: ignore[arg-type]
+    assert app._volume_scrub_active
+    assert [name for name, _, _ in app._hit_regions or []] == ["time", "volume"]
+    app._status_volume_bar = None
+    app.on_mouse_move(SimpleNamespace(**{**vars(event), "screen_x": 29}))  # type: ignore[arg-type]
+    assert [name for name, _ in ratios] == ["volume", "volume"]
+    app._invalidate_hit_regions()
+    app.on_mouse_move(event)  # type: ignore[arg-type]
+    assert len(ratios) == 2
+
+
+def test_event_xy_prefers_screen_coordinates() -> None:
+    screen_event = SimpleNamespace(screen_x=7, screen_y=3, x=1, y=2)
+    local_event = SimpleNamespace(x=1, y=2)
+    assert tui.RhythmSlicerApp._event_xy(screen_event) == (7, 3)  # type: ignore[arg-type]
+    assert tui.RhythmSlicerApp._event_xy(local_event) == (1, 2)  # type: ignore[arg-type]
+
+
+def test_sync_play_order_pos_uses_index_lookup() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    app.playlist = Playlist(
+        [Track(path=Path(f"{idx}.mp3"), title=str(idx)) for idx in range(4)]
+    )
+    app._reset_play_order()
+    assert app._play_order.typecode == "i"  # type: ignore[attr-defined]
+    assert list(app._play_order) == [0, 1, 2, 3]
+    assert app._play_order_index == {0: 0, 1: 1, 2: 2, 3: 3}
+    app.playlist.set_index(2)
+    app._sync_play_order_pos()
+    assert app._play_order_pos == 2
+    app._play_order = [3, 2, 1, 0]
+    app._sync_play_order_pos()
+    assert app._play_order_pos == 1
+    app.playlist.set_index(1)
+    app._play_order = [0, 2, 3]
+    app._sync_play_order_pos()
+    assert app._play_order_pos == 0
+
+
+def test_playlist_size_cached_until_layout_changes() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    widget = _RecordingWidget()
+    widget.content_size = SimpleNamespace(width=0, height=0)
+    app._playlist_list = widget  # type: ignore[assignment]
+    assert app._playlist_width() == 30
+    widget.content_size = SimpleNamespace(width=50, height=8)
+    assert app._playlist_width() == 50
+    widget.content_size = SimpleNamespace(width=60, height=9)
+    assert (app._playlist_width(), app._playlist_view_height()) == (50, 8)
+    app._invalidate_playlist_list_size()
+    assert (app._playlist_width(), app._playlist_view_height()) == (60, 9)
+
+
+def test_config_saves_coalesce_while_running(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    saved: list[AppConfig] = []
+    monkeypatch.setattr(tui, "save_config", saved.append)
+    monkeypatch.setattr(tui.RhythmSlicerApp, "is_running", property(lambda self: True))
+    timers: list[object] = []
+    monkeypatch.setattr(
+        app, "set_timer", lambda delay, callback: timers.append(callback) or object()
+    )
+
+    app.action_toggle_shuffle()
+    app.action_cycle_repeat()
+    app.action_volume_up()
+    assert saved == []
+    assert timers.count(app._flush_config_save) == 1
+    app._flush_config_save()
+    assert len(saved) == 1
+    assert saved[0].shuffle is True
+    assert saved[0].repeat_mode == "one"
+    app._flush_config_save()
+    assert len(saved) == 1
+
+
+def test_load_playlist_flow_streams_tracks_after_first_batch(monkeypatch) -> None:
+    tracks = [Track(path=Path(f"{idx}.mp3"), title=str(idx)) for idx in range(7)]
+    player = DummyPlayer()
+    app = tui.RhythmSlicerApp(player=player, path="song.mp3")
+    app.PLAYLIST_LOAD_BATCH = 2
+    played: list[int] = []
+
+    async def fake_push(screen):
+        return Path("list.m3u")
+
+    def fake_iter(path: Path):
+        for track in tracks:
+            yield track
+            if played:
+                # Playback started before the rest of the list was read.
+                played.append(len(app.playlist.tracks))
+
+    monkeypatch.setattr(app, "push_screen_wait", fake_push)
+    monkeypatch.setattr(tui, "load_from_input_iter", fake_iter)
+    original_play = app._play_current_track
+
+    def _play(*, on_failure: str = "message") -> bool:
+        played.append(len(app.playlist.tracks))
+        return original_play(on_failure=on_failure)
+
+    monkeypatch.setattr(app, "_play_current_track", _play)
+    streams: list[object] = []
+    original_run_worker = app.run_worker
+
+    def _run_worker(work, **kwargs):
+        if kwargs.get("group") != "playlist_stream":
+            return original_run_worker(work, **kwargs)
+        assert kwargs["exclusive"] is True
+        streams.append(work)
+        return None
+
+    monkeypatch.setattr(app, "run_worker", _run_worker)
+
+    async def scenario() -> None:
+        await app._load_playlist_flow()
+        assert app._playlist_stream is app.playlist
+        [work] = streams
+        await work  # type: ignore[misc]
+
+    asyncio.run(scenario())
+    assert played[0] == 2
+    assert app.playlist.tracks == tracks
+    assert sorted(app._play_order) == list(range(7))
+    assert player.loaded[-1] == "0.mp3"
+    assert app._playlist_stream is None
+
+
+def test_streamed_tracks_extend_play_order_in_place() -> None:
+    app = tui.RhythmSlicerApp(
+        player=DummyPlayer(), path="song.mp3", rng=random.Random(3)
+    )
+    app.playlist = Playlist(
+        [Track(path=Path(f"{idx}.mp3"), title=str(idx)) for idx in range(4)]
+    )
+    app._shuffle = True
+    app._reset_play_order()
+    original = list(app._play_order)
+    app.playlist.tracks.extend(
+        Track(path=Path(f"{idx}.mp3"), title=str(idx)) for idx in range(4, 8)
+    )
+
+    app._extend_play_order(4)
+
+    assert list(app._play_order[:4]) == original
+    assert sorted(app._play_order[4:]) == [4, 5, 6, 7]
+    assert all(
+        app._play_order[pos] == index for index, pos in app._play_order_index.items()
+    )
+
+
+def test_streamed_tracks_cancelled_reports_truncation(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    playlist = Playlist([Track(path=Path("0.mp3"), title="0")])
+    app.playlist = playlist
+    app._playlist_stream = playlist
+    messages: list[tuple[str, str]] = []
+    monkeypatch.setattr(
+        app, "_set_message", lambda text, level="info": messages.append((text, level))
+    )
+
+    release = threading.Event()
+
+    def _blocked_tracks():
+        release.wait(timeout=5)
+        yield Track(path=Path("1.mp3"), title="1")
+
+    async def scenario() -> None:
+        task = asyncio.ensure_future(
+            app._append_streamed_tracks(playlist, _blocked_tracks(), Path("x.m3u"))
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+
+    asyncio.run(scenario())
+    assert messages == [("Playlist load stopped after 1 tracks", "warn")]
+    assert app._playlist_stream is None
+
+
+def test_save_playlist_refused_while_streaming(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    app.playlist = Playlist([Track(path=Path("0.mp3"), title="0")])
+    app._playlist_stream = app.playlist
+    messages: list[str] = []
+    monkeypatch.setattr(
+        app, "_set_message", lambda text, level="info": messages.append(text)
+    )
+
+    async def fail_push(screen):
+        raise AssertionError("save picker should not open")
+
+    monkeypatch.setattr(app, "push_screen_wait", fail_push)
+    asyncio.run(app._save_playlist_flow())
+    assert messages == ["Playlist is still loading"]
+
+
+def test_playlist_controls_skip_unchanged_labels() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    app.playlist = Playlist([Track(path=Path("one.mp3"), title="one")])
+    app._playlist_counter = _RecordingWidget()  # type: ignore[assignment]
+    app._playlist_list = _RecordingWidget()  # type: ignore[assignment]
+    footer = _RecordingWidget()
+    app._playlist_footer_track = footer  # type: ignore[assignment]
+    repeat = SimpleNamespace(label=None)
+    shuffle = SimpleNamespace(label=None)
+    app._repeat_button = repeat  # type: ignore[assignment]
+    app._shuffle_button = shuffle  # type: ignore[assignment]
+
+    app._update_playlist_controls()
+    assert repeat.label.plain == "R:OFF"
+    assert footer.updates == ["Track: 1/1"]
+    repeat.label = "untouched"
+    app._update_playlist_controls()
+    assert repeat.label == "untouched"
+    assert len(footer.updates) == 1
+    app._repeat_mode = "all"
+    app._update_playlist_controls()
+    assert repeat.label.plain == "R:ALL"
+    assert repeat.label.style == "#9cff57"
+
+
+def test_inactive_playlist_line_uses_two_spans() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    line = app._render_playlist_line_text(24, index=4, title="Song", is_active=False)
+    assert line.plain == "     5  Song".ljust(24)
+    assert [str(span.style) for span in line.spans] == ["#5b6170", "#8a93a3"]
+
+
+def test_move_up_and_down_stay_in_bounds() -> None:
+    tracks = [
+        Track(path=Path("one.mp3"), title="one.mp3"),
+        Track(path=Path("two.mp3"), title="two.mp3"),
+    ]
+    app = tui.RhythmSlicerApp(
+        player=DummyPlayer(), path="song.mp3", playlist=Playlist(tracks)
+    )
+    app.action_move_up()
+    assert app.playlist.index == 0
+    app.action_move_down()
+    app.action_move_down()
+    assert app.playlist.index == 1
+
+
+def test_save_playlist_flow_writes_snapshot_off_loop(
+    monkeypatch, tmp_path: Path
+) -> None:
+    from rhythm_slicer import playlist_io
+    from rhythm_slicer.ui.playlist_save_picker import SaveResult
+
+    tracks = [
+        Track(path=tmp_path / "one.mp3", title="one"),
+        Track(path=tmp_path / "two.mp3", title="two"),
+    ]
+    app = tui.RhythmSlicerApp(
+        player=DummyPlayer(), path="song.mp3", playlist=Playlist(tracks)
+    )
+    dest = tmp_path / "out.m3u8"
+
+    async def fake_push(screen):
+        return SaveResult(target_path=dest, save_absolute=False)
+
+    written: list[tuple[list[Track], bool]] = []
+
+    def fake_save(playlist: Playlist, path: Path, mode: str) -> None:
+        written.append(
+            (playlist.tracks, threading.current_thread() is threading.main_thread())
+        )
+
+    monkeypatch.setattr(app, "push_screen_wait", fake_push)
+    monkeypatch.setattr(playlist_io, "save_m3u8", fake_save)
+
+    asyncio.run(app._save_playlist_flow())
+    assert written == [(tracks, False)]
+    assert written[0][0] is not app.playlist.tracks
+    assert app._last_playlist_path == dest
+
+
+def test_playlist_line_text_truncates_by_cell_width() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    wide_title = "日本語のタイトル"
+    fits = app._render_playlist_line_text(
+        30, index=0, title=wide_title, is_active=False
+    )
+    assert fits.cell_len == 30
+    assert "…" not in fits.plain
+    clipped = app._render_playlist_line_text(
+        16, index=0, title="A very long track title", is_active=True
+    )
+    assert clipped.plain == ">>   1  A very …"
+
+
+def test_playlist_view_skips_unchanged_render(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    widget = _RecordingWidget()
+    widget.content_size = SimpleNamespace(width=40, height=3)
+    app._playlist_list = widget  # type: ignore[assignment]
+    app.playlist = Playlist(
+        [Track(path=Path(f"{idx}.mp3"), title=str(idx)) for idx in range(5)]
+    )
+    table_refreshes: list[None] = []
+    monkeypatch.setattr(
+        app, "_refresh_playlist_table", lambda: table_refreshes.append(None)
+    )
+
+    app._update_playlist_view()
+    app._update_playlist_view()
+    assert len(widget.updates) == 1
+    assert len(table_refreshes) == 2
+    app.playlist.set_index(1)
+    app._update_playlist_view()
+    assert len(widget.updates) == 2
+    app._reset_play_order()
+    app._update_playlist_view()
+    assert len(widget.updates) == 3
+
+
+def test_track_counter_widens_with_playlist_size() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    assert app._render_track_counter() == "0000/0000"
+    app.playlist = Playlist(
+        [Track(path=Path(f"{idx}.mp3"), title=str(idx)) for idx in range(12345)]
+    )
+    app._playing_index = 41
+    assert app._render_track_counter() == "00042/12345"
+    app.playlist = Playlist([Track(path=Path("one.mp3"), title="one")])
+    app._playing_index = 0
+    assert app._render_track_counter() == "0001/0001"
+
+
+def test_playlist_view_skips_hidden_list_and_table(monkeypatch) -> None:
+    from textual.geometry import Region
+
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    widget = _RecordingWidget()
+    widget.region = Region(0, 0, 0, 0)  # type: ignore[attr-defined]
+    app._playlist_list = widget  # type: ignore[assignment]
+    app._playlist_table = SimpleNamespace(  # type: ignore[assignment]
+        display=True, region=Region(0, 0, 0, 0)
+    )
+    app.playlist = Playlist(
+        [Track(path=Path(f"{idx}.mp3"), title=str(idx)) for idx in range(50)]
+    )
+    rendered: list[int] = []
+    table_refreshes: list[None] = []
+    monkeypatch.setattr(
+        app, "_render_playlist_line_text", lambda *a, **k: rendered.append(1)
+    )
+    monkeypatch.setattr(
+        app, "_refresh_playlist_table", lambda: table_refreshes.append(None)
+    )
+
+    app._update_playlist_view()
+    assert rendered == []
+    assert widget.updates == []
+    assert table_refreshes == []
+    app._playlist_table.region = Region(0, 0, 20, 5)  # type: ignore[union-attr]
+    app._update_playlist_view()
+    assert len(table_refreshes) == 1
+
+
+def test_help_bindings_normalized_once() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    bindings = app._help_bindings
+    assert bindings is app._help_bindings
+    assert all(isinstance(binding, tui.Binding) for binding in bindings)
+    assert len(bindings) == len(app.BINDINGS)
+
+
+def test_render_ansi_frame_reuses_parsed_frame(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    calls: list[str] = []
+    original = tui.render_ansi_frame
+
+    def _render(text: str, width: int, height: int):
+        calls.append(text)
+        return original(text, width, height)
+
+    monkeypatch.setattr(tui, "render_ansi_frame", _render)
+    frame = "\x1b[31mAB\x1b[0m\nCD"
+    first = app._render_ansi_frame(frame, 4, 2)
+    assert app._render_ansi_frame(frame, 4, 2) is first
+    assert app._render_ansi_frame(frame, 5, 2) is not first
+    assert len(calls) == 2
+    app._stop_hackscript()
+    app._render_ansi_frame(frame, 4, 2)
+    assert len(calls) == 3
+
+
+def test_stop_hackscript_clears_ansi_flag() -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    assert app._visualizer_min_interval == 1.0 / app.VISUALIZER_MAX_FPS
+    app._viz_ansi_enabled = True
+    app._stop_hackscript()
+    assert app._viz_ansi_enabled is False
+
+
+def test_list_visualizations_rescans_when_package_changes(
+    monkeypatch, tmp_path
+) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    assert tui._path_mtimes((str(tmp_path), str(tmp_path / "missing"))) == (
+        tmp_path.stat().st_mtime,
+        0.0,
+    )
+    tui._discover_visualizations.cache_clear()
+    stamps = iter([(1.0,), (1.0,), (2.0,)])
+    monkeypatch.setattr(tui, "_path_mtimes", lambda paths: next(stamps))
+    names = [app._list_visualizations() for _ in range(3)]
+    assert names[0] == names[1] == names[2]
+    info = tui._discover_visualizations.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_refresh_visualizer_skips_unchanged_static_mode(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    app._visualizer = _RecordingWidget()  # type: ignore[assignment]
+    monkeypatch.setattr(app, "_visualizer_viewport", lambda: (20, 5))
+    monkeypatch.setattr(app, "_visualizer_mode", lambda: "STOPPED")
+    renders: list[str] = []
+    original = app._render_visualizer_mode
+
+    def _render(mode: str, width: int, height: int) -> str:
+        renders.append(mode)
+        return original(mode, width, height)
+
+    monkeypatch.setattr(app, "_render_visualizer_mode", _render)
+    app._refresh_visualizer()
+    app._refresh_visualizer()
+    assert renders == ["STOPPED"]
+    app._refresh_visualizer(force=True)
+    assert renders == ["STOPPED", "STOPPED"]
+
+
+def test_show_frame_parses_ansi_off_the_event_loop(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    widget = _RecordingWidget()
+    app._visualizer = widget  # type: ignore[assignment]
+    app._viz_ansi_enabled = True
+    monkeypatch.setattr(tui.RhythmSlicerApp, "is_running", property(lambda self: True))
+    monkeypatch.setattr(app, "_visualizer_viewport", lambda: (6, 2))
+    monkeypatch.setattr(app, "_visualizer_mode", lambda: "PLAYING")
+    workers: list[object] = []
+    monkeypatch.setattr(app, "run_worker", lambda work, **kwargs: workers.append(work))
+    frame = tui.HackFrame(text="\x1b[31mab\x1b[0m\ncd", hold_ms=0)
+
+    app._show_frame(frame)
+    app._show_frame(frame)
+    assert len(workers) == 1
+    assert widget.updates == []
+
+    asyncio.run(workers.pop())  # type: ignore[arg-type]
+    assert [update.plain for update in widget.updates] == ["ab    \ncd    "]
+    assert app._ansi_render_pending is False
+
+    app._last_visualizer_update = 0.0
+    stale = tui.HackFrame(text="zz", hold_ms=0)
+    app._show_frame(stale)
+    app._viz_request_id += 1
+    asyncio.run(workers.pop())  # type: ignore[arg-type]
+    assert len(widget.updates) == 1
+
+
+def test_start_hackscript_shares_prefs_without_mutating_previous(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    seen: list[dict[str, object]] = []
+
+    def _generate(track_path, viewport, prefs, viz_name="hackscope"):
+        seen.append(prefs)
+        return iter(())
+
+    monkeypatch.setattr(tui, "generate_hackscript", _generate)
+    app._start_hackscript(Path("one.mp3"), playback_pos_ms=100)
+    app._start_hackscript(Path("two.mp3"), playback_pos_ms=200)
+    assert seen[1] is app._viz_prefs
+    assert seen[0] is not seen[1]
+    assert seen[0]["playback_pos_ms"] == 100
+
+
+def test_refresh_visualizer_coalesces_until_flush(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    app._visualizer = _RecordingWidget()  # type: ignore[assignment]
+    monkeypatch.setattr(tui.RhythmSlicerApp, "is_running", property(lambda self: True))
+    monkeypatch.setattr(app, "set_timer", lambda delay, callback: object())
+    calls: list[bool] = []
+    monkeypatch.setattr(
+        app, "_refresh_visualizer_now", lambda *, force=False: calls.append(force)
+    )
+    app._refresh_visualizer()
+    app._refresh_visualizer(force=True)
+    app._refresh_visualizer()
+    assert calls == []
+    app._flush_refreshes()
+    assert calls == [True]
+    app._refresh_visualizer()
+    app._flush_refreshes()
+    assert calls == [True, False]
+
+
+def test_playlist_table_resize_applies_pending_playing_row(monkeypatch) -> None:
+    app = tui.RhythmSlicerApp(player=DummyPlayer(), path="song.mp3")
+    calls: list[str] = []
+    manager = app._playlist_table_manager
+    monkeypatch.setattr(
+        manager, "_apply_pending_playing_row", lambda: calls.append("pending")
+    )
+    app._on_playlist_table_resize()
+    assert calls == ["pending"]
+    assert "playing_row" not in app._ui_dirty
@@ -3,9 +3,11 @@ from __future__ import annotations
 import pytest
 
 from rhythm_slicer.ui.tui_formatters import (
+    _bar_phases,
     _display_state,
     _format_time_ms,
     ellipsize,
+    ellipsize_cached,
     format_status_time,
     playback_state_label,
     ratio_from_click,
@@ -121,6 +123,14 @@ def test_visualizer_bars_deterministic() -> None:
     assert visualizer_bars(seed_ms=1000, width=4, height=3) == [2, 2, 0, 0]
 
 
+def test_visualizer_bars_reuses_column_phases() -> None:
+    _bar_phases.cache_clear()
+    first = visualizer_bars(seed_ms=1000, width=6, height=5)
+    second = visualizer_bars(seed_ms=2000, width=6, height=5)
+    assert len(first) == len(second) == 6
+    assert _bar_phases.cache_info().hits == 1
+
+
 def test_render_visualizer_empty_or_zero() -> None:
     assert render_visualizer([], height=3) == ""
     assert render_visualizer([1, 2], height=0) == ""
@@ -158,3 +168,32 @@ def test_ratio_from_click_clamped() -> None:
 def test_target_ms_from_ratio_clamped() -> None:
     assert target_ms_from_ratio(1000, -1.0) == 0
     assert target_ms_from_ratio(1000, 2.0) == 1000
+
+
+def test_render_status_bar_reuses_cached_string() -> None:
+    first = render_status_bar(10, 0.5)
+    assert render_status_bar(10, 0.52) is first
+
+
+def test_format_status_time_reuses_text_within_same_second() -> None:
+    first, _ = format_status_time(
+        loading=False, get_position_ms=lambda: 61_000, get_length_ms=lambda: 120_000
+    )
+    second, _ = format_status_time(
+        loading=False, get_position_ms=lambda: 61_900, get_length_ms=lambda: 120_400
+    )
+    assert first == "01:01 / 02:00"
+    assert second is first
+
+
+def test_render_status_bar_wider_than_template() -> None:
+    bar = render_status_bar(300, 0.5)
+    assert len(bar) == 300
+    assert bar == "[" + "=" * 149 + "-" * 149 + "]"
+
+
+def test_ellipsize_cached_matches_ellipsize() -> None:
+    ellipsize_cached.cache_clear()
+    assert ellipsize_cached("Long title", 6) == ellipsize("Long title", 6)
+    assert ellipsize_cached("Long title", 6) == "Lon..."
+    assert ellipsize_cached.cache_info().hits == 1
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from rich.text import Text
+from textual.widgets.data_table import Column, ColumnKey
+
+from rhythm_slicer.ui.tui_widgets import PlaylistTable
+
+
+def _table(*keys: str) -> PlaylistTable:
+    table = PlaylistTable()
+    for key in keys:
+        table.columns[ColumnKey(key)] = Column(ColumnKey(key), Text(key), width=5)
+    table._require_update_dimensions = False
+    return table
+
+
+def _widths(table: PlaylistTable) -> list[int]:
+    return [column.width for column in table.columns.values()]
+
+
+def test_set_column_widths_resizes_in_place() -> None:
+    table = _table("title", "artist")
+    assert table.set_column_widths({"title": 10, "artist": 7}) is True
+    assert _widths(table) == [10, 7]
+    assert table._require_update_dimensions is True
+
+
+def test_set_column_widths_missing_column_leaves_table_untouched() -> None:
+    table = _table("title", "artist")
+    assert table.set_column_widths({"title": 10, "album": 7}) is False
+    assert _widths(table) == [5, 5]
+    assert table._require_update_dimensions is False
+
+
+def test_set_column_widths_without_dimension_flag_falls_back() -> None:
+    table = _table("title")
+    del table._require_update_dimensions
+    assert table.set_column_widths({"title": 10}) is False
+    assert _widths(table) == [5]
@@ -3,7 +3,10 @@ from pathlib import Path
 from rhythm_slicer.metadata import TrackMeta
 from rhythm_slicer.playlist import Playlist, Track
 from rhythm_slicer.ui.visualizer_rendering import (
+    _blank_line,
+    _parse_ansi_line,
     center_visualizer_message,
+    clear_ansi_line_cache,
     clip_frame_text,
     render_ansi_frame,
     render_visualizer_hud,
@@ -365,6 +368,15 @@ def test_render_ansi_frame_padding_and_truncation() -> None:
     assert render_ansi_frame("ABCDE", 3, 1).plain == "ABC"
 
 
+def test_render_ansi_frame_does_not_mutate_cached_lines() -> None:
+    clear_ansi_line_cache()
+    line = "\x1b[32mGREEN\x1b[0m"
+    assert render_ansi_frame(line, 3, 1).plain == "GRE"
+    assert render_ansi_frame(line, 7, 1).plain == "GREEN  "
+    assert render_ansi_frame(line, 5, 1).plain == "GREEN"
+    assert _parse_ansi_line(line).plain == "GREEN"
+
+
 def test_tiny_visualizer_text_width_zero() -> None:
     assert tiny_visualizer_text(0, 2) == "\n"
 
@@ -373,6 +385,27 @@ def test_clip_frame_text_clips_to_height() -> None:
     assert clip_frame_text("abcd\nefgh", 3, 1) == "abc"
 
 
+def test_clip_frame_text_handles_crlf_and_blank_lines() -> None:
+    assert clip_frame_text("ab\r\n\ncd\n", 2, 4) == "ab\n  \ncd\n  "
+
+
+def test_render_ansi_frame_plain_ascii_skips_parsing() -> None:
+    clear_ansi_line_cache()
+    rendered = render_ansi_frame("abcdef\nxy", 4, 3)
+    assert rendered.plain == "abcd\nxy  \n    "
+    assert _parse_ansi_line.cache_info().currsize == 0
+
+
+def test_render_ansi_frame_ignores_lines_past_height() -> None:
+    rendered = render_ansi_frame("ab\r\n\x1b[31mcd\x1b[0m\nef\ngh", 3, 2)
+    assert rendered.plain == "ab \ncd "
+
+
+def test_blank_line_is_cached_per_width() -> None:
+    assert _blank_line(4) == "    "
+    assert _blank_line(4) is _blank_line(4)
+
+
 def test_render_visualizer_hud_invalid_size() -> None:
     output = render_visualizer_hud(
         width=0,
@@ -440,3 +473,22 @@ def test_render_visualizer_hud_ensure_meta_loaded() -> None:
     assert track.path.name in output.plain
     assert "Unknown" in output.plain
     assert ensured == [track.path]
+
+
+def test_render_visualizer_hud_pads_wide_values_by_cell_width() -> None:
+    track = Track(path=Path("song.mp3"), title="fallback")
+    playlist = Playlist([track])
+    meta = TrackMeta(artist="日本", title="Title", album="Album")
+
+    output = render_visualizer_hud(
+        width=14,
+        height=3,
+        playlist=playlist,
+        playing_index=0,
+        get_meta_cached=lambda path: meta,
+        ensure_meta_loaded=lambda path: None,
+        ellipsize_fn=lambda text, max_len: text[:max_len],
+    )
+    lines = output.split("\n")
+    assert [line.cell_len for line in lines] == [14, 14, 14]
+    assert lines[1].plain == "ARTIST: 日本  "